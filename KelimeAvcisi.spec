@@ -1,34 +1,40 @@
 # -*- mode: python ; coding: utf-8 -*-
+# One-dir build (dist/KelimeAvcisi/), the same as `python build_installer.py`.
+# Data files are staged by build_installer.stage(): compiled sozluk.bin, re-encoded sounds.
+import os
+import sys
 
+sys.path.insert(0, SPECPATH)
+from build_installer import DATA_DIRS, EXCLUDES, NAME, stage
+
+datas = [(path, '.') for path in stage()]
+datas += [(folder, folder) for folder in DATA_DIRS if os.path.isdir(os.path.join(SPECPATH, folder))]
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('sozluk.json', '.'), ('config.json', '.'), ('highscores.json', '.'), ('button-pressed-38129.mp3', '.'), ('click-buttons-ui-menu-sounds-effects-button-7-203601.mp3', '.'), ('mech-keyboard-02-102918.mp3', '.'), ('benz', 'benz'), ('assets', 'assets')],
+    datas=datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=EXCLUDES,
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='KelimeAvcisi',
+    [('O', None, 'OPTION'), ('O', None, 'OPTION')],
+    exclude_binaries=True,
+    name=NAME,
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -37,3 +43,12 @@ exe = EXE(
     entitlements_file=None,
     icon=['app_icon.ico'],
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name=NAME,
+)
@@ -0,0 +1,206 @@
+"""Sound effects on one long-lived worker thread.
+
+``play_game_sound`` used to start a new thread per effect, read the volume
+from the config on every play, and on Windows without pygame fall back to
+opening, playing (with ``wait``) and closing a temporary MCI alias each time.
+Rapid clicks or answers could pile up as many threads as presses.
+
+``AudioEngine`` owns a single daemon thread. It initialises the backend and
+decodes every sound into memory once, off the UI thread, and then serves
+``play`` commands from a small bounded queue. ``play`` never blocks: when the
+queue is full the request is dropped, because a click sound that arrives a
+second late is worse than none. Playback uses a fixed pool of channels. When
+all of them are busy, the channel that started longest ago is stolen.
+Volumes and the on/off switch are cached here and changed with
+``configure``, so a play does not touch the config.
+
+Backends: pygame's mixer when available (imported by the worker, not at
+startup); otherwise MCI on Windows, with each sound opened once per channel
+as its own alias. Elsewhere, sounds are silently ignored.
+"""
+import os
+import queue
+import threading
+import time
+
+_QUIT = object()
+
+
+def short_path(long_name):
+    """8.3 path of ``long_name`` on Windows (MCI chokes on spaces and non-ASCII)."""
+    if os.name != 'nt':
+        return long_name
+    try:
+        import ctypes
+        size = 0
+        while True:
+            buf = ctypes.create_unicode_buffer(size)
+            needed = ctypes.windll.kernel32.GetShortPathNameW(long_name, buf, size)
+            if size >= needed:
+                return buf.value or long_name
+            size = needed
+    except Exception:
+        return long_name
+
+
+class _PygameBackend:
+    def __init__(self, files, channels):
+        import pygame  # Here, on the worker thread: pygame is slow to import
+        pygame.mixer.init()
+        pygame.mixer.set_num_channels(channels)
+        self.sounds = {key: pygame.mixer.Sound(path) for key, path in files.items()}
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+
+    def is_busy(self, voice):
+        return self.channels[voice].get_busy()
+
+    def play(self, voice, key, volume):
+        channel = self.channels[voice]
+        channel.set_volume(volume)
+        channel.play(self.sounds[key])  # Replaces whatever the channel was playing
+
+    def close(self):
+        import pygame
+        pygame.mixer.quit()
+
+
+class _MciBackend:
+    def __init__(self, files, channels):
+        import ctypes
+        self.mci = ctypes.windll.winmm.mciSendStringW
+        self.keys = set()
+        self.volumes = {}  # alias -> last volume sent, so setaudio is only issued on change
+        for key, path in files.items():
+            path = short_path(path)
+            for voice in range(channels):
+                alias = self._alias(voice, key)
+                self.mci(f'close {alias}', None, 0, 0)
+                if self.mci(f'open "{path}" alias {alias}', None, 0, 0) == 0:
+                    self.keys.add(key)
+        self.playing = [None] * channels  # alias last started on each voice
+
+    @staticmethod
+    def _alias(voice, key):
+        return f"game_{key}_{voice}"
+
+    def is_busy(self, voice):
+        alias = self.playing[voice]
+        if alias is None:
+            return False
+        import ctypes
+        buf = ctypes.create_unicode_buffer(32)
+        self.mci(f"status {alias} mode", buf, 32, 0)
+        return buf.value == "playing"
+
+    def play(self, voice, key, volume):
+        if key not in self.keys:
+            return
+        previous = self.playing[voice]
+        if previous is not None:
+            self.mci(f"stop {previous}", None, 0, 0)
+        alias = self._alias(voice, key)
+        level = int(volume * 1000)
+        if self.volumes.get(alias) != level:
+            self.mci(f"setaudio {alias} volume to {level}", None, 0, 0)
+            self.volumes[alias] = level
+        self.mci(f"play {alias} from 0", None, 0, 0)
+        self.playing[voice] = alias
+
+    def close(self):
+        self.mci("close all", None, 0, 0)
+
+
+class AudioEngine:
+    """Plays ``files`` ({name: path}) by name once ``start`` has been called; see the module docstring."""
+
+    def __init__(self, files, volumes=None, enabled=True, channels=4, queue_size=8):
+        self.files = {k: p for k, p in files.items() if os.path.exists(p)}
+        self.volumes = dict(volumes or {})
+        self.enabled = enabled
+        self.channel_count = max(1, channels)
+        self.backend = None
+        self.dropped = 0  # plays refused because the queue was full (for benchmarks)
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._started = [0.0] * self.channel_count  # when each voice last started
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Starts the worker (loads the sounds in the background); safe to call twice."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def configure(self, enabled=None, volumes=None):
+        """Applies changed sound settings without a restart."""
+        if volumes:
+            self.volumes = {**self.volumes, **volumes}
+        if enabled is not None:
+            self.enabled = enabled
+            if enabled:
+                self.start()
+
+    def play(self, key):
+        """Queues ``key`` for playback; returns at once and never grows the queue past its bound."""
+        if not self.enabled or self._thread is None:
+            return
+        try:
+            self._queue.put_nowait(key)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self, timeout=1.0):
+        if self._thread is None:
+            return
+        while True:  # Make room for the quit command; pending sounds no longer matter
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            self._queue.put(_QUIT, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _open_backend(self):
+        try:
+            return _PygameBackend(self.files, self.channel_count)
+        except ImportError:
+            pass
+        except Exception as e:
+            print(f"[AUDIO] pygame mixer unavailable: {e}")
+        if os.name == 'nt':
+            try:
+                return _MciBackend(self.files, self.channel_count)
+            except Exception as e:
+                print(f"[AUDIO] MCI unavailable: {e}")
+        return None
+
+    def _pick_voice(self):
+        for voice in range(self.channel_count):
+            if not self.backend.is_busy(voice):
+                return voice
+        # All busy: steal the one that has been playing longest
+        return min(range(self.channel_count), key=self._started.__getitem__)
+
+    def _run(self):
+        self.backend = self._open_backend()
+        while True:
+            key = self._queue.get()
+            if key is _QUIT:
+                break
+            if self.backend is None or not self.enabled or key not in self.files:
+                continue
+            try:
+                voice = self._pick_voice()
+                self._started[voice] = time.monotonic()
+                self.backend.play(voice, key, self.volumes.get(key, 1.0))
+            except Exception as e:
+                print(f"[AUDIO] Could not play {key}: {e}")
+        if self.backend is not None:
+            try:
+                self.backend.close()
+            except Exception:
+                pass
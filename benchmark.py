@@ -0,0 +1,835 @@
+"""Performance benchmarks for Kelime Avcısı.
+
+Usage:
+    python benchmark.py dictionary [--scale 100]
+    python benchmark.py sampler [--sizes 10000 1000000]
+    python benchmark.py index [--words 500000]
+    python benchmark.py fuzzy
+    python benchmark.py difficulty [--sizes 10000 1000000]
+    python benchmark.py retention [--scores 100000]
+    python benchmark.py timer [--seconds 10] [--busy-ms 250]
+    python benchmark.py audio [--presses 2000]
+    python benchmark.py navigation [--rounds 20]   (needs a display)
+    python benchmark.py buttons [--cycles 20]      (needs a display)
+    python benchmark.py startup [--runs 5] [--exe dist/KelimeAvcisi/KelimeAvcisi.exe]
+                                [--save-baseline] [--tolerance 0.15]
+                                                   (starts Xvfb on Linux when there is no display)
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOZLUK_PATH = os.path.join(BASE_DIR, "sozluk.json")
+STARTUP_BASELINE = os.path.join(BASE_DIR, "startup_baseline.json")
+
+
+def _make_scaled_dictionary(path, scale):
+    """Writes a sozluk.json copy with every level repeated ``scale`` times."""
+    with open(SOZLUK_PATH, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    scaled = {}
+    for key, words in data.items():
+        out = []
+        for i in range(scale):
+            for w in words:
+                out.append({"kelime": w["kelime"], "tanim": f"{w['tanim']} ({i})", "harf": w.get("harf")})
+        scaled[key] = out
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(scaled, f, ensure_ascii=False, indent=4)
+    return sum(len(v) for v in scaled.values())
+
+
+# Runs in a fresh interpreter so every measurement is a cold start
+_LOAD_PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {base!r})
+mode, path = {mode!r}, {path!r}
+if mode == "json":
+    with open(path, "r", encoding="utf-8") as f:
+        d = json.load(f)
+else:
+    from dictionary_store import CompiledDictionary
+    d = CompiledDictionary(path)
+t_open = time.perf_counter() - t0
+first = d.get("4_harf", [])
+t_first = time.perf_counter() - t0
+rss_kb = -1
+try:
+    # VmHWM is reset on exec, unlike ru_maxrss which inherits the parent's peak
+    with open("/proc/self/status") as f:
+        rss_kb = next(int(l.split()[1]) for l in f if l.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        rss_kb = rss // 1024 if sys.platform == "darwin" else rss
+    except ImportError:
+        pass
+print(json.dumps({{"open": t_open, "first_level": t_first, "rss_kb": rss_kb, "words": len(first)}}))
+"""
+
+
+def _probe(mode, path):
+    code = _LOAD_PROBE.format(base=BASE_DIR, mode=mode, path=path)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def bench_dictionary(args):
+    from dictionary_store import compile_dictionary
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "sozluk.json")
+        bin_path = os.path.join(tmp, "sozluk.bin")
+        total = _make_scaled_dictionary(json_path, args.scale)
+
+        t0 = time.perf_counter()
+        compile_dictionary(json_path, bin_path)
+        compile_time = time.perf_counter() - t0
+
+        print(f"Words: {total:,} (x{args.scale})")
+        print(f"sozluk.json: {os.path.getsize(json_path) / 1024:,.0f} KB, "
+              f"sozluk.bin: {os.path.getsize(bin_path) / 1024:,.0f} KB, compile: {compile_time:.2f}s")
+        print(f"{'format':<8}{'open (ms)':>12}{'first level (ms)':>18}{'peak RSS (MB)':>16}")
+        for mode, path in (("json", json_path), ("bin", bin_path)):
+            runs = [_probe(mode, path) for _ in range(args.repeat)]
+            best = min(runs, key=lambda r: r["first_level"])
+            rss = f"{best['rss_kb'] / 1024:.1f}" if best["rss_kb"] >= 0 else "n/a"
+            print(f"{mode:<8}{best['open'] * 1000:>12.1f}{best['first_level'] * 1000:>18.1f}{rss:>16}")
+
+
+def bench_sampler(args):
+    import random
+    from word_sampler import WordSampler
+
+    print(f"{'words/level':>12}{'list rebuild (us/q)':>22}{'deck draw (us/q)':>20}{'speed-up':>10}")
+    for size in args.sizes:
+        words = [{"kelime": f"K{i:07d}", "tanim": "-"} for i in range(size)]
+
+        # Previous approach: filter the whole level on every question
+        used = set()
+        questions = max(5, min(200, 2_000_000 // size))
+        t0 = time.perf_counter()
+        for _ in range(questions):
+            available = [w for w in words if w.get("kelime") not in used]
+            used.add(random.choice(available)["kelime"])
+        old_us = (time.perf_counter() - t0) / questions * 1e6
+
+        sampler = WordSampler()
+        sampler.draw("bench", words)  # Deck construction is a one-off per level
+        draws = 100_000
+        t0 = time.perf_counter()
+        for _ in range(draws):
+            sampler.draw("bench", words)
+        new_us = (time.perf_counter() - t0) / draws * 1e6
+
+        print(f"{size:>12,}{old_us:>22,.1f}{new_us:>20,.2f}{old_us / new_us:>9,.0f}x")
+
+
+def bench_index(args):
+    import random
+    from dictionary_store import WordEntry
+    from word_index import LevelIndex
+
+    rng = random.Random(1)
+    letters = "ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ"
+    # Synthetic 7-letter level: worst case, the whole lexicon in one level
+    entries = [WordEntry("".join(rng.choice(letters) for _ in range(7)), "-") for _ in range(args.words)]
+
+    t0 = time.perf_counter()
+    index = LevelIndex(entries)
+    build = time.perf_counter() - t0
+    print(f"Words: {len(index):,}, index build: {build:.2f}s")
+
+    samples = [rng.choice(entries) for _ in range(2000)]
+    # Every prefix a player types on the way to the full word, plus misses
+    prefixes = [e.folded[:n] for e in samples for n in range(1, e.length + 1)]
+    prefixes += ["".join(rng.choice(letters) for _ in range(5)) for _ in range(len(prefixes) // 4)]
+
+    def timed(label, fn, items):
+        t0 = time.perf_counter()
+        for item in items:
+            fn(item)
+        us = (time.perf_counter() - t0) / len(items) * 1e6
+        print(f"{label:<28}{us:>10.2f} us/op")
+
+    timed("prefix check (keystroke)", index.has_prefix, prefixes)
+    timed("exact word lookup", lambda e: index.is_word(e.folded), samples)
+    timed("anagram lookup", index.anagrams, samples)
+    timed("scramble", lambda e: index.scramble(e, rng), samples)
+    timed("alternate answer check", lambda e: index.fits_pattern(e.folded, ["_"] * e.length), samples)
+
+
+def bench_fuzzy(args):
+    import random
+    from fuzzy_match import FuzzyMatcher
+
+    def levenshtein(a, b):
+        # Plain O(n*m) dynamic programme for comparison
+        row = list(range(len(b) + 1))
+        for i, ca in enumerate(a, 1):
+            prev, row[0] = row[:], i
+            for j, cb in enumerate(b, 1):
+                row[j] = min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + (ca != cb))
+        return row[-1]
+
+    rng = random.Random(1)
+    letters = "ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ"
+    print(f"{'length':>7}{'full DP (us)':>14}{'bit-parallel (us)':>19}{'bounded k=1 (us)':>18}")
+    for length in (4, 7, 10, 16):
+        target = "".join(rng.choice(letters) for _ in range(length))
+        # Answers as typed: every prefix plus near misses and unrelated words
+        typed = [target[:n] for n in range(1, length + 1)]
+        typed += ["".join(rng.choice(letters) for _ in range(length)) for _ in range(length)]
+        typed = typed * max(1, 20000 // len(typed))
+        matcher = FuzzyMatcher(target)
+
+        results = []
+        for fn in (lambda t: levenshtein(target, t), matcher.distance, lambda t: matcher.distance(t, 1)):
+            t0 = time.perf_counter()
+            for t in typed:
+                fn(t)
+            results.append((time.perf_counter() - t0) / len(typed) * 1e6)
+        print(f"{length:>7}{results[0]:>14.2f}{results[1]:>19.2f}{results[2]:>18.2f}")
+
+
+def bench_difficulty(args):
+    import math
+    import random
+    from dictionary_store import WordEntry
+    from difficulty import AdaptiveSelector
+
+    rng = random.Random(1)
+    print(f"{'words/level':>12}{'index build (s)':>17}{'band scan (us)':>16}{'adaptive (us)':>15}")
+    for size in args.sizes:
+        entries = [WordEntry(f"K{i:07d}", "-", rng.random()) for i in range(size)]
+        selector = AdaptiveSelector({"bench": entries}, rng=random.Random(2))
+
+        t0 = time.perf_counter()
+        selector.index("bench")
+        build = time.perf_counter() - t0
+
+        # Linear alternative: filter the bucket for the band on every question
+        scans = max(3, min(200, 2_000_000 // size))
+        t0 = time.perf_counter()
+        for _ in range(scans):
+            band = [e for e in entries if abs(e.difficulty - 0.5) <= 0.1]
+            rng.choice(band)
+        scan_us = (time.perf_counter() - t0) / scans * 1e6
+
+        draws = 100_000
+        t0 = time.perf_counter()
+        for _ in range(draws):
+            selector.draw("bench")
+        draw_us = (time.perf_counter() - t0) / draws * 1e6
+        print(f"{size:>12,}{build:>17.2f}{scan_us:>16,.1f}{draw_us:>15.2f}")
+
+    # Simulated players: the target should settle near each player's skill
+    entries = [WordEntry(f"K{i:07d}", "-", rng.random()) for i in range(50_000)]
+    print(f"\n{'player skill':>12}{'settled target':>16}{'solve rate':>12}")
+    for skill in (0.2, 0.5, 0.8):
+        selector = AdaptiveSelector({"bench": entries}, rng=random.Random(3))
+        solved_count, rounds, targets = 0, 2000, []
+        for n in range(rounds):
+            entry = selector.draw("bench")
+            solved = rng.random() < 1 / (1 + math.exp((entry.difficulty - skill) * 12))
+            solved_count += solved
+            selector.record(entry, solved, rng.uniform(0.2, 0.6) if solved else 1.0)
+            if n >= rounds // 2:
+                targets.append(selector.target)
+        print(f"{skill:>12.1f}{sum(targets) / len(targets):>16.2f}{solved_count / rounds:>12.0%}")
+
+
+def bench_retention(args):
+    import random
+    from score_retention import PERIODS, DEFAULT_LIMITS, Retention, period_starts, top_k
+
+    rng = random.Random(1)
+    now = time.time()
+    scores = [{"name": f"P{rng.randrange(500)}", "score": rng.randrange(5000),
+               "timestamp": now - rng.uniform(0, 400 * 86400)} for _ in range(args.scores)]
+    starts = period_starts()
+    windows = {p: (starts[p], DEFAULT_LIMITS[p]) for p in PERIODS}
+
+    # Previous cleanup_scores: filter and fully sort each period, then a key set
+    def sort_based():
+        keep = set()
+        for p in PERIODS:
+            since, limit = windows[p]
+            period = sorted((s for s in scores if s["timestamp"] >= since),
+                            key=lambda x: (-x["score"], x["timestamp"]))
+            keep.update((s["name"], s["score"], s["timestamp"]) for s in period[:limit])
+        return keep
+
+    repeat = 5
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        old = sort_based()
+    sort_ms = (time.perf_counter() - t0) / repeat * 1000
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        tops = top_k(scores, windows)
+    heap_ms = (time.perf_counter() - t0) / repeat * 1000
+    new = {(s["name"], s["score"], s["timestamp"]) for top in tops.values() for s in top}
+    assert new == old, "top_k disagrees with the sort-based cleanup"
+
+    # Incremental: one save against already-retained lists
+    retention = Retention()
+    retention.rebuild(scores)
+    inserts = 100_000
+    fresh = [{"name": "P0", "score": rng.randrange(5000), "timestamp": now + i} for i in range(inserts)]
+    t0 = time.perf_counter()
+    for s in fresh:
+        retention.offer(s)
+    offer_us = (time.perf_counter() - t0) / inserts * 1e6
+
+    print(f"{args.scores:,} scores, limits {DEFAULT_LIMITS}")
+    print(f"{'four sorts + key set':<28}{sort_ms:>10.1f} ms")
+    print(f"{'single pass, bounded heaps':<28}{heap_ms:>10.1f} ms")
+    print(f"{'incremental per save':<28}{offer_us:>10.2f} us")
+
+
+class _BusyLoop:
+    """Minimal stand-in for Tk's after()/after_cancel() loop, with injected stalls.
+
+    Every ``period_ms`` a callback blocks the loop for up to ``busy_ms`` (like a
+    synchronous network call on the UI thread), so timers fire late.
+    """
+
+    def __init__(self, busy_ms, period_ms, seed=1):
+        import heapq
+        import random
+        self._heapq = heapq
+        self.rng = random.Random(seed)
+        self.busy_ms, self.period_ms = busy_ms, period_ms
+        self.jobs = []
+        self.cancelled = set()
+        self.seq = 0
+        self.done = False
+        if busy_ms > 0:
+            self.after(period_ms, self._stall)
+
+    def after(self, ms, fn):
+        self.seq += 1
+        self._heapq.heappush(self.jobs, (time.monotonic() + ms / 1000, self.seq, fn))
+        return self.seq
+
+    def after_cancel(self, job):
+        self.cancelled.add(job)
+
+    def _stall(self):
+        end = time.monotonic() + self.rng.uniform(0, self.busy_ms) / 1000
+        while time.monotonic() < end:
+            pass
+        self.after(self.rng.uniform(0, self.period_ms), self._stall)
+
+    def run(self):
+        while not self.done and self.jobs:
+            due, seq, fn = self._heapq.heappop(self.jobs)
+            if seq in self.cancelled:
+                continue
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            fn()
+
+
+def bench_timer(args):
+    from game_timer import Countdown
+
+    def run(kind):
+        loop = _BusyLoop(args.busy_ms, args.period_ms)
+        lateness = []  # per displayed second: how long after it actually began it was shown
+        t0 = time.monotonic()
+        result = {}
+
+        def check(shown):
+            lateness.append(time.monotonic() - t0 - (args.seconds - shown))
+
+        def expire():
+            result["expired_after"] = time.monotonic() - t0
+            loop.done = True
+
+        if kind == "decrement":
+            # Previous update_timer: one second per after(1000) callback
+            state = {"left": args.seconds}
+
+            def tick():
+                check(state["left"])
+                if state["left"] > 0:
+                    state["left"] -= 1
+                    loop.after(1000, tick)
+                else:
+                    expire()
+            tick()
+        else:
+            Countdown(loop.after, loop.after_cancel, check, expire).start(args.seconds)
+        loop.run()
+        result["max_late"] = max(lateness)
+        result["mean_late"] = sum(lateness) / len(lateness)
+        return result
+
+    print(f"{args.seconds}s countdown, loop stalled up to {args.busy_ms} ms every ~{args.period_ms} ms")
+    print(f"{'timer':<14}{'timeout at':>12}{'late by':>10}{'tick late avg':>16}{'max':>10}")
+    results = {}
+    for kind in ("decrement", "monotonic"):
+        r = results[kind] = run(kind)
+        late = r["expired_after"] - args.seconds
+        print(f"{kind:<14}{r['expired_after']:>11.2f}s{late * 1000:>8.0f}ms"
+              f"{r['mean_late'] * 1000:>14.0f}ms{r['max_late'] * 1000:>8.0f}ms")
+    # A deadline timer can only be late by the stall it was waiting behind, never by the sum of them
+    late_ms = results["monotonic"]["max_late"] * 1000
+    assert late_ms <= args.busy_ms + 50, f"monotonic countdown fell {late_ms:.0f} ms behind"
+
+
+def bench_audio(args):
+    from audio_engine import AudioEngine
+
+    play_ms = args.play_ms
+
+    class SlowBackend:
+        """Stands in for the mixer: each play blocks its caller for ``play_ms``."""
+        def __init__(self, channels):
+            self.busy_until = [0.0] * channels
+            self.plays = 0
+
+        def is_busy(self, voice):
+            return time.monotonic() < self.busy_until[voice]
+
+        def play(self, voice, key, volume):
+            time.sleep(play_ms / 1000)
+            self.busy_until[voice] = time.monotonic() + 0.3  # a short click
+            self.plays += 1
+
+        def close(self):
+            pass
+
+    base_threads = threading.active_count()
+
+    # Previous play_game_sound: one thread per sound
+    peak = 0
+    t0 = time.perf_counter()
+    for _ in range(args.presses):
+        threading.Thread(target=time.sleep, args=(play_ms / 1000,), daemon=True).start()
+        peak = max(peak, threading.active_count() - base_threads)
+    spawn_us = (time.perf_counter() - t0) / args.presses * 1e6
+    while threading.active_count() > base_threads:
+        time.sleep(0.01)
+
+    class BenchEngine(AudioEngine):
+        def _open_backend(self):
+            return SlowBackend(self.channel_count)
+
+    files = {"next": SOZLUK_PATH}  # any existing file; the backend never reads it
+    engine = BenchEngine(files, channels=4)
+    engine.start()
+    while engine.backend is None:
+        time.sleep(0.001)
+    t0 = time.perf_counter()
+    for _ in range(args.presses):
+        engine.play("next")
+    queue_us = (time.perf_counter() - t0) / args.presses * 1e6
+    engine_threads = threading.active_count() - base_threads
+    while not engine._queue.empty():  # Let the worker finish what was accepted
+        time.sleep(0.01)
+    engine.shutdown()
+
+    print(f"{args.presses:,} sound requests as fast as possible, {play_ms} ms per play")
+    print(f"{'thread per sound':<22}{spawn_us:>8.1f} us/press  {peak:>5} threads at peak")
+    print(f"{'single audio worker':<22}{queue_us:>8.1f} us/press  {engine_threads:>5} threads, "
+          f"{engine.backend.plays} played, {engine.dropped} dropped (queue bound {engine._queue.maxsize})")
+
+
+def bench_navigation(args):
+    import statistics
+    import tkinter as tk
+    import main as game
+
+    root = tk.Tk()
+    app = game.WordGameApp(root)
+    app.current_user = {"id": 0, "username": "BENCH"}
+    app.username = "BENCH"
+    route = [
+        ("entry", app.show_entry_screen),
+        ("leaderboard", lambda: app.show_leaderboard(source="entry")),
+        ("profile", app.show_profile_screen),
+    ]
+    budget = app.screens.budget
+
+    def walk():
+        times = {name: [] for name, _ in route}
+        for _ in range(args.rounds):
+            for name, show in route:
+                t0 = time.perf_counter()
+                show()
+                root.update()  # Include layout and drawing, not just widget creation
+                times[name].append((time.perf_counter() - t0) * 1000)
+        return times
+
+    print(f"{'screen':<14}{'rebuild p50/p95 (ms)':>24}{'cached p50/p95 (ms)':>24}")
+    app.screens.budget = 0  # Every visit rebuilds, as before screen caching
+    rebuilt = walk()
+    app.screens.budget = budget
+    cached = walk()
+    for name, _ in route:
+        cells = []
+        for times in (rebuilt, cached):
+            ordered = sorted(times[name])
+            cells.append(f"{statistics.median(ordered):.1f} / {ordered[int(len(ordered) * 0.95) - 1]:.1f}")
+        print(f"{name:<14}{cells[0]:>24}{cells[1]:>24}")
+    root.destroy()
+
+
+def bench_buttons(args):
+    import tkinter as tk
+    import main as game
+
+    root = tk.Tk()
+    app = game.WordGameApp(root)
+    app.username = "BENCH"
+
+    def widgets(widget):
+        for child in widget.winfo_children():
+            yield child
+            yield from widgets(child)
+
+    def open_settings():
+        app.screens.invalidate("settings")
+        app.show_settings_menu()
+
+    def open_game():
+        app.reset_game()
+        deadline = time.time() + 30
+        while app.current_screen != "game" and time.time() < deadline:
+            root.update()  # The first level may still be loading
+
+    pillow = app.button_images.available
+    modes = [("canvas primitives", False)] + ([("cached images", True)] if pillow else [])
+    print(f"{'screen':<10}{'mode':<20}{'build (ms)':>12}{'canvas items':>14}{'hover cycle (us)':>18}")
+    for screen, open_screen in (("settings", open_settings), ("game", open_game)):
+        for label, use_images in modes:
+            app.button_images.available = use_images
+            root.update()
+            t0 = time.perf_counter()
+            open_screen()
+            root.update()
+            build_ms = (time.perf_counter() - t0) * 1000
+
+            canvases = [w for w in widgets(app.container) if isinstance(w, tk.Canvas)]
+            buttons = [c for c in canvases if hasattr(c, "set_state")]
+            items = sum(len(c.find_all()) for c in canvases)
+
+            # enter -> press -> release (no command: transitioning blocks it) -> leave
+            app.transitioning = True
+            t0 = time.perf_counter()
+            for _ in range(args.cycles):
+                for b in buttons:
+                    for event in ("<Enter>", "<ButtonPress-1>", "<ButtonRelease-1>", "<Leave>"):
+                        b.event_generate(event)
+            root.update()
+            app.transitioning = False
+            cycle_us = (time.perf_counter() - t0) / max(1, args.cycles * len(buttons)) * 1e6
+            items_after = sum(len(c.find_all()) for c in canvases)
+            print(f"{screen:<10}{label:<20}{build_ms:>12.1f}{f'{items} -> {items_after}':>14}{cycle_us:>18.1f}")
+    if not pillow:
+        print("Pillow is not installed: only the canvas fallback was measured.")
+    print(f"button images rendered: {app.button_images.renders}")
+    root.destroy()
+
+
+class _VirtualDisplay:
+    """Xvfb on a free display number, so the game can start without a screen (Linux)."""
+
+    def __init__(self, screen="1920x1080x24"):
+        self.screen = screen
+        self.proc = None
+        self.display = None
+
+    def __enter__(self):
+        import shutil
+        if not shutil.which("Xvfb"):
+            sys.exit("Xvfb not found: install it (e.g. apt install xvfb) or run with a DISPLAY")
+        read_fd, write_fd = os.pipe()
+        # -displayfd: Xvfb picks a free display and writes its number once it accepts clients
+        self.proc = subprocess.Popen(["Xvfb", "-displayfd", str(write_fd), "-screen", "0", self.screen,
+                                      "-nolisten", "tcp"], pass_fds=(write_fd,),
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            number = f.readline().strip()
+        if not number:
+            self.proc.kill()
+            sys.exit("Xvfb did not start")
+        self.display = f":{number}"
+        return self
+
+    def __exit__(self, *exc):
+        self.proc.terminate()
+        self.proc.wait()
+
+
+def _wait_with_peak_rss(proc, timeout):
+    """Waits for ``proc`` (killing it after ``timeout`` s) and returns its peak RSS in KB, or None."""
+    killer = threading.Timer(timeout, proc.kill)
+    killer.start()
+    try:
+        if hasattr(os, "wait4"):
+            # The rusage of a reaped child includes the peak of its own children
+            # (PyInstaller onefile runs the game in a child of the bootloader)
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+        try:
+            import psutil
+        except ImportError:
+            proc.wait()
+            return None
+        peak = 0
+        parent = psutil.Process(proc.pid)
+        while proc.poll() is None:
+            try:
+                tree = [parent] + parent.children(recursive=True)
+                # Windows reports each process's own peak working set
+                peak = max([peak] + [p.memory_info().peak_wset for p in tree])
+            except (psutil.Error, AttributeError):
+                pass
+            time.sleep(0.05)
+        return peak // 1024 or None
+    finally:
+        killer.cancel()
+
+
+def _startup_env(data_dir, display, online):
+    """Environment for one launch: private user data folder, virtual display, no update checks."""
+    from startup_profile import LOG_ENV
+    env = dict(os.environ)
+    env["APPDATA"] = env["LOCALAPPDATA"] = data_dir  # config.json / scores / profiles
+    env[LOG_ENV] = os.path.join(data_dir, "startup.log")
+    if display:
+        env["DISPLAY"] = display
+    config_dir = os.path.join(data_dir, "KelimeOyunu")
+    os.makedirs(config_dir, exist_ok=True)
+    config_path = os.path.join(config_dir, "config.json")
+    if not online and not os.path.exists(config_path):
+        with open(os.path.join(BASE_DIR, "config.json"), "r", encoding="utf-8") as f:
+            conf = json.load(f)
+        conf.setdefault("update_check", {})["enabled"] = False  # No network in the measurement
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump(conf, f, ensure_ascii=False, indent=2)
+    return env
+
+
+def _launch(cmd, cwd, env, timeout, log_path):
+    """Starts the game once; returns its startup marks as seen from outside and inside."""
+    from startup_profile import parse_line
+    outside, inside = {}, {}
+    open(log_path, "w").close()
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def read():
+        # Follow the mark log (the windowed build has no stdout to pipe)
+        with open(log_path, "r", encoding="utf-8") as f:
+            pending = ""
+            while True:
+                finished = proc.returncode is not None  # Checked before reading: no lost last line
+                chunk = f.readline()
+                if not chunk:
+                    if finished:
+                        break
+                    time.sleep(0.002)
+                    continue
+                pending += chunk
+                if not pending.endswith("\n"):
+                    continue
+                mark = parse_line(pending)
+                pending = ""
+                if mark:
+                    phase, total_ms = mark
+                    outside.setdefault(phase, (time.perf_counter() - t0) * 1000)
+                    inside[phase] = total_ms
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    peak_kb = _wait_with_peak_rss(proc, timeout)
+    reader.join(2)
+    return {"outside": outside, "inside": inside, "peak_rss_kb": peak_kb, "returncode": proc.returncode}
+
+
+def _import_times(cmd, cwd, env, timeout):
+    """Cumulative import time (us) of each module imported directly by the game's entry script."""
+    result = subprocess.run([cmd[0], "-X", "importtime"] + cmd[1:], cwd=cwd, env=env,
+                            capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=timeout)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):  # Indented: imported by another module, counted in its parent
+            continue
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def bench_startup(args):
+    import statistics
+    from startup_profile import EXIT_FLAG, FIRST_FRAME, LOG_ENV, READY
+
+    if args.exe:
+        target = os.path.splitext(os.path.basename(args.exe))[0]
+        cmd, cwd = [os.path.abspath(args.exe)], os.path.dirname(os.path.abspath(args.exe))
+    else:
+        target = "source"
+        cmd, cwd = [sys.executable, os.path.join(BASE_DIR, "main.py")], BASE_DIR
+    cmd += [EXIT_FLAG]  # Marks go to the LOG_ENV file set by _startup_env
+
+    display = None
+    needs_xvfb = sys.platform.startswith("linux") and (args.xvfb or not os.environ.get("DISPLAY"))
+    with tempfile.TemporaryDirectory() as data_dir:
+        xvfb = _VirtualDisplay() if needs_xvfb else None
+        if xvfb:
+            display = xvfb.__enter__().display
+        try:
+            env = _startup_env(data_dir, display, args.online)
+            runs = []
+            for i in range(args.warmup + args.runs):
+                run = _launch(cmd, cwd, env, args.timeout, env[LOG_ENV])
+                if READY not in run["outside"]:
+                    sys.exit(f"run {i + 1}: the game did not finish starting (exit code {run['returncode']})")
+                if i >= args.warmup:  # Warm-up runs fill the OS file cache and migrate the data folder
+                    runs.append(run)
+            imports = _import_times(cmd, cwd, env, args.timeout) if not args.exe else {}
+        finally:
+            if xvfb:
+                xvfb.__exit__(None, None, None)
+
+    metrics = {
+        # Launch -> entry screen drawn (includes interpreter start and any bundle unpacking)
+        "ttff_ms": [r["outside"][FIRST_FRAME] for r in runs],
+        # Launch -> deferred warm-up finished (dictionary, audio, cleanup all done)
+        "tti_ms": [r["outside"][READY] for r in runs],
+        # Launch -> main.py's first line runs
+        "pre_main_ms": [r["outside"][FIRST_FRAME] - r["inside"][FIRST_FRAME] for r in runs],
+    }
+    rss = [r["peak_rss_kb"] for r in runs if r["peak_rss_kb"]]
+    if rss:
+        metrics["peak_rss_kb"] = rss
+    summary = {name: statistics.median(values) for name, values in metrics.items()}
+
+    print(f"{target}: {args.runs} runs (+{args.warmup} warm-up){' on ' + display if display else ''}")
+    print(f"{'metric':<14}{'median':>10}{'min':>10}{'max':>10}")
+    for name, values in metrics.items():
+        print(f"{name:<14}{summary[name]:>10.0f}{min(values):>10.0f}{max(values):>10.0f}")
+    phases = [p for p in runs[0]["inside"]]
+    print("\nin-process phases (median ms since main.py started):")
+    for phase in phases:
+        print(f"  {phase:<22}{statistics.median(r['inside'][phase] for r in runs if phase in r['inside']):>8.1f}")
+    if imports:
+        print("\nslowest imports of main.py (cumulative ms):")
+        for name, us in sorted(imports.items(), key=lambda kv: -kv[1])[:args.top_imports]:
+            print(f"  {name:<22}{us / 1000:>8.1f}")
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+    if args.save_baseline:
+        baselines[target] = {**{k: round(v, 1) for k, v in summary.items()}, "runs": args.runs,
+                             "python": sys.version.split()[0], "platform": sys.platform}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2)
+        print(f"\nbaseline for {target!r} saved to {args.baseline}")
+        return
+
+    base = baselines.get(target)
+    if not base:
+        print(f"\nno baseline for {target!r} in {args.baseline} (create one with --save-baseline)")
+        return
+    print(f"\nagainst baseline (tolerance {args.tolerance:.0%}):")
+    regressions = []
+    for name, value in summary.items():
+        if name not in base:
+            continue
+        change = value / base[name] - 1 if base[name] else 0.0
+        worse = change > args.tolerance
+        print(f"  {name:<14}{base[name]:>10.0f} -> {value:>8.0f}  {change:>+7.1%}{'  REGRESSION' if worse else ''}")
+        if worse:
+            regressions.append(name)
+    if regressions:
+        sys.exit(f"startup regressed: {', '.join(regressions)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kelime Avcısı benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("dictionary", help="Cold start / memory: sozluk.json vs compiled sozluk.bin")
+    p.add_argument("--scale", type=int, default=100, help="Word list multiplier")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_dictionary)
+
+    p = sub.add_parser("sampler", help="Per-question cost: list rebuild vs shuffled deck")
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    p.set_defaults(func=bench_sampler)
+
+    p = sub.add_parser("index", help="Per-keystroke prefix/anagram lookups on a large level")
+    p.add_argument("--words", type=int, default=500_000)
+    p.set_defaults(func=bench_index)
+
+    p = sub.add_parser("fuzzy", help="Per-keystroke cost of the typo-tolerant answer check")
+    p.set_defaults(func=bench_fuzzy)
+
+    p = sub.add_parser("difficulty", help="Adaptive selection cost and convergence on simulated players")
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    p.set_defaults(func=bench_difficulty)
+
+    p = sub.add_parser("retention", help="Score cleanup: per-period sorts vs single-pass top-K heaps")
+    p.add_argument("--scores", type=int, default=100_000)
+    p.set_defaults(func=bench_retention)
+
+    p = sub.add_parser("timer", help="Round countdown accuracy on a stalling event loop: decrement vs monotonic")
+    p.add_argument("--seconds", type=int, default=10)
+    p.add_argument("--busy-ms", type=int, default=250, help="Longest stall of the event loop")
+    p.add_argument("--period-ms", type=int, default=400, help="Average gap between stalls")
+    p.set_defaults(func=bench_timer)
+
+    p = sub.add_parser("audio", help="Sound spam: thread per sound vs one worker with a bounded queue")
+    p.add_argument("--presses", type=int, default=2000)
+    p.add_argument("--play-ms", type=float, default=2.0, help="Simulated time one play call takes")
+    p.set_defaults(func=bench_audio)
+
+    p = sub.add_parser("navigation", help="Entry/leaderboard/profile switch latency: rebuild vs cached screens")
+    p.add_argument("--rounds", type=int, default=20)
+    p.set_defaults(func=bench_navigation)
+
+    p = sub.add_parser("buttons", help="Rounded button build/hover cost and canvas item counts")
+    p.add_argument("--cycles", type=int, default=20)
+    p.set_defaults(func=bench_buttons)
+
+    p = sub.add_parser("startup", help="Launch-to-entry-screen time, warm-up time, peak RSS and imports vs a baseline")
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--warmup", type=int, default=1, help="Unmeasured launches first")
+    p.add_argument("--exe", help="Measure a PyInstaller build instead of python main.py")
+    p.add_argument("--baseline", default=STARTUP_BASELINE)
+    p.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline for the target")
+    p.add_argument("--tolerance", type=float, default=0.15, help="Allowed slowdown before failing (0.15 = 15%%)")
+    p.add_argument("--timeout", type=float, default=60, help="Seconds before a launch is killed")
+    p.add_argument("--online", action="store_true", help="Keep the update checks (off by default for stable numbers)")
+    p.add_argument("--xvfb", action="store_true", help="Use Xvfb even when DISPLAY is set")
+    p.add_argument("--top-imports", type=int, default=15)
+    p.set_defaults(func=bench_startup)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,13 +10,13 @@ set "INNO_SETUP_PATH=C:\Program Files (x86)\Inno Setup 6\ISCC.exe"
 
 :: 1. Temizlik
 echo [1/3] Eski dosyalar temizleniyor...
-if exist "dist\KelimeAvcisi.exe" del "dist\KelimeAvcisi.exe"
+if exist "dist\KelimeAvcisi" rmdir /s /q "dist\KelimeAvcisi"
 if exist "Output\KelimeAvcisiSetup_v1.5.exe" del "Output\KelimeAvcisiSetup_v1.5.exe"
 echo Temizlik tamamlandi.
 echo.
 
 :: 2. EXE Olusturma (PyInstaller)
-echo [2/3] KelimeAvcisi.exe olusturuluyor (PyInstaller)...
+echo [2/3] dist\KelimeAvcisi klasoru olusturuluyor (PyInstaller)...
 python build_installer.py
 if %ERRORLEVEL% NEQ 0 (
     echo HATA: PyInstaller islemi basarisiz oldu!
@@ -50,7 +50,7 @@ echo ========================================================
 echoISLEM BASARIYLA TAMAMLANDI!
 echo.
 echo Olusturulan dosyalar:
-if exist "dist\KelimeAvcisi.exe" echo - EXE: dist\KelimeAvcisi.exe
+if exist "dist\KelimeAvcisi\KelimeAvcisi.exe" echo - EXE: dist\KelimeAvcisi\KelimeAvcisi.exe
 if exist "Output\KelimeAvcisiSetup_v1.5.exe" echo - SETUP: Output\KelimeAvcisiSetup_v1.5.exe
 echo ========================================================
 echo.
@@ -1,52 +1,139 @@
-import PyInstaller.__main__
+"""Builds Kelime Avcısı with PyInstaller.
+
+    python build_installer.py             # one-dir: dist/KelimeAvcisi/ (installed by install_script.iss)
+    python build_installer.py --onefile   # portable single file: dist/portable/KelimeAvcisi.exe
+    python build_installer.py --measure   # both, then benchmark.py startup against each
+
+A --onefile exe unpacks the whole bundle (Python runtime, Tk, Pillow, pygame,
+sounds, dictionary, fonts) to a temporary _MEI folder on every launch, which is
+the slowest part of starting the game on school HDDs. The one-dir build runs in
+place from the install folder. Both builds:
+  * compile Python bytecode with optimize=2,
+  * leave out modules the game never imports (tests, docs, numpy, Qt, ...),
+  * ship the compiled sozluk.bin instead of sozluk.json (no parsing at startup),
+  * re-encode the sound effects as mono, low-bitrate MP3 when ffmpeg is available
+    (still MP3 so the Windows MCI fallback can play them).
+"""
+import argparse
 import os
 import shutil
+import subprocess
+import sys
+
+from dictionary_store import compile_dictionary
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+NAME = "KelimeAvcisi"
+STAGE_DIR = os.path.join(BASE_DIR, "build", "bundle")  # Processed data files go here first
+ONEFILE_DIST = os.path.join(BASE_DIR, "dist", "portable")
+SOUNDS = ["button-pressed-38129.mp3", "click-buttons-ui-menu-sounds-effects-button-7-203601.mp3",
+          "mech-keyboard-02-102918.mp3"]
+DATA_FILES = ["config.json"]
+DATA_DIRS = ["benz", "assets"]
+# Imported by nothing the game uses; PyInstaller would otherwise pull in what is installed
+EXCLUDES = ["unittest", "doctest", "pydoc", "pdb", "lib2to3", "idlelib", "turtledemo", "tkinter.test",
+            "xmlrpc", "distutils", "setuptools", "pip", "numpy", "pygame.examples", "pygame.tests",
+            "pygame.docs", "PIL.ImageQt", "PyQt5", "PyQt6", "PySide2", "PySide6", "IPython", "matplotlib",
+            "flask", "werkzeug", "jinja2"]
+
+
+def stage_dictionary():
+    """sozluk.json -> build/bundle/sozluk.bin."""
+    target = os.path.join(STAGE_DIR, "sozluk.bin")
+    count = compile_dictionary(os.path.join(BASE_DIR, "sozluk.json"), target)
+    print(f"[BUILD] sozluk.bin: {count} words, {os.path.getsize(target) // 1024} KB")
+    return target
+
+
+def stage_sound(name):
+    """Mono 22 kHz 48 kbps copy of a sound effect, or the original if that is not smaller."""
+    source = os.path.join(BASE_DIR, name)
+    target = os.path.join(STAGE_DIR, name)
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        result = subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-i", source, "-ac", "1", "-ar", "22050",
+                                 "-b:a", "48k", "-map_metadata", "-1", target])
+        if result.returncode == 0 and os.path.getsize(target) < os.path.getsize(source):
+            print(f"[BUILD] {name}: {os.path.getsize(source) // 1024} KB -> {os.path.getsize(target) // 1024} KB")
+            return target
+    shutil.copyfile(source, target)
+    return target
+
+
+def stage():
+    shutil.rmtree(STAGE_DIR, ignore_errors=True)
+    os.makedirs(STAGE_DIR)
+    if not shutil.which("ffmpeg"):
+        print("[BUILD] ffmpeg not found: sounds are bundled unchanged")
+    files = [stage_dictionary()] + [stage_sound(name) for name in SOUNDS]
+    files += [os.path.join(BASE_DIR, name) for name in DATA_FILES]
+    return files
+
+
+def build(onefile, data_files):
+    sep = os.pathsep  # PyInstaller's --add-data separator (';' on Windows)
+    work = os.path.join(BASE_DIR, "build", "onefile" if onefile else "onedir")
+    args = [
+        os.path.join(BASE_DIR, "main.py"),
+        f"--name={NAME}",
+        "--onefile" if onefile else "--onedir",
+        "--noconsole",
+        "--clean",
+        "--noconfirm",
+        "--optimize=2",  # Strips asserts and docstrings from the bundled bytecode
+        f"--icon={os.path.join(BASE_DIR, 'app_icon.ico')}",
+        f"--workpath={work}",
+        f"--specpath={work}",  # Keep the maintained KelimeAvcisi.spec in the repo untouched
+    ]
+    if onefile:
+        args.append(f"--distpath={ONEFILE_DIST}")
+    args += [f"--exclude-module={name}" for name in EXCLUDES]
+    args += [f"--add-data={path}{sep}." for path in data_files]
+    for folder in DATA_DIRS:
+        if os.path.isdir(os.path.join(BASE_DIR, folder)):
+            args.append(f"--add-data={os.path.join(BASE_DIR, folder)}{sep}{folder}")
+
+    import PyInstaller.__main__
+    PyInstaller.__main__.run(args)
+
+
+def executable(onefile):
+    exe = NAME + (".exe" if os.name == "nt" else "")
+    if onefile:
+        return os.path.join(ONEFILE_DIST, exe)
+    return os.path.join(BASE_DIR, "dist", NAME, exe)
+
+
+def folder_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(path) for f in files)
+
+
+def measure(runs):
+    """Startup of both builds, measured the same way as the source (see benchmark.py startup)."""
+    for onefile in (False, True):
+        exe = executable(onefile)
+        size = folder_size(exe if onefile else os.path.dirname(exe)) / 1024 / 1024
+        print(f"\n=== {'onefile' if onefile else 'onedir'}: {exe} ({size:.1f} MB) ===", flush=True)
+        subprocess.run([sys.executable, os.path.join(BASE_DIR, "benchmark.py"), "startup",
+                        "--exe", exe, "--runs", str(runs)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyInstaller build of Kelime Avcısı")
+    parser.add_argument("--onefile", action="store_true", help="Single portable exe instead of the one-dir layout")
+    parser.add_argument("--measure", action="store_true", help="Build both layouts and compare their startup")
+    parser.add_argument("--runs", type=int, default=5, help="Launches per layout with --measure")
+    args = parser.parse_args()
+
+    data_files = stage()
+    for onefile in ((False, True) if args.measure else (args.onefile,)):
+        build(onefile, data_files)
+        print(f"[BUILD] {executable(onefile)}")
+    if args.measure:
+        measure(args.runs)
+
 
-# Temizlik işlemleri zaten güzel
-# Temizlik işlemleri devre dışı
-# for folder in ["dist", "build"]:
-#     if os.path.exists(folder):
-#         try: shutil.rmtree(folder)
-#         except: pass
-
-PyInstaller.__main__.run([
-    'main.py',
-    '--name=KelimeAvcisi', # Final Name
-    '--onefile',
-    '--noconsole',
-    '--clean',
-    '--add-data=sozluk.json;.',
-    '--add-data=config.json;.',
-    '--add-data=highscores.json;.',
-    # Dosyaların varlığını kontrol ederek eklemek daha güvenlidir
-    '--add-data=button-pressed-38129.mp3;.',
-    '--add-data=click-buttons-ui-menu-sounds-effects-button-7-203601.mp3;.',
-    '--add-data=mech-keyboard-02-102918.mp3;.',
-    '--add-data=benz;benz',
-    '--add-data=assets;assets',
-    '--icon=app_icon.ico',
-])
-
-# --- Post-Build: Copy Critical Assets to Dist ---
-print("\n[POST-BUILD] Copying critical assets to dist folder...")
-dist_folder = "dist"
-if os.path.exists(dist_folder):
-    # Files to copy
-    files_to_copy = ["sozluk.json", "config.json"]
-    for f in files_to_copy:
-        if os.path.exists(f):
-            shutil.copy(f, os.path.join(dist_folder, f))
-            print(f"Copied {f}")
-            
-    # Folders to copy
-    folders_to_copy = ["assets", "benz"]
-    for folder in folders_to_copy:
-        src = folder
-        dst = os.path.join(dist_folder, folder)
-        if os.path.exists(src):
-            if os.path.exists(dst): 
-                shutil.rmtree(dst)
-            shutil.copytree(src, dst)
-            print(f"Copied folder {folder}")
-
-print("[POST-BUILD] Complete.")
+if __name__ == "__main__":
+    main()
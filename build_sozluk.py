@@ -0,0 +1,205 @@
+"""Dictionary build tool (replaces the old cleanup_sozluk.py one-off script).
+
+Reads a sozluk.json style word list in a streaming fashion and:
+  * validates every entry (word/definition present, Turkish letters only),
+  * normalises words to Turkish uppercase once,
+  * files each word under the level matching its length and drops levels the
+    game does not use (config.json -> game_settings.levels),
+  * removes duplicate words across all levels,
+  * flags definitions that leak the answer,
+  * strips the redundant "harf" field,
+  * scores every word's difficulty (see difficulty.py), optionally blending in
+    play history from a word_stats.json file,
+and writes the runtime files (sozluk.json + compiled sozluk.bin) plus a report.
+With --pack it also writes a downloadable dictionary pack (see dictionary_pack.py).
+
+Memory stays bounded: entries are spooled to per-level temporary files, and
+only the set of seen words and the compiled record tables are kept in RAM.
+
+Usage:
+    python build_sozluk.py [input.json] [--out-json sozluk.json] [--out-bin sozluk.bin]
+                           [--report sozluk_report.txt] [--levels 4 5 6 7 8 9 10] [--drop-leaks]
+                           [--stats word_stats.json] [--pack packs/out --pack-version 7]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from difficulty import WordStats, blend_history, static_difficulty
+from dictionary_pack import PackWriter
+from dictionary_store import DictionaryWriter, level_key_for, tr_upper, _level_sort_key
+from json_stream import iter_object_arrays
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+VALID_WORD = re.compile(r"^[ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZÂÎÛ]+$")
+_FOLD = str.maketrans({"Â": "A", "Î": "İ", "Û": "U"})
+
+
+def default_levels():
+    try:
+        with open(os.path.join(BASE_DIR, "config.json"), "r", encoding="utf-8") as f:
+            return json.load(f).get("game_settings", {}).get("levels") or [4, 5, 6, 7, 8, 9, 10]
+    except Exception:
+        return [4, 5, 6, 7, 8, 9, 10]
+
+
+def leaks_answer(word, definition):
+    """True if the definition contains the answer (ignoring case and circumflexes)."""
+    folded_word = word.translate(_FOLD)
+    return folded_word in tr_upper(definition).translate(_FOLD)
+
+
+class BuildReport:
+    """Collects counters and streams individual issues to the report file."""
+
+    def __init__(self, path):
+        self.counts = Counter()
+        self.path = path
+        self._issues = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def issue(self, kind, level_key, detail):
+        self.counts[kind] += 1
+        self._issues.write(f"[{kind}] {level_key}: {detail}\n")
+
+    def write(self, level_counts):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("SOZLUK BUILD REPORT\n===================\n\n")
+            f.write(f"Entries read:     {self.counts['read']}\n")
+            f.write(f"Entries written:  {self.counts['written']}\n")
+            for kind in ("invalid", "duplicate", "level_dropped", "relevelled", "leak", "leak_dropped"):
+                f.write(f"{kind + ':':<18}{self.counts[kind]}\n")
+            f.write("\nWords per level:\n")
+            for key in sorted(level_counts, key=_level_sort_key):
+                f.write(f"  {key:<10}{level_counts[key]}\n")
+            f.write("\nIssues:\n")
+            self._issues.seek(0)
+            for line in self._issues:
+                f.write("  " + line)
+        self._issues.close()
+
+
+def build(src, out_json, out_bin, report_path, levels, drop_leaks=False, stats_path=None,
+          pack_dir=None, pack_version=None):
+    stats = WordStats(stats_path)
+    pack = PackWriter(pack_dir, pack_version) if pack_dir else None
+    allowed = {f"{n}_harf" for n in levels}
+    report = BuildReport(report_path)
+    seen = set()
+    spools = {}  # level key -> temp file of JSON lines
+    level_counts = Counter()
+
+    try:
+        with open(src, "r", encoding="utf-8") as f:
+            for level_key, entry in iter_object_arrays(f):
+                report.counts["read"] += 1
+
+                if not isinstance(entry, dict):
+                    report.issue("invalid", level_key, f"not an object: {entry!r}")
+                    continue
+                word = entry.get("kelime")
+                definition = entry.get("tanim")
+                if not isinstance(word, str) or not isinstance(definition, str):
+                    report.issue("invalid", level_key, f"missing kelime/tanim: {entry!r}")
+                    continue
+
+                word = tr_upper(word.strip())
+                definition = " ".join(definition.split())
+                if not VALID_WORD.match(word):
+                    report.issue("invalid", level_key, f"bad characters in {word!r}")
+                    continue
+                if not definition:
+                    report.issue("invalid", level_key, f"{word}: empty definition")
+                    continue
+
+                if word in seen:
+                    report.issue("duplicate", level_key, word)
+                    continue
+                seen.add(word)
+
+                target_key = level_key_for(word)
+                if target_key != level_key:
+                    report.issue("relevelled", level_key, f"{word} -> {target_key}")
+                if target_key not in allowed:
+                    report.issue("level_dropped", target_key, word)
+                    continue
+
+                if leaks_answer(word, definition):
+                    if drop_leaks:
+                        report.issue("leak_dropped", target_key, f"{word}: {definition}")
+                        continue
+                    report.issue("leak", target_key, f"{word}: {definition}")
+
+                spool = spools.get(target_key)
+                if spool is None:
+                    spool = spools[target_key] = tempfile.TemporaryFile("w+", encoding="utf-8")
+                spool.write(json.dumps({"kelime": word, "tanim": definition}, ensure_ascii=False) + "\n")
+                level_counts[target_key] += 1
+                report.counts["written"] += 1
+
+        # Emit runtime files level by level from the spools
+        keys = sorted(spools, key=_level_sort_key)
+        tmp_json = out_json + ".tmp"
+        with open(tmp_json, "w", encoding="utf-8") as out, DictionaryWriter(out_bin) as writer:
+            out.write("{\n")
+            for i, key in enumerate(keys):
+                out.write(f'    "{key}": [\n')
+                spool = spools[key]
+                spool.seek(0)
+                first = True
+                shard = [] if pack else None
+                for line in spool:
+                    if not first:
+                        out.write(",\n")
+                    out.write("        " + line.rstrip("\n"))
+                    first = False
+                    entry = json.loads(line)
+                    difficulty = blend_history(static_difficulty(entry["kelime"], entry["tanim"]),
+                                               *stats.get(entry["kelime"]))
+                    writer.add(key, entry["kelime"], entry["tanim"], difficulty)
+                    if pack:
+                        shard.append(entry)
+                if pack:
+                    pack.add_level(key, shard)
+                out.write("\n    ]" + ("," if i < len(keys) - 1 else "") + "\n")
+            out.write("}\n")
+        os.replace(tmp_json, out_json)
+        if pack:
+            pack.close()
+    finally:
+        for spool in spools.values():
+            spool.close()
+
+    report.write(level_counts)
+    return report.counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the runtime dictionary from a word list")
+    parser.add_argument("input", nargs="?", default=os.path.join(BASE_DIR, "sozluk.json"))
+    parser.add_argument("--out-json", default=None, help="Cleaned runtime JSON (default: overwrite input)")
+    parser.add_argument("--out-bin", default=os.path.join(BASE_DIR, "sozluk.bin"))
+    parser.add_argument("--report", default=os.path.join(BASE_DIR, "sozluk_report.txt"))
+    parser.add_argument("--levels", type=int, nargs="+", default=None)
+    parser.add_argument("--drop-leaks", action="store_true", help="Remove entries whose definition contains the word")
+    parser.add_argument("--stats", default=None, help="word_stats.json with play history to blend into difficulty")
+    parser.add_argument("--pack", default=None, help="Also write a downloadable dictionary pack to this directory")
+    parser.add_argument("--pack-version", type=int, default=None, help="Pack version (default: current Unix time)")
+    args = parser.parse_args()
+
+    counts = build(args.input, args.out_json or args.input, args.out_bin, args.report,
+                   args.levels or default_levels(), args.drop_leaks, args.stats,
+                   args.pack, args.pack_version or int(time.time()))
+    print(f"[BUILD] {counts['written']}/{counts['read']} entries written "
+          f"(invalid {counts['invalid']}, duplicate {counts['duplicate']}, "
+          f"dropped level {counts['level_dropped']}, leaks {counts['leak'] + counts['leak_dropped']})")
+    print(f"[BUILD] Report: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
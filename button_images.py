@@ -0,0 +1,79 @@
+"""Pre-rendered backgrounds for the rounded buttons.
+
+A rounded button used to redraw its shadow and body from canvas primitives
+(two rounded rectangles of four ovals and two rectangles each, plus a
+stippled oval on hover) on every enter, leave and press. Here each
+(size, radius, color, state, scale) background is drawn once with Pillow,
+anti-aliased by supersampling, and the resulting PhotoImage is shared by
+every button that looks the same. A state change is then a single image
+swap on the button's canvas.
+
+Without Pillow, ``ButtonImageCache.available`` is False and buttons fall back
+to canvas primitives (drawn once per state and shown/hidden).
+"""
+from collections import OrderedDict
+
+try:
+    from PIL import Image, ImageDraw, ImageTk
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+
+SHADOW_COLOR = "#0f172a"
+# state -> (body y offset, shadow y offset), in unscaled pixels as the canvas version draws them
+OFFSETS = {"normal": (5, 8), "hover": (2, 10), "pressed": (8, 5), "disabled": (5, 8)}
+SUPERSAMPLE = 2  # Pillow's rounded_rectangle is not anti-aliased; draw big and shrink
+
+
+def render_button(width, height, canvas_height, radius, color, state):
+    """RGBA image of a button background (shadow, body and hover shine)."""
+    k = SUPERSAMPLE
+    body_y, shadow_y = OFFSETS.get(state, OFFSETS["normal"])
+    # The canvas version's "radius" is the size of the corner ovals, i.e. a diameter
+    corner = max(0, radius * k // 2)
+
+    img = Image.new("RGBA", (width * k, canvas_height * k), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    # Shadow from x=2 to the right edge: the canvas draws it at x=2 with width w=width-2
+    draw.rounded_rectangle([2 * k, shadow_y * k, width * k - 1, (shadow_y + height) * k - 1],
+                           radius=corner, fill=SHADOW_COLOR)
+    draw.rounded_rectangle([0, body_y * k, width * k - 1, (body_y + height) * k - 1],
+                           radius=corner, fill=color)
+    if state == "hover" and radius > 0:
+        shine = Image.new("RGBA", img.size, (0, 0, 0, 0))
+        ImageDraw.Draw(shine).ellipse([10 * k, (body_y + 5) * k, (width - 10) * k, (body_y + 15) * k],
+                                      fill=(255, 255, 255, 64))
+        img = Image.alpha_composite(img, shine)
+    return img.resize((width, canvas_height), Image.Resampling.BOX)  # Exact average for an integer factor
+
+
+class ButtonImageCache:
+    """Shared PhotoImages keyed by (size, radius, color, state, scale)."""
+
+    def __init__(self, max_items=256):
+        self.available = PILLOW_AVAILABLE
+        self.max_items = max_items
+        self._images = OrderedDict()
+        self.renders = 0  # images drawn so far (for benchmarks)
+
+    def get(self, width, height, canvas_height, radius, color, state, scale_factor=1.0):
+        """PhotoImage for one button look, or None if it cannot be drawn (use the canvas path)."""
+        if not self.available:
+            return None
+        key = (width, height, canvas_height, radius, color, state, scale_factor)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+        try:
+            image = ImageTk.PhotoImage(render_button(width, height, canvas_height, radius, color, state))
+        except Exception as e:
+            # e.g. a Tk color name Pillow does not know
+            print(f"[UI] Button image failed ({color}): {e}")
+            return None
+        self.renders += 1
+        self._images[key] = image
+        if len(self._images) > self.max_items:
+            # Canvases still showing an evicted image keep their own reference
+            self._images.popitem(last=False)
+        return image
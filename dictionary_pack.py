@@ -0,0 +1,196 @@
+"""Downloadable dictionary packs with per-level delta updates.
+
+A pack is published as a manifest plus one JSON shard per level:
+
+    manifest.json  {"version": 7, "levels": {"4_harf": {"file": "4_harf.json",
+                                                        "sha256": "...", "count": 412}, ...}}
+    4_harf.json    [{"kelime": "...", "tanim": "..."}, ...]
+
+Installed packs live in versioned directories under the user data folder
+(``packs/v7/``) next to a ``state.json`` naming the current and previous
+version. An update copies unchanged shards from the installed pack, downloads
+only the shards whose checksum changed, verifies and compiles them into
+sozluk.bin, and then switches ``state.json`` with one atomic replace. The
+previous version stays on disk for ``rollback``; older ones are pruned.
+
+``build_sozluk.py --pack DIR`` produces the files to publish.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+from difficulty import static_difficulty
+from dictionary_store import DictionaryWriter, _level_sort_key, tr_upper
+
+MANIFEST = "manifest.json"
+STATE = "state.json"
+COMPILED = "sozluk.bin"
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def default_fetch(url, timeout=15):
+    # Imported here: ssl and urllib cost ~20 ms, and packs are only fetched off the UI thread
+    import ssl
+    import urllib.request
+    req = urllib.request.Request(url, headers={"User-Agent": "KelimeAvcisi"})
+    with urllib.request.urlopen(req, timeout=timeout, context=ssl.create_default_context()) as response:
+        return response.read()
+
+
+class PackWriter:
+    """Writes a publishable pack one level shard at a time."""
+
+    def __init__(self, out_dir, version):
+        self.out_dir = out_dir
+        self.manifest = {"version": int(version), "levels": {}}
+        os.makedirs(out_dir, exist_ok=True)
+
+    def add_level(self, key, entries):
+        data = json.dumps(entries, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        filename = f"{key}.json"
+        with open(os.path.join(self.out_dir, filename), "wb") as f:
+            f.write(data)
+        self.manifest["levels"][key] = {"file": filename, "sha256": sha256_bytes(data), "count": len(entries)}
+
+    def close(self):
+        # Manifest last, so a half-written pack is never published as complete
+        with open(os.path.join(self.out_dir, MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        return self.manifest
+
+
+def validate_shard(data):
+    """Parses a shard and checks every entry. Returns the entry list or raises ValueError."""
+    entries = json.loads(data.decode("utf-8"))
+    if not isinstance(entries, list):
+        raise ValueError("shard is not a list")
+    for e in entries:
+        if not isinstance(e, dict) or not isinstance(e.get("kelime"), str) or not e["kelime"].strip() \
+                or not isinstance(e.get("tanim"), str):
+            raise ValueError(f"invalid entry: {e!r}")
+    return entries
+
+
+class PackManager:
+    """Installs, switches and rolls back dictionary packs under ``root``."""
+
+    def __init__(self, root, fetch=default_fetch):
+        self.root = root
+        self.fetch = fetch
+        os.makedirs(root, exist_ok=True)
+        self.state = self._read_json(os.path.join(root, STATE)) or {}
+
+    @staticmethod
+    def _read_json(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def _pack_dir(self, version):
+        return os.path.join(self.root, f"v{int(version)}")
+
+    def _write_state(self, state):
+        tmp_path = os.path.join(self.root, STATE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, os.path.join(self.root, STATE))
+        self.state = state
+
+    @property
+    def current_version(self):
+        return self.state.get("current")
+
+    def compiled_path(self, version=None):
+        """sozluk.bin of the given (default: current) pack, or None if not installed."""
+        version = self.current_version if version is None else version
+        if version is None:
+            return None
+        path = os.path.join(self._pack_dir(version), COMPILED)
+        return path if os.path.exists(path) else None
+
+    def update(self, manifest_url):
+        """Installs the pack behind ``manifest_url`` if it is newer.
+
+        Returns the new sozluk.bin path, or None when already up to date.
+        Raises on download or validation errors; the current pack is untouched then.
+        """
+        from urllib.parse import urljoin
+        remote = json.loads(self.fetch(manifest_url).decode("utf-8"))
+        version = int(remote["version"])
+        current = self.current_version
+        if current is not None and version <= current:
+            return None
+        if version == self.state.get("skip"):
+            return None  # Rolled back from this version; wait for a newer one
+
+        installed = {}
+        if current is not None:
+            installed = (self._read_json(os.path.join(self._pack_dir(current), MANIFEST)) or {}).get("levels", {})
+
+        staging = os.path.join(self.root, f"v{version}.partial")
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        downloaded = 0
+        try:
+            with DictionaryWriter(os.path.join(staging, COMPILED)) as writer:
+                for key in sorted(remote["levels"], key=_level_sort_key):
+                    info = remote["levels"][key]
+                    filename = os.path.basename(info["file"])
+                    target = os.path.join(staging, filename)
+                    old = installed.get(key)
+                    old_path = os.path.join(self._pack_dir(current), os.path.basename(old["file"])) if old else None
+
+                    if old and old["sha256"] == info["sha256"] and os.path.exists(old_path):
+                        # Unchanged level: reuse the local shard
+                        shutil.copyfile(old_path, target)
+                        with open(target, "rb") as f:
+                            data = f.read()
+                    else:
+                        data = self.fetch(urljoin(manifest_url, info["file"]))
+                        downloaded += 1
+                        with open(target, "wb") as f:
+                            f.write(data)
+
+                    if sha256_bytes(data) != info["sha256"]:
+                        raise ValueError(f"checksum mismatch for {key}")
+                    for e in validate_shard(data):
+                        word = tr_upper(e["kelime"].strip())
+                        writer.add(key, word, e["tanim"], static_difficulty(word, e["tanim"]))
+
+            with open(os.path.join(staging, MANIFEST), "w", encoding="utf-8") as f:
+                json.dump(remote, f, ensure_ascii=False, indent=2)
+
+            final_dir = self._pack_dir(version)
+            shutil.rmtree(final_dir, ignore_errors=True)
+            os.replace(staging, final_dir)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        # The switch itself is this single replace of state.json
+        self._write_state({"current": version, "previous": current, "skip": self.state.get("skip")})
+        print(f"[PACK] Installed v{version} ({downloaded}/{len(remote['levels'])} levels downloaded)")
+        return self.compiled_path(version)
+
+    def rollback(self):
+        """Makes the previous pack current again. Returns its sozluk.bin path or None."""
+        previous = self.state.get("previous")
+        if previous is None or not self.compiled_path(previous):
+            return None
+        self._write_state({"current": previous, "previous": None, "skip": self.current_version})
+        print(f"[PACK] Rolled back to v{previous}")
+        return self.compiled_path(previous)
+
+    def prune(self):
+        """Deletes pack directories other than current and previous (call at startup)."""
+        keep = {f"v{v}" for v in (self.state.get("current"), self.state.get("previous")) if v is not None}
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if os.path.isdir(path) and name.startswith("v") and name not in keep:
+                shutil.rmtree(path, ignore_errors=True)
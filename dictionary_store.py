@@ -0,0 +1,391 @@
+"""Dictionary loaders: compiled format (sozluk.bin) and streaming JSON.
+
+Layout (little-endian):
+    header      magic "KSOZ", version u16, level count u16, pool offset u32
+    level table per level: key offset u32, key length u16, word count u32, records offset u32
+    records     per word: word offset u32, word length u16, definition offset u32, definition length u16,
+                difficulty u16 (0..65534 scaled to [0, 1], 65535 = unknown; version 2 only)
+    pool        UTF-8 string pool (offsets above are relative to the pool start)
+
+The compiled loader memory-maps the file and only decodes a level's words the
+first time that ``{n}_harf`` key is requested. The JSON loader parses
+sozluk.json incrementally on a background thread and publishes each level as
+soon as it has been read.
+
+Both expose ``get(key, default)`` like the plain dict the game used to load,
+plus ``is_level_ready(key)`` / ``wait_ready(key, timeout)`` readiness checks.
+Levels are lists of ``WordEntry`` records.
+"""
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+
+from json_stream import iter_object_arrays
+
+MAGIC = b"KSOZ"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<4sHHI")
+_LEVEL = struct.Struct("<IHII")
+_RECORDS = {1: struct.Struct("<IHIH"), 2: struct.Struct("<IHIHH")}
+_RECORD = _RECORDS[FORMAT_VERSION]
+_NO_DIFFICULTY = 0xFFFF
+
+
+class DictionaryWriter:
+    """Streams entries into a compiled dictionary file.
+
+    Strings go straight to a temporary pool file; only the fixed-size record
+    tables (16 bytes per word) are kept in memory until ``close``.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._pool = tempfile.TemporaryFile()
+        self._pool_size = 0
+        self._levels = {}  # key -> bytearray of packed records
+
+    def _intern(self, text):
+        data = text.encode("utf-8")
+        offset = self._pool_size
+        self._pool.write(data)
+        self._pool_size += len(data)
+        return offset, len(data)
+
+    def add(self, level_key, word, definition, difficulty=None):
+        records = self._levels.get(level_key)
+        if records is None:
+            records = self._levels[level_key] = bytearray()
+        word_off, word_len = self._intern(word)
+        def_off, def_len = self._intern(definition)
+        scaled = _NO_DIFFICULTY if difficulty is None else round(min(1.0, max(0.0, difficulty)) * (_NO_DIFFICULTY - 1))
+        records += _RECORD.pack(word_off, word_len, def_off, def_len, scaled)
+
+    def close(self):
+        # Level keys live in the pool as well so the table stays fixed-size
+        keys = sorted(self._levels, key=_level_sort_key)
+        key_refs = [self._intern(k) for k in keys]
+
+        table_size = _LEVEL.size * len(keys)
+        records_start = _HEADER.size + table_size
+        pool_offset = records_start + sum(len(self._levels[k]) for k in keys)
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(keys), pool_offset))
+            offset = records_start
+            for key, (key_off, key_len) in zip(keys, key_refs):
+                count = len(self._levels[key]) // _RECORD.size
+                f.write(_LEVEL.pack(key_off, key_len, count, offset))
+                offset += len(self._levels[key])
+            for key in keys:
+                f.write(self._levels[key])
+            self._pool.seek(0)
+            shutil.copyfileobj(self._pool, f)
+        self._pool.close()
+        os.replace(tmp_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._pool.close()
+
+
+def tr_upper(text):
+    """Turkish-aware uppercase conversion (i -> İ, ı -> I)."""
+    return text.replace('i', 'İ').replace('ı', 'I').upper()
+
+
+# Dotted/dotless I and circumflex vowels collapse to one form for lenient comparison
+_FOLD_TABLE = str.maketrans({"İ": "I", "Â": "A", "Î": "I", "Û": "U"})
+
+
+def fold_turkish(text):
+    """Turkish uppercase with I/İ and Â/Î/Û variants folded together."""
+    return tr_upper(text).translate(_FOLD_TABLE)
+
+
+class WordEntry:
+    """One dictionary word, normalised once when its level is loaded.
+
+    ``canonical`` is the Turkish uppercase answer, ``folded`` the lenient form
+    used when the exact comparison fails. ``difficulty`` is the precomputed
+    score from the compiled dictionary, or None if it was not stored.
+    """
+
+    __slots__ = ("canonical", "definition", "length", "folded", "difficulty")
+
+    def __init__(self, word, definition, difficulty=None):
+        self.canonical = tr_upper(word.strip())
+        self.definition = definition
+        self.length = len(self.canonical)
+        self.folded = self.canonical.translate(_FOLD_TABLE)
+        self.difficulty = difficulty
+
+    def matches(self, answer):
+        """Returns "exact", "folded" or None for an answer already passed through tr_upper."""
+        if answer == self.canonical:
+            return "exact"
+        if len(answer) == self.length and answer.translate(_FOLD_TABLE) == self.folded:
+            return "folded"
+        return None
+
+    # Dict-style access for code written against the raw JSON entries
+    def __getitem__(self, key):
+        if key == "kelime":
+            return self.canonical
+        if key == "tanim":
+            return self.definition
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self):
+        return f"WordEntry({self.canonical!r})"
+
+
+def level_key_for(word):
+    return f"{len(word)}_harf"
+
+
+def _level_sort_key(key):
+    """Orders '4_harf' < '10_harf' numerically, anything else afterwards."""
+    head = key.split("_", 1)[0]
+    return (0, int(head), key) if head.isdigit() else (1, 0, key)
+
+
+def compile_dictionary(json_path, bin_path):
+    """Compiles a sozluk.json style file into the binary format. Returns word count."""
+    from difficulty import static_difficulty
+
+    count = 0
+    with open(json_path, "r", encoding="utf-8") as f, DictionaryWriter(bin_path) as writer:
+        for level_key, w in iter_object_arrays(f):
+            if not isinstance(w, dict) or not w.get("kelime"):
+                continue
+            definition = w.get("tanim", "")
+            writer.add(level_key, w["kelime"], definition, static_difficulty(tr_upper(w["kelime"]), definition))
+            count += 1
+    return count
+
+
+class CompiledDictionary:
+    """Read-only, memory-mapped view over a compiled dictionary.
+
+    Behaves like the ``{level_key: [entry, ...]}`` dict the game used to load
+    from JSON, but a level is only decoded (into ``WordEntry`` records) on
+    first access. After ``close`` the levels already decoded stay readable;
+    the others come back empty.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()  # Decoding vs close (index builds decode on worker threads)
+        self._closed = False
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, level_count, self._pool_offset = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version not in _RECORDS:
+            self.close()
+            raise ValueError(f"Unsupported dictionary file: {path}")
+        self._record = _RECORDS[version]
+
+        # key -> (word count, records offset)
+        self._index = {}
+        for i in range(level_count):
+            key_off, key_len, count, rec_off = _LEVEL.unpack_from(self._mm, _HEADER.size + i * _LEVEL.size)
+            self._index[self._string(key_off, key_len)] = (count, rec_off)
+
+        self._levels = {}
+
+    def _string(self, offset, length):
+        start = self._pool_offset + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def _materialise(self, key):
+        count, rec_off = self._index[key]
+        record = self._record
+        view = memoryview(self._mm)[rec_off:rec_off + count * record.size]
+        scale = 1.0 / (_NO_DIFFICULTY - 1)
+        try:
+            if record.size == _RECORDS[1].size:
+                words = [
+                    WordEntry(self._string(w_off, w_len), self._string(d_off, d_len))
+                    for w_off, w_len, d_off, d_len in record.iter_unpack(view)
+                ]
+            else:
+                words = [
+                    WordEntry(self._string(w_off, w_len), self._string(d_off, d_len),
+                              None if diff == _NO_DIFFICULTY else diff * scale)
+                    for w_off, w_len, d_off, d_len, diff in record.iter_unpack(view)
+                ]
+        finally:
+            view.release()
+        self._levels[key] = words
+        return words
+
+    def get(self, key, default=None):
+        words = self._levels.get(key)
+        if words is not None:
+            return words
+        if key not in self._index:
+            return default
+        with self._lock:
+            words = self._levels.get(key)
+            if words is None:
+                if self._closed:
+                    return default
+                words = self._materialise(key)
+        return words
+
+    def __getitem__(self, key):
+        if key not in self._index:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def keys(self):
+        return self._index.keys()
+
+    def level_size(self, key):
+        """Number of words in a level without materialising it."""
+        return self._index.get(key, (0, 0))[0]
+
+    def is_level_ready(self, key):
+        return True
+
+    def wait_ready(self, key=None, timeout=None):
+        return True
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._mm.close()
+            except Exception:
+                pass
+            self._file.close()
+
+
+class StreamingDictionary:
+    """sozluk.json loaded level by level on a background thread.
+
+    ``get`` returns immediately for levels that are already decoded and only
+    blocks when asked for a level the loader has not reached yet.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.error = None
+        self._levels = {}
+        self._done = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._load, daemon=True)
+        self._thread.start()
+
+    def _publish(self, key, words):
+        with self._cond:
+            # A key repeated later in the file extends the earlier level
+            self._levels.setdefault(key, []).extend(words)
+            self._cond.notify_all()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                current_key, words = None, []
+                for key, entry in iter_object_arrays(f):
+                    if key != current_key:
+                        if current_key is not None:
+                            self._publish(current_key, words)
+                        current_key, words = key, []
+                    if isinstance(entry, dict) and isinstance(entry.get("kelime"), str):
+                        words.append(WordEntry(entry["kelime"], entry.get("tanim", "")))
+                if current_key is not None:
+                    self._publish(current_key, words)
+        except Exception as e:
+            self.error = e
+            print(f"[DICT] Streaming load failed: {e}")
+        finally:
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    def is_level_ready(self, key):
+        with self._cond:
+            return key in self._levels or self._done
+
+    @property
+    def is_complete(self):
+        return self._done
+
+    def wait_ready(self, key=None, timeout=None):
+        """Waits for one level (or the whole file if key is None). Returns False on timeout."""
+        with self._cond:
+            if key is None:
+                return self._cond.wait_for(lambda: self._done, timeout)
+            return self._cond.wait_for(lambda: key in self._levels or self._done, timeout)
+
+    def get(self, key, default=None):
+        words = self._levels.get(key)
+        if words is not None:
+            return words
+        self.wait_ready(key)
+        return self._levels.get(key, default)
+
+    def __getitem__(self, key):
+        words = self.get(key)
+        if words is None:
+            raise KeyError(key)
+        return words
+
+    def __contains__(self, key):
+        self.wait_ready(key)
+        return key in self._levels
+
+    def __bool__(self):
+        # Still loading counts as usable; a finished load with nothing in it does not
+        return not self._done or bool(self._levels)
+
+    def keys(self):
+        self.wait_ready()
+        return self._levels.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+
+if __name__ == "__main__":
+    src = sys.argv[1] if len(sys.argv) > 1 else "sozluk.json"
+    dst = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(src)[0] + ".bin"
+    total = compile_dictionary(src, dst)
+    print(f"[DICT] Compiled {total} words: {src} -> {dst} ({os.path.getsize(dst)} bytes)")
@@ -0,0 +1,205 @@
+"""Word difficulty scores and adaptive word selection.
+
+Every entry gets a difficulty in [0, 1] built from:
+  * letter rarity: mean rarity of its letters against Turkish letter frequencies,
+  * definition length: short definitions give fewer clues,
+  * history (when known): solve rate and solve time from ``word_stats.json``.
+
+``build_sozluk.py`` stores the static part in sozluk.bin. At runtime each level
+is sorted by difficulty once, so picking a word inside a difficulty band is
+two bisects plus a random index, O(log n) whatever the level size. With a
+``WordSampler`` the selector only takes words that the level's no-repeat deck
+has not handed out yet, so adaptive games keep the cross-session deck.
+"""
+import json
+import math
+import os
+import random
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+# Approximate letter frequencies of written Turkish (fractions)
+LETTER_FREQ = {
+    "A": 0.119, "E": 0.089, "İ": 0.086, "N": 0.075, "R": 0.069, "L": 0.059, "I": 0.051,
+    "K": 0.047, "D": 0.046, "M": 0.037, "Y": 0.033, "U": 0.032, "T": 0.030, "S": 0.030,
+    "B": 0.028, "O": 0.025, "Ü": 0.019, "Ş": 0.018, "Z": 0.015, "G": 0.013, "Ç": 0.012,
+    "H": 0.012, "Ğ": 0.011, "V": 0.010, "C": 0.010, "P": 0.009, "Ö": 0.008, "F": 0.005,
+    "J": 0.0003, "Â": 0.001, "Î": 0.001, "Û": 0.001,
+}
+_RARITY = {ch: -math.log(f) for ch, f in LETTER_FREQ.items()}
+_RARITY_MIN = min(_RARITY.values())
+_RARITY_SPAN = 2.5  # mean rarity this far above the commonest letter counts as 1.0
+
+MIN_ATTEMPTS = 3  # history is ignored until a word has been played this often
+
+
+def _clamp(x):
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+
+
+def static_difficulty(word, definition):
+    """Difficulty from the word and definition alone."""
+    if not word:
+        return 0.0
+    rarity = sum(_RARITY.get(ch, _RARITY_MIN + _RARITY_SPAN) for ch in word) / len(word)
+    rarity = _clamp((rarity - _RARITY_MIN) / _RARITY_SPAN)
+    clues = _clamp((120 - len(definition)) / 100)
+    return round(0.6 * rarity + 0.4 * clues, 4)
+
+
+def blend_history(static, attempts, solves, avg_time_fraction):
+    """Mixes play history into a static score once there is enough of it."""
+    if attempts < MIN_ATTEMPTS:
+        return static
+    history = 0.7 * (1 - solves / attempts) + 0.3 * _clamp(avg_time_fraction)
+    weight = min(0.7, attempts / 20)
+    return round((1 - weight) * static + weight * history, 4)
+
+
+class WordStats:
+    """Per-word play history: ``{word: [attempts, solves, total_time_fraction]}``."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._stats = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._stats = data
+            except Exception as e:
+                print(f"[STATS] Could not read word stats: {e}")
+
+    def record(self, word, solved, time_fraction):
+        row = self._stats.setdefault(word, [0, 0, 0.0])
+        row[0] += 1
+        row[1] += 1 if solved else 0
+        row[2] = round(row[2] + _clamp(time_fraction), 4)
+        self._dirty = True
+
+    def get(self, word):
+        """Returns (attempts, solves, average time fraction)."""
+        row = self._stats.get(word)
+        if not row:
+            return 0, 0, 0.0
+        return row[0], row[1], row[2] / row[0] if row[0] else 0.0
+
+    def difficulty(self, entry):
+        static = entry.difficulty
+        if static is None:
+            static = static_difficulty(entry.canonical, entry.definition)
+        return blend_history(static, *self.get(entry.canonical))
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._stats, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            print(f"[STATS] Could not save word stats: {e}")
+
+
+class DifficultyIndex:
+    """One level's entries sorted by difficulty."""
+
+    def __init__(self, entries, score):
+        pairs = sorted(((score(e), i) for i, e in enumerate(entries)))
+        self.keys = [d for d, _ in pairs]
+        self.positions = [i for _, i in pairs]  # Index of each sorted entry in the level's list
+        self.entries = [entries[i] for _, i in pairs]
+        self.words = entries  # The level's list, in its own order
+
+    def __len__(self):
+        return len(self.entries)
+
+    def band(self, lo, hi):
+        """Index range [start, end) of entries with lo <= difficulty <= hi."""
+        return bisect_left(self.keys, lo), bisect_right(self.keys, hi)
+
+
+class AdaptiveSelector:
+    """Keeps a target difficulty and picks words near it.
+
+    The target moves up after quick solves and down after misses, so each
+    player settles into rounds they can just about solve.
+    """
+
+    def __init__(self, dictionary, stats=None, band=0.1, step=0.08, recent=50, rng=None, sampler=None):
+        self.dictionary = dictionary
+        self.stats = stats or WordStats()
+        self.sampler = sampler  # WordSampler whose decks track used words; None: a short recent list
+        self.band = band
+        self.step = step
+        self.target = 0.5
+        self.rng = rng or random.Random()
+        self._indexes = {}
+        self._recent = {}
+        self._recent_size = recent
+
+    def index(self, level_key):
+        index = self._indexes.get(level_key)
+        if index is None:
+            index = self._indexes[level_key] = DifficultyIndex(
+                self.dictionary.get(level_key, []), self.stats.difficulty)
+        return index
+
+    def draw(self, level_key):
+        index = self.index(level_key)
+        if not len(index):
+            return None
+        deck = self.sampler.deck(level_key, len(index)) if self.sampler else None
+        if deck is not None and not deck.remaining:
+            deck.reshuffle()  # Every word of the level has been played
+
+        # Widen the band until it holds a few candidates
+        width = self.band
+        start, end = index.band(self.target - width, self.target + width)
+        while end - start < 4 and width < 1.0:
+            width *= 2
+            start, end = index.band(self.target - width, self.target + width)
+
+        if deck is not None:
+            # Probe for a word the deck has not handed out; widen when the band is used up
+            while True:
+                for _ in range(8):
+                    i = self.rng.randrange(start, end)
+                    if not deck.is_used(index.positions[i]):
+                        deck.take(index.positions[i])
+                        return index.entries[i]
+                if width >= 1.0:
+                    break
+                width *= 2
+                start, end = index.band(self.target - width, self.target + width)
+            return index.words[deck.draw()]  # Few words left anywhere: take any of them
+
+        recent = self._recent.get(level_key)
+        if recent is None:
+            recent = self._recent[level_key] = deque(maxlen=min(self._recent_size, len(index) - 1))
+        entry = None
+        for _ in range(8):
+            entry = index.entries[self.rng.randrange(start, end)]
+            if entry.canonical not in recent:
+                break
+        if recent.maxlen:
+            recent.append(entry.canonical)
+        return entry
+
+    def record(self, entry, solved, time_fraction, hints=0):
+        """Updates history and moves the target difficulty after a round."""
+        self.stats.record(entry.canonical, solved, time_fraction)
+        if solved and hints == 0 and time_fraction < 0.5:
+            self.target += self.step
+        elif solved:
+            self.target += self.step / 4
+        else:
+            self.target -= self.step
+        self.target = min(0.95, max(0.05, self.target))
+
+    def reset(self):
+        self.target = 0.5
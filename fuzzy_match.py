@@ -0,0 +1,56 @@
+"""Bounded edit distance for typo-tolerant answers.
+
+Uses Myers' bit-parallel Levenshtein algorithm: the target word becomes a set
+of per-letter bitmasks once, after which comparing an answer costs a handful
+of integer operations per character, O(len(answer)) for the short words the
+game uses. Comparisons stop early once the distance bound can't be met.
+"""
+
+
+class FuzzyMatcher:
+    """Edit distance from typed answers to one fixed target word."""
+
+    __slots__ = ("target", "length", "_peq", "_mask", "_last")
+
+    def __init__(self, target):
+        self.target = target
+        self.length = len(target)
+        peq = {}
+        for i, ch in enumerate(target):
+            peq[ch] = peq.get(ch, 0) | (1 << i)
+        self._peq = peq
+        self._mask = (1 << self.length) - 1
+        self._last = 1 << (self.length - 1) if self.length else 0
+
+    def distance(self, text, limit=None):
+        """Levenshtein distance to ``text``; returns ``limit + 1`` as soon as it must exceed ``limit``."""
+        m = self.length
+        n = len(text)
+        if limit is not None and abs(m - n) > limit:
+            return limit + 1
+        if m == 0:
+            return n
+        peq, mask, last = self._peq, self._mask, self._last
+        pv, mv, score = mask, 0, m
+        for j, ch in enumerate(text):
+            eq = peq.get(ch, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & mask)
+            mh = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            # Top row of the DP matrix grows by one per text character (global alignment)
+            ph = ((ph << 1) | 1) & mask
+            mh = (mh << 1) & mask
+            pv = mh | (~(xv | ph) & mask)
+            mv = ph & xv
+            # Each remaining character can lower the score by at most one
+            if limit is not None and score - (n - j - 1) > limit:
+                return limit + 1
+        return score
+
+    def within(self, text, k):
+        return self.distance(text, k) <= k
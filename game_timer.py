@@ -0,0 +1,125 @@
+"""Monotonic game clocks.
+
+The round countdown used to subtract one from ``time_left`` in a
+``root.after(1000, ...)`` callback, so every second lost that callback's
+latency and a busy event loop (a blocking network call, a long redraw)
+stretched the round. Here time is read from ``time.monotonic()``: a
+``Stopwatch`` adds up its running intervals, and a ``Countdown`` is a
+stopwatch with a duration whose remaining time is always ``duration -
+elapsed``. Ticks only refresh the display. Each one is scheduled for the
+moment the shown second changes, so a late tick neither delays the next one
+nor the timeout.
+
+Neither class knows about Tk; the countdown gets ``schedule(ms, fn)`` and
+``cancel(job)``, which in the game are ``root.after`` and ``root.after_cancel``.
+"""
+import math
+import time
+
+
+class Stopwatch:
+    """Elapsed running time that survives pauses and ignores wall clock changes."""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.started = False
+        self._accumulated = 0.0
+        self._since = None  # clock() when the current run began, None while paused or stopped
+
+    def start(self):
+        """Starts again from zero."""
+        self.started = True
+        self._accumulated = 0.0
+        self._since = self.clock()
+
+    def pause(self):
+        if self._since is not None:
+            self._accumulated += self.clock() - self._since
+            self._since = None
+
+    def resume(self):
+        if self.started and self._since is None:
+            self._since = self.clock()
+
+    def stop(self):
+        """Freezes ``elapsed``; unlike a pause it cannot be resumed."""
+        self.pause()
+        self.started = False
+
+    @property
+    def running(self):
+        return self._since is not None
+
+    @property
+    def elapsed(self):
+        if self._since is None:
+            return self._accumulated
+        return self._accumulated + self.clock() - self._since
+
+
+class Countdown:
+    """Round timer: ``on_tick(seconds_shown)`` on every displayed second, then ``on_expire()``."""
+
+    def __init__(self, schedule, cancel, on_tick, on_expire, clock=time.monotonic):
+        self.schedule = schedule
+        self.cancel = cancel
+        self.on_tick = on_tick
+        self.on_expire = on_expire
+        self.watch = Stopwatch(clock)
+        self.duration = 0
+        self._job = None
+
+    def start(self, seconds):
+        self._cancel()
+        self.duration = seconds
+        self.watch.start()
+        self._tick()
+
+    def stop(self):
+        """Ends the round early (answered or revealed); ``elapsed`` stays readable."""
+        self._cancel()
+        self.watch.stop()
+
+    def pause(self):
+        if self.watch.running:
+            self._cancel()
+            self.watch.pause()
+
+    def resume(self):
+        if self.watch.started and not self.watch.running:
+            self.watch.resume()
+            self._tick()
+
+    @property
+    def running(self):
+        return self.watch.running
+
+    @property
+    def elapsed(self):
+        return min(self.watch.elapsed, self.duration)
+
+    @property
+    def remaining(self):
+        return max(0.0, self.duration - self.watch.elapsed)
+
+    def _cancel(self):
+        if self._job is not None:
+            try:
+                self.cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    def _tick(self):
+        self._job = None
+        remaining = self.duration - self.watch.elapsed
+        if remaining <= 0:
+            self.watch.stop()
+            self.on_tick(0)
+            self.on_expire()
+            return
+        shown = math.ceil(remaining)
+        self.on_tick(shown)
+        # Wake just after the shown second runs out (+1 ms so we never land a hair early)
+        delay_ms = int((remaining - (shown - 1)) * 1000) + 1
+        self._job = self.schedule(delay_ms, self._tick)
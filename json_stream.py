@@ -0,0 +1,103 @@
+"""Incremental JSON readers for large data files.
+
+Only the container structure is parsed by hand; every element is decoded with
+``json.JSONDecoder.raw_decode`` as soon as it is complete in the read buffer,
+so memory use is bounded by the largest single element, not the file size.
+"""
+import json
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class _Reader:
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop the consumed prefix so the buffer does not grow with the file
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Returns the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars):
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"Expected one of {chars!r}, found {ch!r}")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number cut by the chunk boundary ("44" + "4", "4444." + "5e3") decodes
+                # short; only trust it once a delimiter follows
+                truncated = end == len(self.buf) or (
+                    isinstance(value, (int, float)) and self.buf[end] in _NUMBER_CHARS)
+                if not truncated or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                self.pos = end
+                return value
+
+
+def _iter_array_items(reader):
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def iter_object_arrays(fp, chunk_size=65536):
+    """Yields ``(key, item)`` for a top-level ``{key: [item, ...], ...}`` document.
+
+    Non-array values are yielded once as ``(key, value)``.
+    """
+    reader = _Reader(fp, chunk_size)
+    if reader.peek() == "":
+        return
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if reader.peek() == "[":
+            for item in _iter_array_items(reader):
+                yield key, item
+        else:
+            yield key, reader.value()
+        if reader.expect(",}") == "}":
+            return
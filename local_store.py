@@ -0,0 +1,232 @@
+"""Local SQLite store for scores, profiles and the login session.
+
+Replaces highscores.json, profiles.json and session.json in the user data
+folder. Reads load whole tables (``ScoreCache`` and ``ProfileCache`` keep
+them in memory); score writes arrive from ``ScoreCache`` in batches, one
+transaction per batch. The old JSON files are imported once, on first open,
+and renamed to ``*.migrated``.
+``open_store`` is what the game uses: a database that cannot be opened must
+not stop the game from starting.
+"""
+import json
+import os
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    time TEXT,
+    timestamp REAL NOT NULL,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scores_rank ON scores(score DESC, timestamp);
+CREATE INDEX IF NOT EXISTS idx_scores_name ON scores(name, timestamp);
+DROP INDEX IF EXISTS idx_scores_window;
+
+CREATE TABLE IF NOT EXISTS profiles (
+    username TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS session (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_SCORE_COLUMNS = ("name", "score", "time", "timestamp")
+
+
+def _score_row(row):
+    score = {"name": row[0], "score": row[1], "time": row[2], "timestamp": row[3]}
+    if row[4]:
+        try:
+            score.update(json.loads(row[4]))
+        except ValueError:
+            pass
+    return score
+
+
+class LocalStore:
+    """Thread-safe wrapper around the local database file."""
+
+    def __init__(self, path, legacy_dir=None):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                self._conn.executescript(SCHEMA)
+        except Exception:
+            self._conn.close()  # Release the file so open_store can move it aside
+            raise
+        if legacy_dir:
+            try:
+                self.migrate_json(legacy_dir)
+            except Exception as e:
+                # Rolled back; the JSON files stay in place for the next launch
+                print(f"[STORE] Migration failed: {e}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- Migration ---
+
+    def _meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def migrate_json(self, legacy_dir):
+        """Imports highscores.json, profiles.json and session.json once."""
+        with self._lock:
+            if self._meta("json_migrated"):
+                return
+            files = {name: os.path.join(legacy_dir, name)
+                     for name in ("highscores.json", "profiles.json", "session.json")}
+            loaded = {}
+            for name, path in files.items():
+                try:
+                    if os.path.exists(path):
+                        with open(path, "r", encoding="utf-8") as f:
+                            loaded[name] = json.load(f)
+                except Exception as e:
+                    print(f"[STORE] Skipping unreadable {name}: {e}")
+
+            rows, skipped = [], 0
+            for s in loaded.get("highscores.json") or []:
+                if not isinstance(s, dict) or "score" not in s:
+                    continue
+                try:
+                    rows.append(self._score_params(s))
+                except (TypeError, ValueError):
+                    skipped += 1  # e.g. a score that is not a number; one bad row must not block the rest
+            if skipped:
+                print(f"[STORE] Skipped {skipped} malformed scores")
+
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO scores (name, score, time, timestamp, extra) VALUES (?, ?, ?, ?, ?)", rows)
+                profiles = loaded.get("profiles.json") or {}
+                if isinstance(profiles, dict):
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO profiles (username, data) VALUES (?, ?)",
+                        [(u, json.dumps(p, ensure_ascii=False)) for u, p in profiles.items() if isinstance(p, dict)])
+                session = loaded.get("session.json")
+                if isinstance(session, dict):
+                    self._conn.execute("INSERT OR REPLACE INTO session (id, data) VALUES (1, ?)",
+                                       (json.dumps(session, ensure_ascii=False),))
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', '1')")
+
+            # Keep the originals as backups, out of the way of older builds' writers
+            for name in loaded:
+                try:
+                    os.replace(files[name], files[name] + ".migrated")
+                except OSError as e:
+                    print(f"[STORE] Could not rename {name}: {e}")
+            if loaded:
+                print(f"[STORE] Migrated {', '.join(sorted(loaded))}")
+
+    # --- Scores ---
+
+    @staticmethod
+    def _score_params(s):
+        extra = {k: v for k, v in s.items() if k not in _SCORE_COLUMNS}
+        return (s.get("name", ""), int(s.get("score", 0)), s.get("time"), float(s.get("timestamp", 0)),
+                json.dumps(extra, ensure_ascii=False) if extra else None)
+
+    def scores(self):
+        """Every score, best first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, score, time, timestamp, extra FROM scores ORDER BY score DESC, timestamp ASC").fetchall()
+        return [_score_row(r) for r in rows]
+
+    def write_scores(self, ops):
+        """Applies queued ``("add", score)`` and ``("delete", name, ts)`` operations in one transaction."""
+        with self._lock, self._conn:
+            for op in ops:
+                if op[0] == "add":
+                    self._conn.execute(
+                        "INSERT INTO scores (name, score, time, timestamp, extra) VALUES (?, ?, ?, ?, ?)",
+                        self._score_params(op[1]))
+                elif op[0] == "delete":
+                    self._conn.execute("DELETE FROM scores WHERE name = ? AND timestamp = ?", (op[1], op[2]))
+
+    # --- Profiles ---
+
+    def get_profile(self, username):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM profiles WHERE username = ?", (username,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def save_profile(self, username, data):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO profiles (username, data) VALUES (?, ?)",
+                               (username, json.dumps(data, ensure_ascii=False)))
+
+    def profiles(self, usernames=None):
+        """``{username: profile}`` for the given names (or all profiles)."""
+        with self._lock:
+            if usernames is None:
+                rows = self._conn.execute("SELECT username, data FROM profiles").fetchall()
+            else:
+                names = list(set(usernames))
+                rows = []
+                for i in range(0, len(names), 500):  # stay under SQLite's parameter limit
+                    chunk = names[i:i + 500]
+                    rows += self._conn.execute(
+                        f"SELECT username, data FROM profiles WHERE username IN ({','.join('?' * len(chunk))})",
+                        chunk).fetchall()
+        return {u: json.loads(d) for u, d in rows}
+
+    # --- Session ---
+
+    def load_session(self):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM session WHERE id = 1").fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_session(self, data):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO session (id, data) VALUES (1, ?)",
+                               (json.dumps(data, ensure_ascii=False),))
+
+    def clear_session(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM session WHERE id = 1")
+
+
+def open_store(path, legacy_dir=None):
+    """``LocalStore`` at ``path``, falling back to a fresh store if it cannot be opened.
+
+    A corrupt file is moved aside to ``*.corrupt`` and recreated. If that fails
+    too, or the file is locked or unwritable, the game gets an in-memory store
+    for this session.
+    """
+    try:
+        return LocalStore(path, legacy_dir)
+    except Exception as e:
+        print(f"[STORE] Could not open {path}: {e}")
+        corrupt = isinstance(e, sqlite3.DatabaseError) and not isinstance(e, sqlite3.OperationalError)
+    if corrupt:
+        try:
+            os.replace(path, path + ".corrupt")
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            return LocalStore(path, legacy_dir)
+        except Exception as e:
+            print(f"[STORE] Could not recreate {path}: {e}")
+    print("[STORE] Using an in-memory store; scores will not be kept")
+    return LocalStore(":memory:")
@@ -1,34 +1,46 @@
+import time
+STARTUP_T0 = time.perf_counter()  # --profile-startup measures from here
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 import json
 import random
 import os
 import hashlib
 import ctypes.wintypes
-import webbrowser
 import traceback
 import threading
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
-import time
 from datetime import datetime, timedelta
-from scrollable_frame import ScrollableFrame
+from scrollable_frame import ScrollableFrame, VirtualList
+from screen_manager import ScreenManager
+from button_images import ButtonImageCache, OFFSETS as BUTTON_OFFSETS
+from dictionary_store import CompiledDictionary, StreamingDictionary, fold_turkish
+from word_sampler import WordSampler
+from difficulty import AdaptiveSelector, WordStats
+from telemetry import REVEALED, SOLVED, TIMEOUT, TelemetryBatcher, make_event
+from dictionary_pack import PackManager
+from local_store import open_store
+from score_cache import ScoreCache
+from profile_cache import ProfileCache
+from score_retention import DEFAULT_LIMITS as DEFAULT_SCORE_LIMITS
+from player_stats import PlayerStats
+from game_timer import Countdown, Stopwatch
+from audio_engine import AudioEngine
+from startup_profile import FIRST_FRAME, READY, StartupProfile
+from word_index import WordIndex
+from fuzzy_match import FuzzyMatcher
+from session_generator import daily_code, entries_from_payload, generate_session, normalise_code
 import sys
-import urllib.request
-import urllib.error
-import zipfile
-import shutil
-import subprocess
-import ssl
+# ssl/urllib, shutil, subprocess and webbrowser are imported where they are used:
+# none of them is needed to draw the entry screen
 try:
     from PIL import Image, ImageTk
     PILLOW_AVAILABLE = True
 except ImportError:
     PILLOW_AVAILABLE = False
 
+startup = StartupProfile(STARTUP_T0)
+startup.mark("imports")
+
 # --- DPI AWARENESS (Fix for High-Res Screens) ---
 try:
     from ctypes import windll
@@ -52,6 +64,10 @@ def resource_path(relative_path):
     base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
 
+def open_url(url):
+    import webbrowser
+    webbrowser.open(url)
+
 # --- CONFIG MANAGER ---
 class ConfigManager:
     """Manages configuration loading from local file and GitHub updates"""
@@ -107,7 +123,8 @@ class ConfigManager:
             "next": "mech-keyboard-02-102918.mp3",
             "volume_correct": 1.0,
             "volume_wrong": 1.0,
-            "volume_next": 0.5
+            "volume_next": 0.5,
+            "channels": 4
         },
         "fonts": {
             "main_font_family": "Benz Grotesk Heavy",
@@ -118,7 +135,19 @@ class ConfigManager:
             "timer_duration": 60,
             "levels": [4, 5, 6, 7, 8, 9, 10],
             "score_per_word": 10,
-            "hint_penalty": 1
+            "hint_penalty": 1,
+            "max_daily_scores": 20,
+            "max_weekly_scores": 15,
+            "max_monthly_scores": 15,
+            "max_alltime_scores": 15,
+            "remember_used_words": True,
+            "hint_mode": "letter",
+            "accept_alternate_answers": False,
+            "live_prefix_check": True,
+            "lenient_matching": False,
+            "max_typos": 1,
+            "close_feedback": True,
+            "adaptive_difficulty": True
         },
         "ui_text": {
             "app_title": "Kelime Avcısı",
@@ -143,19 +172,22 @@ class ConfigManager:
             "config_url": "https://raw.githubusercontent.com/Okan707/Kelime_Oyunu/main/config.json",
             "main_py_url": "https://raw.githubusercontent.com/Okan707/Kelime_Oyunu/main/main.py",
             "sozluk_url": "https://raw.githubusercontent.com/Okan707/Kelime_Oyunu/main/sozluk.json",
-            "release_url": "https://api.github.com/repos/Okan707/Kelime_Oyunu/releases/latest"
+            "release_url": "https://api.github.com/repos/Okan707/Kelime_Oyunu/releases/latest",
+            "dictionary_pack_url": ""
         },
         "display_settings": {
             "custom_scale": None,
             "resolution": "fullscreen",
             "fullscreen": True,
-            "theme": "dark"
+            "theme": "dark",
+            "screen_cache_budget": 2000
         }
     }
     
     def __init__(self):
         self.config = self.DEFAULT_CONFIG.copy()
         self.config_file = "config.json"
+        self.pending_save = None  # AppData config to rewrite after startup (version migration)
         self.load_local_config()
         
     def load_local_config(self):
@@ -200,19 +232,26 @@ class ConfigManager:
                 print(f"[CONFIG] Version mismatch detected: Local({local_version}) != Default({default_version}). Updating...")
                 self.config["version"] = default_version
                 
-                # If we loaded from AppData, update it right there
+                # If we loaded from AppData, update it there once the entry screen is up
                 if config_to_load == appdata_config:
-                    try:
-                         with open(appdata_config, 'w', encoding='utf-8') as f:
-                            json.dump(self.config, f, ensure_ascii=False, indent=2)
-                         print(f"[CONFIG] Successfully updated version in: {appdata_config}")
-                    except Exception as e:
-                         print(f"[CONFIG] Failed to save version update: {e}")
+                    self.pending_save = appdata_config
                 
         except Exception as e:
             print(f"[CONFIG] Failed to load local config: {e}")
             # Use default config
             
+    def save_pending(self):
+        """Writes the version update found by load_local_config (deferred past the first frame)."""
+        path, self.pending_save = self.pending_save, None
+        if not path:
+            return
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            print(f"[CONFIG] Successfully updated version in: {path}")
+        except Exception as e:
+            print(f"[CONFIG] Failed to save version update: {e}")
+
     def _deep_merge(self, base, update):
         """Recursively merge update dict into base dict"""
         for key, value in update.items():
@@ -231,6 +270,8 @@ class ConfigManager:
         """Download latest config from GitHub (non-blocking)"""
         def download():
             try:
+                import ssl
+                import urllib.request
                 print(f"[CONFIG] Checking GitHub for config updates...")
                 
                 if not self.config.get("update_check", {}).get("enabled", True):
@@ -303,6 +344,8 @@ class ConfigManager:
         """Manually check for updates via GitHub Releases"""
         def check():
             try:
+                import ssl
+                import urllib.request
                 print(f"[CONFIG] Manual update check started (GitHub Releases)...")
                 
                 release_url = self.get("update_check", "release_url")
@@ -381,6 +424,10 @@ class ConfigManager:
         """Downloads the installer and runs it"""
         def process():
             try:
+                import shutil
+                import ssl
+                import subprocess
+                import urllib.request
                 appdata_dir, temp_dir = self._get_update_dirs()
                 if os.path.exists(temp_dir): shutil.rmtree(temp_dir)
                 os.makedirs(temp_dir)
@@ -431,6 +478,7 @@ class ConfigManager:
 
 # --- GLOBAL CONFIG INSTANCE ---
 config = ConfigManager()
+startup.mark("config")
 
 # --- STYLE CONSTANTS (with config fallback) ---
 BG_COLOR = config.get("colors", "bg_color", default="#1e293b")
@@ -462,11 +510,13 @@ class NetworkManager:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
 
-    def _request(self, url, method="GET", data=None, retries=3, delay=1):
+    def _request(self, url, method="GET", data=None, retries=3, delay=1, headers=None):
+        import ssl
+        import urllib.request
         for attempt in range(retries):
             try:
                 body = json.dumps(data).encode('utf-8') if data else None
-                req = urllib.request.Request(url, data=body, headers=self.headers, method=method)
+                req = urllib.request.Request(url, data=body, headers=headers or self.headers, method=method)
                 ctx = ssl._create_unverified_context()
                 
                 with urllib.request.urlopen(req, timeout=10, context=ctx) as response:
@@ -624,6 +674,42 @@ class NetworkManager:
         except Exception as e:
             return {"success": False, "message": str(e)}
 
+    def get_daily_challenge(self):
+        """Fetches today's challenge (code + word list) from the game server's /daily endpoint."""
+        try:
+            # Plain request: the jsonbin key must not be sent to the game server
+            res = self._request(f"{self.api_url}/daily", method="GET", retries=1,
+                                headers={"User-Agent": self.headers["User-Agent"]})
+            if res and res.get("success") and res.get("words"):
+                return res
+            return None
+        except Exception as e:
+            print(f"[NETWORK] Daily challenge fetch failed: {e}")
+            return None
+
+    def send_telemetry(self, events):
+        """Posts a batch of round events to the game server. Returns True if accepted."""
+        try:
+            headers = {"Content-Type": "application/json", "User-Agent": self.headers["User-Agent"]}
+            res = self._request(f"{self.api_url}/telemetry", method="POST", data={"events": events},
+                                retries=1, headers=headers)
+            return bool(res and res.get("success"))
+        except Exception as e:
+            print(f"[NETWORK] Telemetry send failed: {e}")
+            return False
+
+    def send_player_stats(self, user_id, username, delta):
+        """Adds one game's stat deltas to the player's server totals. Returns True if accepted."""
+        try:
+            headers = {"Content-Type": "application/json", "User-Agent": self.headers["User-Agent"]}
+            res = self._request(f"{self.api_url}/players/stats", method="POST",
+                                data={"user_id": user_id, "username": username, "stats": delta},
+                                retries=1, headers=headers)
+            return bool(res and res.get("success"))
+        except Exception as e:
+            print(f"[NETWORK] Player stats send failed: {e}")
+            return False
+
     def delete_score(self, username, timestamp):
         try:
             # 1. Fetch current scores
@@ -774,7 +860,7 @@ class NetworkManager:
 
 # --- FONT LOADING ---
 def load_custom_font(font_path):
-    if os.path.exists(font_path):
+    if os.name == 'nt' and os.path.exists(font_path):
         res = ctypes.windll.gdi32.AddFontResourceW(font_path)
         return res > 0
     return False
@@ -798,7 +884,7 @@ class WordGameApp:
     def __init__(self, root):
         self.root = root
         self.root.title(config.get("ui_text", "app_title", default="Kelime Oyunu"))
-        self.root.state('zoomed')  # Maximized on Windows
+        self.maximize()
         self.root.geometry("1200x800") # Larger fallback
         self.root.configure(bg=BG_COLOR)
         
@@ -834,7 +920,7 @@ class WordGameApp:
         # --- WINDOW MODE & RESOLUTION ---
         # User Request: Always start in "Windowed Fullscreen" (Maximized Window)
         # We override config settings to enforce this on startup.
-        self.root.state('zoomed')
+        self.maximize()
         self.root.attributes('-fullscreen', False)
         
         # Update config to reflect this state so Settings menu is consistent
@@ -854,10 +940,7 @@ class WordGameApp:
             return val
             
         self.s = s
-
-        
-        # Check for config updates from GitHub (non-blocking)
-        config.update_from_github()
+        self.button_images = ButtonImageCache()  # Rounded button backgrounds, drawn once and shared
         
         # Load Custom Font
         font_yolu = resource_path("benz/Benz Grotesk.ttf")
@@ -901,10 +984,21 @@ class WordGameApp:
                  fieldbackground=[('readonly', INPUT_BG)],
                  selectbackground=[('readonly', INPUT_BG)],
                  selectforeground=[('readonly', TEXT_COLOR)])
+        startup.mark("window setup")
 
         self.network = NetworkManager()
         self.current_user = None # {id, username}
         self.username = ""
+
+        # Scores, profiles and session (imports the old JSON files on first run)
+        user_dir = self.get_user_data_dir()
+        self.store = open_store(os.path.join(user_dir, "kelime_avcisi.db"), legacy_dir=user_dir)
+        self.scores = ScoreCache(self.store, limits={  # All score reads come from memory
+            period: config.get("game_settings", f"max_{period}_scores", default=limit)
+            for period, limit in DEFAULT_SCORE_LIMITS.items()
+        })
+        self.profiles = ProfileCache(self.store)  # Read once, updated on every save
+        self.player_stats = {}  # username -> PlayerStats, loaded from the profile on first use
         
         # Try to load session
         session = self.load_session()
@@ -913,45 +1007,53 @@ class WordGameApp:
             self.username = session.get('username', '')
 
         self.dictionary = {}
+        self.word_index = None
+        self.dictionary_loaded = False  # load_dictionary runs in the warm-up or on first use
+        self.pending_dictionary = None
+        self.pack_manager = None
         self.current_word_data = None
+        self.session_words = None  # Fixed word list for daily/code challenges, None for normal games
+        self.session_code = None
+        self.daily_fetch_pending = False
         self.levels = config.get("game_settings", "levels", default=[4, 5, 6, 7, 8, 9, 10])
         self.level_idx = 0
-        self.used_words = set()
+        
+        # No-repeat word decks (optionally remembered across sessions)
+        deck_state_path = None
+        if config.get("game_settings", "remember_used_words", default=True):
+            deck_state_path = os.path.join(self.get_user_data_dir(), "word_decks.json")
+        self.word_sampler = WordSampler(deck_state_path)
+        self.word_stats = WordStats(os.path.join(self.get_user_data_dir(), "word_stats.json"))
+        self.selector = None
+        self.telemetry = None
+        if config.get("features", "telemetry_enabled", default=True):
+            self.telemetry = TelemetryBatcher(self.network.send_telemetry,
+                                              os.path.join(self.get_user_data_dir(), "telemetry_queue.json"))
         
         # Scoring Factors
         self.total_score = 0
         self.potential_score = 0
-        self.revealed_indices = []
-        self.time_left = config.get("game_settings", "timer_duration", default=60)
-        self.timer_id = None
-        self.game_start_time = None
+        self.hidden_indices = []   # Unrevealed letter positions of the current word
+        self.display_slots = []    # Placeholder text, one slot per letter
+        self.hints_used = 0
+        self.round_timer = Countdown(self.root.after, self.root.after_cancel,
+                                     self.update_timer, self.handle_timeout)
+        self.game_clock = Stopwatch()  # Whole game, shown on the summary screen
         self.transitioning = False # State lock
         
-        # Initialize Audio
-        try:
-            if PYGAME_AVAILABLE and config.get("sounds", "enabled", default=True):
-                pygame.mixer.init()
-                self.sound_enabled = True
-            else:
-                self.sound_enabled = False
-            
-            self.sounds = {}
-            # Always call load_sounds to prepare MCI aliases for fallback
-            self.load_sounds()
-        except:
-            self.log_debug("Sound initialization issue")
-            # If pygame failed, we still want to try MCI if on Windows
-            self.sounds = {}
-            if os.name == 'nt':
-                self.load_sounds()
-            self.sound_enabled = False
-        
-        # Load dictionary
-        self.load_dictionary()
+        # Audio engine; its worker starts (and decodes the sounds) during the warm-up
+        self.load_sounds()
+        startup.mark("local data")
         
         # Main Container
-        self.container = tk.Frame(self.root, bg=BG_COLOR)
-        self.container.pack(expand=True, fill="both")
+        self.main_container = tk.Frame(self.root, bg=BG_COLOR)
+        self.main_container.pack(expand=True, fill="both")
+
+        # Screens draw into self.container, which is the active screen's page.
+        # Entry, leaderboard, profile and settings pages are kept and reused.
+        self.screens = ScreenManager(self.main_container, on_switch=lambda page: setattr(self, "container", page),
+                                     budget=config.get("display_settings", "screen_cache_budget", default=2000),
+                                     bg=BG_COLOR)
         
         # Global Error Handler
         self.root.report_callback_exception = self.handle_exception
@@ -959,11 +1061,45 @@ class WordGameApp:
         # Exit Handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        # Initial Cleanup
-        self.cleanup_scores()
-        
-        # Show Entry Screen
+        # Show Entry Screen first; everything else waits until it is on screen
         self.reset_game()
+        startup.mark("entry screen")
+        self.root.after_idle(self.start_warm_up)
+
+    def maximize(self):
+        try:
+            self.root.state('zoomed')  # Windows / macOS
+        except tk.TclError:
+            self.root.attributes('-zoomed', True)  # X11 (e.g. the startup benchmark's virtual display)
+
+    def start_warm_up(self):
+        """Runs after the first frame: deferred startup work, one step per event loop turn."""
+        startup.mark(FIRST_FRAME)
+        steps = [
+            ("audio", self.audio.start if self.audio.enabled else None),
+            ("dictionary", self.ensure_dictionary),
+            ("config update", config.update_from_github),  # Background thread
+            ("config migration", config.save_pending),
+            ("telemetry", self.telemetry.flush if self.telemetry else None),  # Anything left from the last session
+            ("score cleanup", self.cleanup_scores),
+        ]
+        steps = [(name, step) for name, step in steps if step]
+
+        def run(i=0):
+            if i == len(steps):
+                startup.mark(READY)
+                if startup.exit_when_ready:
+                    self.on_closing()  # Startup benchmark run
+                return
+            name, step = steps[i]
+            try:
+                step()
+            except Exception as e:
+                print(f"[STARTUP] {name} failed: {e}")
+            startup.mark(name)
+            self.root.after(1, run, i + 1)  # Let pending input through between steps
+
+        run()
 
     def create_modern_control_button(self, parent, type="close", cmd=None):
         """Creates a modern, transparent canvas-based window control button"""
@@ -1038,70 +1174,157 @@ class WordGameApp:
             self.close_btn_canvas = self.create_modern_control_button(self.win_controls_frame, type="close", cmd=on_close)
             self.close_btn_canvas.pack(side="left", padx=2)
             
-            def get_brightness(hex_color):
-                """Rough brightness calculation to determine icon color"""
-                if not hex_color or not hex_color.startswith("#"): return 255
-                try:
-                    hex_color = hex_color.lstrip('#')
-                    r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-                    return (r * 0.299 + g * 0.587 + b * 0.114)
-                except: return 255
-
-            def refresh_controls():
-                if hasattr(self, 'win_controls_frame') and self.win_controls_frame.winfo_exists():
-                    try:
-                        current_bg = BG_COLOR
-                        
-                        # PRIORITY 1: State-based hard fallbacks for full-bleed headers
-                        if self.current_screen == "game":
-                            current_bg = ACCENT_COLOR
-                        elif self.current_screen == "leaderboard":
-                            current_bg = DEFINITION_CARD_BG
-                        else:
-                            # PRIORITY 2: Intelligent background sampling
-                            sample_x = self.root.winfo_width() - self.s(120) 
-                            sample_y = self.s(10)
-                            widget = self.root.winfo_containing(sample_x, sample_y)
-                            if widget:
-                                 current_bg = widget.cget('bg')
-                        
-                        # Determine icon color based on brightness
-                        brightness = get_brightness(current_bg)
-                        icon_color = "white" if brightness < 150 else "#1e293b"
-                        
-                        if self.win_controls_frame.cget('bg') != current_bg or self.min_btn_canvas.icon_color != icon_color:
-                            self.win_controls_frame.config(bg=current_bg)
-                            self.min_btn_canvas.update_colors(current_bg, icon_color)
-                            self.close_btn_canvas.update_colors(current_bg, icon_color)
-                            
-                    except: pass
-                    
-                    self.win_controls_frame.lift()
-                    self.root.after(300, refresh_controls) # Slightly faster refresh
-            
-            refresh_controls()
+            self.update_window_controls()
             
         except Exception as e:
             print(f"Window controls error: {e}")
 
-    def load_dictionary(self):
+    # Background behind the top-right window controls, declared per screen.
+    # Screens not listed keep the plain background there.
+    WINDOW_CONTROL_BG = {
+        "game": ACCENT_COLOR,              # Stats strip
+        "leaderboard": DEFINITION_CARD_BG, # Header strip
+    }
+
+    @property
+    def current_screen(self):
+        return self.__dict__.get("_current_screen")
+
+    @current_screen.setter
+    def current_screen(self, name):
+        # Every screen sets this on entry, so it doubles as the screen-change event
+        self._current_screen = name
+        self.update_window_controls()
+
+    def update_window_controls(self):
+        """Recolors the window controls for the current screen (call on screen or theme change)."""
+        frame = getattr(self, 'win_controls_frame', None)
+        if frame is None or not frame.winfo_exists():
+            return
         try:
-            # 1. Try bundled resource path (standard PyInstaller location)
-            json_path = resource_path("sozluk.json")
+            current_bg = self.WINDOW_CONTROL_BG.get(self.current_screen, BG_COLOR)
             
-            # 2. Fallback: If not found in bundle, check next to the executable
-            if not os.path.exists(json_path):
-                json_path = os.path.join(os.path.dirname(sys.executable), "sozluk.json")
+            # Determine icon color based on brightness
+            icon_color = "white" if self.get_brightness(current_bg) < 150 else "#1e293b"
             
-            # 3. Last Resort: Current working directory
-            if not os.path.exists(json_path):
-                json_path = os.path.join(os.getcwd(), "sozluk.json")
+            if frame.cget('bg') != current_bg or self.min_btn_canvas.icon_color != icon_color:
+                frame.config(bg=current_bg)
+                self.min_btn_canvas.update_colors(current_bg, icon_color)
+                self.close_btn_canvas.update_colors(current_bg, icon_color)
+            frame.lift()
+        except Exception as e:
+            print(f"Window controls error: {e}")
 
-            with open(json_path, "r", encoding="utf-8") as f:
-                self.dictionary = json.load(f)
+    @staticmethod
+    def get_brightness(hex_color):
+        """Rough brightness calculation to determine icon color"""
+        if not hex_color or not hex_color.startswith("#"): return 255
+        try:
+            hex_color = hex_color.lstrip('#')
+            r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+            return (r * 0.299 + g * 0.587 + b * 0.114)
+        except: return 255
+
+    def find_data_file(self, filename):
+        """Locates a bundled data file (bundle, next to the executable, then CWD)."""
+        # 1. Try bundled resource path (standard PyInstaller location)
+        path = resource_path(filename)
+
+        # 2. Fallback: If not found in bundle, check next to the executable
+        if not os.path.exists(path):
+            path = os.path.join(os.path.dirname(sys.executable), filename)
+
+        # 3. Last Resort: Current working directory
+        if not os.path.exists(path):
+            path = os.path.join(os.getcwd(), filename)
+        return path
+
+    def ensure_dictionary(self):
+        """Loads the dictionary unless the warm-up already has (a game can start before it)."""
+        if self.dictionary_loaded:
+            return
+        self.dictionary_loaded = True
+        self.load_dictionary()
+        self.start_pack_update()
+
+    def load_dictionary(self):
+        # Downloaded dictionary packs take precedence over the bundled files
+        self.pending_dictionary = None
+        self.pack_manager = None
+        try:
+            self.pack_manager = PackManager(os.path.join(self.get_user_data_dir(), "packs"))
+            self.pack_manager.prune()
+            pack_path = self.pack_manager.compiled_path()
+            while pack_path:
+                try:
+                    self._attach_dictionary(CompiledDictionary(pack_path))
+                    print(f"[PACK] Using dictionary pack v{self.pack_manager.current_version}")
+                    return
+                except Exception as e:
+                    print(f"[PACK] Pack unusable, rolling back: {e}")
+                    pack_path = self.pack_manager.rollback()
         except Exception as e:
-            messagebox.showerror("Hata", f"sozluk.json yüklenemedi.\nAranan Yol: {json_path}\nHata: {e}")
+            print(f"[PACK] Pack store unavailable: {e}")
+
+        json_path = self.find_data_file("sozluk.json")
+        bin_path = self.find_data_file("sozluk.bin")
+
+        # Prefer the compiled dictionary unless the JSON source is newer
+        if os.path.exists(bin_path):
+            try:
+                if not os.path.exists(json_path) or os.path.getmtime(bin_path) >= os.path.getmtime(json_path):
+                    self._attach_dictionary(CompiledDictionary(bin_path))
+                    return
+            except Exception as e:
+                print(f"[DICT] Compiled dictionary unusable, falling back to JSON: {e}")
+
+        # Parse the JSON in the background; levels become available as they are decoded
+        if not os.path.exists(json_path):
+            messagebox.showerror("Hata", f"sozluk.json yüklenemedi.\nAranan Yol: {json_path}")
             self.root.destroy()
+            return
+        self._attach_dictionary(StreamingDictionary(json_path))
+
+    def _attach_dictionary(self, dictionary):
+        old_selector, old_dictionary = self.selector, self.dictionary
+        self.dictionary = dictionary
+        self.word_index = WordIndex(dictionary)
+        self.selector = AdaptiveSelector(dictionary, self.word_stats, sampler=self.word_sampler)
+        if old_selector:
+            self.selector.target = old_selector.target  # Keep the player's level across a pack swap
+        # Release the replaced file's mmap; decoded levels still in use stay valid
+        if isinstance(old_dictionary, CompiledDictionary) and old_dictionary is not dictionary:
+            old_dictionary.close()
+
+    def start_pack_update(self):
+        """Checks for a newer dictionary pack on a background thread."""
+        url = config.get("update_check", "dictionary_pack_url", default="")
+        if not url or not self.pack_manager or not config.get("update_check", "enabled", default=True):
+            return
+
+        def worker():
+            try:
+                path = self.pack_manager.update(url)
+                if path:
+                    dictionary = CompiledDictionary(path)
+                    # Decode the first level here so the swap itself costs nothing
+                    if self.levels:
+                        dictionary.get(f"{self.levels[0]}_harf")
+                    self.pending_dictionary = dictionary
+            except Exception as e:
+                print(f"[PACK] Update failed, keeping current dictionary: {e}")
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def apply_pending_dictionary(self):
+        """Swaps in a freshly downloaded pack; only called between rounds."""
+        dictionary, self.pending_dictionary = self.pending_dictionary, None
+        if dictionary is None:
+            return
+        # _attach_dictionary closes the old one; index builds still running on it
+        # get empty levels, and their WordIndex is discarded with it
+        self._attach_dictionary(dictionary)
+        self.log_debug("apply_pending_dictionary: Dictionary pack swapped in.")
 
     def handle_exception(self, exc_type, exc_value, exc_traceback):
         error_msg = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
@@ -1109,9 +1332,8 @@ class WordGameApp:
 
     def clear_container(self):
         try:
-            # Efficiently destroy all children
-            for widget in self.container.winfo_children():
-                widget.destroy()
+            # Switch to the (emptied) page shared by screens that are rebuilt on every visit
+            self.screens.show_scratch()
             # Removed update_idletasks to avoid stutter during rapid transitions
         except:
             pass
@@ -1143,39 +1365,49 @@ class WordGameApp:
         canvas.is_enabled = True
         canvas.state = "normal" # normal, hover, pressed
 
+        canvas_height = height + self.s(10)
+        canvas.text_item = None
+        canvas.bg_item = None
+
         def render():
-            canvas.delete("all")
-            offset_y = 5 
-            shadow_offset = 8
-            
+            state = canvas.state if canvas.is_enabled else "disabled"
             if not canvas.is_enabled:
                 btn_color = INPUT_BG
                 text_color = SUB_TEXT_COLOR
-            elif canvas.state == "hover":
-                offset_y = 2 
-                shadow_offset = 10
-                # Preserve original colors but apply the 'lift' effect for interaction
-                btn_color = canvas.button_bg
-                text_color = canvas.button_fg
-            elif canvas.state == "pressed":
-                offset_y = 8 
-                shadow_offset = 5
-                btn_color = canvas.button_bg
-                text_color = canvas.button_fg
             else:
-                offset_y = 5
-                shadow_offset = 8
+                # Hover/press keep the original colors and only lift/sink the button
                 btn_color = canvas.button_bg
                 text_color = canvas.button_fg
-
-            shadow_color = "#0f172a" 
-            self.draw_rounded_rect(canvas, 2, shadow_offset, width-2, height, radius, shadow_color, tag="shadow")
-            self.draw_rounded_rect(canvas, 0, offset_y, width, height, radius, btn_color, tag="btn_shape")
-            
-            if canvas.state == "hover" and radius > 0:
-                canvas.create_oval(10, offset_y + 5, width-10, offset_y + 15, fill="white", stipple="gray25", outline="")
-
-            canvas.create_text(width/2, height/2 + offset_y, text=canvas.text_val, fill=text_color, font=(self.font_main, font_size, "bold"), tag="btn_text")
+            offset_y = BUTTON_OFFSETS[state][0]
+
+            # Background: one cached image per look, swapped in place
+            image = self.button_images.get(width, height, canvas_height, radius, btn_color, state, self.scale_factor)
+            if image is not None:
+                canvas.bg_image = image  # Keep a reference while shown
+                if canvas.bg_item is None:
+                    canvas.bg_item = canvas.create_image(0, 0, image=image, anchor="nw")
+                else:
+                    canvas.itemconfigure(canvas.bg_item, image=image)
+            else:
+                # Canvas fallback: draw each look once, then only show/hide it
+                look = f"look_{state}_{btn_color.lstrip('#')}"
+                if not canvas.find_withtag(look):
+                    shadow_offset = BUTTON_OFFSETS[state][1]
+                    self.draw_rounded_rect(canvas, 2, shadow_offset, width-2, height, radius, "#0f172a", tag=(look, "look"))
+                    self.draw_rounded_rect(canvas, 0, offset_y, width, height, radius, btn_color, tag=(look, "look"))
+                    if state == "hover" and radius > 0:
+                        canvas.create_oval(10, offset_y + 5, width-10, offset_y + 15, fill="white", stipple="gray25",
+                                           outline="", tags=(look, "look"))
+                canvas.itemconfigure("look", state="hidden")
+                canvas.itemconfigure(look, state="normal")
+
+            if canvas.text_item is None:
+                canvas.text_item = canvas.create_text(width/2, height/2 + offset_y, text=canvas.text_val, fill=text_color,
+                                                      font=(self.font_main, font_size, "bold"), tag="btn_text")
+            else:
+                canvas.coords(canvas.text_item, width/2, height/2 + offset_y)
+                canvas.itemconfigure(canvas.text_item, text=canvas.text_val, fill=text_color)
+            canvas.tag_raise(canvas.text_item)
 
 
         canvas.last_props = None
@@ -1235,7 +1467,10 @@ class WordGameApp:
         return canvas
 
     def show_entry_screen(self):
-        self.clear_container()
+        self.current_screen = "entry"
+        # Layout depends on who is logged in; otherwise the built screen is reused
+        if self.screens.show("entry", state=self.current_user['username'] if self.current_user else None):
+            return
         frame = tk.Frame(self.container, bg=BG_COLOR)
         frame.place(relx=0.5, rely=0.5, anchor="center", relwidth=1.0)
         
@@ -1344,12 +1579,23 @@ class WordGameApp:
             
             # Rank (Next to username, No Icon)
             stats = self.get_user_stats(self.current_user['username'])
-            tk.Label(id_frame, text=stats['rank'], 
+            rank_label = tk.Label(id_frame, text=stats['rank'], 
                      font=(self.font_main, self.s(12), "bold"), 
-                     fg="#fbbf24", bg=BG_COLOR).pack(side="left", padx=(10, 0))
+                     fg="#fbbf24", bg=BG_COLOR)
+            rank_label.pack(side="left", padx=(10, 0))
+            self.screens.on_show(lambda: rank_label.config(
+                text=self.get_user_stats(self.current_user['username'])['rank']))
             
             self.create_rounded_button(frame, "OYUNA BAŞLA", self.start_game_as_user, 
                                      width=280, height=60, bg=ACCENT_COLOR, fg=BG_COLOR).pack(pady=self.s(20))
+
+            # Shared challenges: same words for everyone with the same code
+            challenge_frame = tk.Frame(frame, bg=BG_COLOR)
+            challenge_frame.pack()
+            self.create_rounded_button(challenge_frame, "GÜNÜN KELİMELERİ", self.start_daily_challenge, 
+                                     width=220, height=45, bg="#db2777", fg="white", font_size=11).pack(side="left", padx=10)
+            self.create_rounded_button(challenge_frame, "KOD İLE OYNA", self.start_code_challenge, 
+                                     width=180, height=45, bg=BG_COLOR, fg=SUB_TEXT_COLOR, radius=15, font_size=11).pack(side="left", padx=10)
                                      
             # Removed "ÇIKIŞ YAP" button as per user request
                                      
@@ -1809,15 +2055,10 @@ class WordGameApp:
         # Get list of previously registered schools from profiles
         schools_set = set()
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "profiles.json")
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    all_profiles = json.load(f)
-                    for username, profile in all_profiles.items():
-                        school = profile.get("school", "").strip()
-                        if school and school != "-":
-                            schools_set.add(school)
+            for profile in self.profiles.all().values():
+                school = profile.get("school", "").strip()
+                if school and school != "-":
+                    schools_set.add(school)
         except:
             pass
         
@@ -1906,7 +2147,49 @@ class WordGameApp:
         self.username = self.current_user['username']
         self._reset_game_state()
         self.show_game_screen()
-        self.game_start_time = time.time()
+        self.game_clock.start()
+
+    def start_daily_challenge(self):
+        # The server caches one challenge per day; generate locally if it is unreachable.
+        # Fetched off the Tk thread: an unreachable server can take several timeouts.
+        if self.daily_fetch_pending:
+            return
+        self.daily_fetch_pending = True
+        screen = self.current_screen
+
+        def fetch():
+            res = self.network.get_daily_challenge()
+            self.root.after(0, lambda: finish(res))
+
+        def finish(res):
+            self.daily_fetch_pending = False
+            if self.current_screen != screen:
+                return  # The player moved on while we waited
+            if res and res.get("day") == daily_code():
+                self.start_session(res["code"], entries_from_payload(res))
+            else:
+                self.log_debug("start_daily_challenge: Server unavailable, generating locally.")
+                self.start_session(daily_code())
+
+        threading.Thread(target=fetch, daemon=True).start()
+
+    def start_code_challenge(self):
+        code = simpledialog.askstring("Kod ile Oyna", "Arkadaşınızla paylaştığınız oyun kodunu girin:", parent=self.root)
+        if code and normalise_code(code):
+            self.start_session(code)
+
+    def start_session(self, code, entries=None):
+        """Starts a game whose words are fixed in advance by ``code``."""
+        if entries is None:
+            self.ensure_dictionary()
+            entries = generate_session(self.word_index, self.levels, code)
+        self.username = self.current_user['username']
+        self._reset_game_state()
+        self.session_code = normalise_code(code)
+        self.session_words = entries
+        self.log_debug(f"start_session: Code {self.session_code}, {len(entries)} words")
+        self.show_game_screen()
+        self.game_clock.start()
         
     def entry_focus_in(self, entry, placeholder):
         if entry.get() == placeholder:
@@ -1946,7 +2229,7 @@ class WordGameApp:
         gh_lbl = tk.Label(frame, text="www.github.com/Okan707", font=(self.font_main, self.s(24), "bold"), 
                  fg=ACCENT_COLOR, bg=BG_COLOR, cursor="hand2")
         gh_lbl.pack(pady=(0, self.s(20)))
-        gh_lbl.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/Okan707"))
+        gh_lbl.bind("<Button-1>", lambda e: open_url("https://github.com/Okan707"))
 
             
         # Back Button (Matching leaderboard style and position)
@@ -2014,7 +2297,8 @@ class WordGameApp:
 
     def show_settings_menu(self):
         self.current_screen = "settings"
-        self.clear_container()
+        if self.screens.show("settings"):
+            return
         
         # Center Container (Card Style)
         # Using theme-aware CARD_COLOR for the card effect
@@ -2051,7 +2335,14 @@ class WordGameApp:
         tk.Label(inner_frame, text="Arayüz Ölçeği:", font=(self.font_main, self.s(16)), 
                  fg=SUB_TEXT_COLOR, bg=card_bg).grid(row=3, column=0, sticky="w", pady=10)
                  
-        scale_var = tk.DoubleVar(value=self.scale_factor)
+        def saved_scale():
+            # The manual scale from config (it may differ from the running one until a restart)
+            try:
+                return float(config.get("display_settings", "custom_scale", default=None))
+            except (TypeError, ValueError):
+                return self.scale_factor
+
+        scale_var = tk.DoubleVar(value=saved_scale())
         # Scale Container for alignment
         scale_frame = tk.Frame(inner_frame, bg=card_bg)
         scale_frame.grid(row=3, column=1, sticky="e", pady=10)
@@ -2083,14 +2374,13 @@ class WordGameApp:
         }
         reverse_res_options = {v: k for k, v in res_options.items()}
         
-        current_res = config.get("display_settings", "resolution")
-        is_full = config.get("display_settings", "fullscreen")
-        init_res_val = "Tam Ekran"
-        if not is_full and current_res in reverse_res_options:
-            init_res_val = reverse_res_options[current_res]
+        def saved_res_name():
+            if config.get("display_settings", "fullscreen"):
+                return "Tam Ekran"
+            return reverse_res_options.get(config.get("display_settings", "resolution"), "Tam Ekran")
             
         res_dropdown = ttk.Combobox(inner_frame, values=list(res_options.keys()), state="readonly", font=(self.font_main, self.s(12)), width=18)
-        res_dropdown.set(init_res_val)
+        res_dropdown.set(saved_res_name())
         res_dropdown.grid(row=4, column=1, sticky="e", pady=10) # Right Aligned
 
         # Theme Mode
@@ -2099,10 +2389,11 @@ class WordGameApp:
                  
         theme_options = {"Karanlık": "dark", "Aydınlık": "light"}
         reverse_theme_options = {v: k for k, v in theme_options.items()}
-        current_theme = config.get("display_settings", "theme", default="dark")
+        def saved_theme_name():
+            return reverse_theme_options.get(config.get("display_settings", "theme", default="dark"), "Karanlık")
         
         theme_dropdown = ttk.Combobox(inner_frame, values=list(theme_options.keys()), state="readonly", font=(self.font_main, self.s(12)), width=18)
-        theme_dropdown.set(reverse_theme_options.get(current_theme, "Karanlık"))
+        theme_dropdown.set(saved_theme_name())
         theme_dropdown.grid(row=5, column=1, sticky="e", pady=10) # Right Aligned
 
         # --- Section 2: OYUN & SES ---
@@ -2142,9 +2433,14 @@ class WordGameApp:
         s_text.bind("<Button-1>", lambda e: toggle_s())
         
         # Init state
-        if not sound_var.get():
-            s_icon.config(text="🔇", fg=SUB_TEXT_COLOR)
-            s_text.config(text="KAPALI", fg="#ef4444")
+        def show_sound_state():
+            if sound_var.get():
+                s_icon.config(text="🔊", fg=TEXT_COLOR)
+                s_text.config(text="AÇIK", fg="#22c55e")
+            else:
+                s_icon.config(text="🔇", fg=SUB_TEXT_COLOR)
+                s_text.config(text="KAPALI", fg="#ef4444")
+        show_sound_state()
 
         # Timer
         tk.Label(inner_frame, text="Süre (Saniye):", font=(self.font_main, self.s(16)), 
@@ -2156,29 +2452,53 @@ class WordGameApp:
         timer_combo.set(timer_var.get())
         timer_combo.grid(row=9, column=1, sticky="e", pady=10) # Right Aligned
 
+        # Typo tolerance (lenient_matching + max_typos)
+        tk.Label(inner_frame, text="Yazım Toleransı:", font=(self.font_main, self.s(16)), 
+                 fg=SUB_TEXT_COLOR, bg=card_bg).grid(row=10, column=0, sticky="w", pady=10)
+
+        typo_options = {"Kapalı": 0, "1 Harf": 1, "2 Harf": 2}
+        def saved_typo_name():
+            typos = config.get("game_settings", "max_typos", default=1) if config.get("game_settings", "lenient_matching", default=False) else 0
+            return {v: k for k, v in typo_options.items()}.get(typos, "Kapalı")
+        typo_combo = ttk.Combobox(inner_frame, values=list(typo_options.keys()), state="readonly", font=(self.font_main, self.s(12)), width=18)
+        typo_combo.set(saved_typo_name())
+        typo_combo.grid(row=10, column=1, sticky="e", pady=10) # Right Aligned
+
+        # The page is reused, so discard unsaved edits whenever it is shown again.
+        # Every field is re-read from config: a save without restart changes it.
+        def reset_fields():
+            scale_var.set(saved_scale())
+            res_dropdown.set(saved_res_name())
+            theme_dropdown.set(saved_theme_name())
+            sound_var.set(config.get("sounds", "enabled", default=True))
+            show_sound_state()
+            timer_combo.set(config.get("game_settings", "timer_duration", default=60))
+            typo_combo.set(saved_typo_name())
+        self.screens.on_show(reset_fields)
+
         # --- Section 3: SİSTEM ---
         tk.Label(inner_frame, text="SİSTEM", font=(self.font_main, self.s(14), "bold"), 
-                 fg=ACCENT_COLOR, bg=card_bg).grid(row=10, column=0, sticky="w", pady=(20, 5))
-        tk.Frame(inner_frame, height=2, bg=ACCENT_COLOR).grid(row=11, column=0, columnspan=2, sticky="ew", pady=(0, 15))
+                 fg=ACCENT_COLOR, bg=card_bg).grid(row=11, column=0, sticky="w", pady=(20, 5))
+        tk.Frame(inner_frame, height=2, bg=ACCENT_COLOR).grid(row=12, column=0, columnspan=2, sticky="ew", pady=(0, 15))
 
         # Update Check
         tk.Label(inner_frame, text="Versiyon:", font=(self.font_main, self.s(16)), 
-                 fg=SUB_TEXT_COLOR, bg=card_bg).grid(row=12, column=0, sticky="w", pady=10)
+                 fg=SUB_TEXT_COLOR, bg=card_bg).grid(row=13, column=0, sticky="w", pady=10)
         
         tk.Label(inner_frame, text=config.get("version", default="1.4"), font=(self.font_main, self.s(16), "bold"), 
-                 fg=TEXT_COLOR, bg=card_bg).grid(row=12, column=1, sticky="e", pady=10)
+                 fg=TEXT_COLOR, bg=card_bg).grid(row=13, column=1, sticky="e", pady=10)
         
         # GitHub Link Row (User Request: Text + Button)
         # GitHub Link Row (User Request: Split Alignment)
         # Left Text
         tk.Label(inner_frame, text="Güncelleştirmeyi elle kontrol etmek için", 
                  font=(self.font_main, self.s(12)), fg=SUB_TEXT_COLOR, bg=card_bg)\
-                 .grid(row=13, column=0, sticky="w", pady=(10, 30))
+                 .grid(row=14, column=0, sticky="w", pady=(10, 30))
                  
         # Right Button
-        self.create_rounded_button(inner_frame, "TIKLAYINIZ", lambda: webbrowser.open("https://github.com/Okan707/Kelime_Avcisi"),
+        self.create_rounded_button(inner_frame, "TIKLAYINIZ", lambda: open_url("https://github.com/Okan707/Kelime_Avcisi"),
                                  width=120, height=35, bg=ACCENT_COLOR, fg=BG_COLOR, radius=10, font_size=10)\
-                                 .grid(row=13, column=1, sticky="e", pady=(10, 30))
+                                 .grid(row=14, column=1, sticky="e", pady=(10, 30))
 
         
         # --- FOOTER ACTIONS ---
@@ -2194,9 +2514,14 @@ class WordGameApp:
             config.config["display_settings"]["fullscreen"] = full
             config.config["display_settings"]["theme"] = theme_options.get(theme_dropdown.get(), "dark")
             config.config["sounds"]["enabled"] = sound_var.get()
+            self.audio.configure(enabled=sound_var.get(), volumes=self.sound_volumes())
             try:
                 config.config["game_settings"]["timer_duration"] = int(timer_combo.get())
             except: pass
+            typos = typo_options.get(typo_combo.get(), 0)
+            config.config["game_settings"]["lenient_matching"] = typos > 0
+            if typos:
+                config.config["game_settings"]["max_typos"] = typos
             
             # Save
             appdata_dir = os.path.join(os.getenv('APPDATA', os.path.expanduser('~')), 'KelimeOyunu')
@@ -2214,6 +2539,7 @@ class WordGameApp:
                     application_path = os.getcwd()
                     exe_path = sys.executable
 
+                import subprocess
                 # FIX: restart using subprocess with sanitized environment
                 # This prevents the new process from inheriting the dying _MEI folder path
                 
@@ -2243,9 +2569,9 @@ class WordGameApp:
                 os._exit(0)
 
         action_frame = tk.Frame(inner_frame, bg=card_bg)
-        # Moved to row=14 to avoid collision with GitHub link at row=13
+        # Moved to row=15 to avoid collision with GitHub link at row=14
         # Increased pady to (60, 20) to push it down further as requested
-        action_frame.grid(row=14, column=0, columnspan=2, pady=(60, 20))
+        action_frame.grid(row=15, column=0, columnspan=2, pady=(60, 20))
         
         self.create_rounded_button(action_frame, "KAYDET VE BAŞLAT", save, width=220, height=50, bg="#22c55e", fg="white", font_size=12).pack(side="left", padx=10)
         self.create_rounded_button(action_frame, "İPTAL", self.show_entry_screen, width=120, height=50, bg="#64748b", fg="white", font_size=12).pack(side="left", padx=10)
@@ -2253,52 +2579,20 @@ class WordGameApp:
         # Ensure scrollregion is updated
         self.root.after(100, scroll.update_scroll)
 
-    def get_short_path_name(self, long_name):
-        """Gets the short path name of a file system path for MCI compatibility."""
-        if os.name != 'nt': return long_name
-        try:
-            output_buf_size = 0
-            while True:
-                output_buf = ctypes.create_unicode_buffer(output_buf_size)
-                needed = ctypes.windll.kernel32.GetShortPathNameW(long_name, output_buf, output_buf_size)
-                if output_buf_size >= needed:
-                    return output_buf.value
-                output_buf_size = needed
-        except:
-            return long_name
-
     def load_sounds(self):
-        try:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            # Get sound files from config
-            sound_files = {
-                "correct": config.get("sounds", "correct", default="button-pressed-38129.mp3"),
-                "wrong": config.get("sounds", "wrong", default="click-buttons-ui-menu-sounds-effects-button-7-203601.mp3"),
-                "next": config.get("sounds", "next", default="mech-keyboard-02-102918.mp3")
-            }
-            for key, filename in sound_files.items():
-                path = resource_path(filename)
-                if os.path.exists(path):
-                    # print(f"DEBUG: Found sound file: {path}")
-                    if self.sound_enabled:
-                        self.sounds[key] = pygame.mixer.Sound(path)
-                    
-                    if os.name == 'nt':
-                        try:
-                            # Use short paths for MCI to avoid issues with spaces or unicode
-                            short_path = self.get_short_path_name(path)
-                            alias = f"game_{key}"
-                            ctypes.windll.winmm.mciSendStringW(f'close {alias}', None, 0, 0) # Close if already open
-                            cmd = f'open "{short_path}" alias {alias}' # Use quotes for path
-                            ctypes.windll.winmm.mciSendStringW(cmd, None, 0, 0)
-                        except Exception as mci_e:
-                            self.log_debug(f"MCI open error for {key}: {mci_e}")
-                            # If MCI fails, ensure pygame is still the primary method if enabled
-                            if self.sound_enabled and key not in self.sounds:
-                                self.sounds[key] = pygame.mixer.Sound(path)
-        except Exception as e:
-            self.log_debug(f"Error pre-loading sounds: {e}")
-            self.sound_enabled = False
+        sound_files = {
+            "correct": config.get("sounds", "correct", default="button-pressed-38129.mp3"),
+            "wrong": config.get("sounds", "wrong", default="click-buttons-ui-menu-sounds-effects-button-7-203601.mp3"),
+            "next": config.get("sounds", "next", default="mech-keyboard-02-102918.mp3")
+        }
+        self.audio = AudioEngine(
+            {key: resource_path(filename) for key, filename in sound_files.items()},
+            volumes=self.sound_volumes(),
+            enabled=config.get("sounds", "enabled", default=True),
+            channels=config.get("sounds", "channels", default=4))
+
+    def sound_volumes(self):
+        return {key: config.get("sounds", f"volume_{key}", default=1.0) for key in ("correct", "wrong", "next")}
 
     def log_debug(self, msg):
         # Disabled for performance. Re-enable only for troubleshooting.
@@ -2307,6 +2601,7 @@ class WordGameApp:
     def check_updates(self):
         """Handler for manual update check button"""
         # Show loading screen
+        self.current_screen = "update"
         self.clear_container()
         tk.Label(self.container, text="GÜNCELLEŞTİRMELER KONTROL EDİLİYOR...", font=(self.font_main, self.s(36), "bold"), 
                  fg=ACCENT_COLOR, bg=BG_COLOR).place(relx=0.5, rely=0.5, anchor="center")
@@ -2321,6 +2616,7 @@ class WordGameApp:
     def start_full_update(self):
         """Starts the full download and apply process"""
         # Show a "Downloading..." overlay or message
+        self.current_screen = "update"
         self.clear_container()
         tk.Label(self.container, text="GÜNCELLEŞTİRME İNDİRİLİYOR...", font=(self.font_main, self.s(36), "bold"), 
                  fg=ACCENT_COLOR, bg=BG_COLOR).place(relx=0.5, rely=0.4, anchor="center")
@@ -2336,6 +2632,7 @@ class WordGameApp:
 
     def show_update_screen(self, result):
         """Show update check result in a full screen page"""
+        self.current_screen = "update"
         self.clear_container()
         frame = tk.Frame(self.container, bg=BG_COLOR)
         frame.place(relx=0.5, rely=0.5, anchor="center", relwidth=1.0)
@@ -2417,7 +2714,7 @@ class WordGameApp:
             self._reset_game_state() # Fresh start for every player
             self.transitioning = True
             self.username = self.tr_upper(name)  # Force uppercase
-            self.game_start_time = time.time()
+            self.game_clock.start()
             self.show_game_screen()
             self.transitioning = False
             self.log_debug("handle_start: Completed successfully.")
@@ -2428,6 +2725,19 @@ class WordGameApp:
             messagebox.showerror("Hata", f"Ciddi bir hata oluştu:\n{error_msg}")
 
     def show_game_screen(self):
+        self.ensure_dictionary()
+        # Wait for the first level only if the background loader has not reached it yet
+        first_key = f"{self.levels[0]}_harf" if self.levels else None
+        if first_key and not self.dictionary.is_level_ready(first_key):
+            self.show_dictionary_loading()
+            self.root.after(50, self.show_game_screen)
+            return
+
+        if getattr(self.dictionary, "error", None) and not self.dictionary:
+            messagebox.showerror("Hata", f"sozluk.json yüklenemedi.\nHata: {self.dictionary.error}")
+            self.show_entry_screen()
+            return
+
         self.current_screen = "game"
         self.log_debug("show_game_screen: Starting...")
         self.clear_container()
@@ -2491,12 +2801,17 @@ class WordGameApp:
         # Placeholder
         self.placeholder_label = tk.Label(self.content_center, text="", font=(self.font_main, self.s(88), "bold"), fg=ACCENT_COLOR, bg=BG_COLOR)
         self.placeholder_label.pack(pady=self.s(20))
+
+        # Scrambled letters (hint_mode == "scramble")
+        self.scramble_label = tk.Label(self.content_center, text="", font=(self.font_main, self.s(28), "bold"), fg=SUB_TEXT_COLOR, bg=BG_COLOR)
+        self.scramble_label.pack()
         
         # Answer Entry - Stretched full width
         self.ans_entry = tk.Entry(self.content_center, font=(self.font_main, self.s(20)), bg=INPUT_BG, fg=TEXT_COLOR, relief="flat", justify="center")
         self.ans_entry.pack(pady=self.s(10), ipady=self.s(12), fill="x")
 
         self.ans_entry.bind("<Return>", self.handle_enter_key)
+        self.ans_entry.bind("<KeyRelease>", self.on_answer_typed)
         self.ans_entry.focus_set()
 
         # Global Return binding for cases where focus is not in entry but next/finish is enabled
@@ -2537,32 +2852,75 @@ class WordGameApp:
         
         self.next_question()
 
+    def show_dictionary_loading(self):
+        if getattr(self, 'current_screen', None) == "dictionary_loading":
+            return
+        self.current_screen = "dictionary_loading"
+        self.clear_container()
+        tk.Label(self.container, text="SÖZLÜK YÜKLENİYOR...", font=(self.font_main, self.s(36), "bold"), 
+                 fg=ACCENT_COLOR, bg=BG_COLOR).place(relx=0.5, rely=0.5, anchor="center")
+
     def handle_back(self):
         self._reset_game_state()
         self.show_entry_screen()
 
+    def record_round(self, outcome):
+        """Feeds the round outcome (SOLVED/TIMEOUT/REVEALED) to word stats, the selector and telemetry."""
+        if self.current_word_data is None:
+            return
+        entry = self.current_word_data
+        duration = self.round_timer.duration or 60
+        elapsed = self.round_timer.elapsed
+        if self.selector:
+            self.selector.record(entry, outcome == SOLVED, elapsed / duration, self.hints_used)
+        if self.telemetry:
+            self.telemetry.add(make_event(entry.canonical, entry.length, outcome,
+                                          self.hints_used, elapsed * 1000, duration))
+        if self.username:
+            self.get_player_stats(self.username).record_round(outcome, self.hints_used, elapsed * 1000)
+
+    def reveal_letter(self, idx):
+        self.display_slots[idx] = self.current_word_data.canonical[idx]
+
+    def reveal_all_letters(self):
+        self.display_slots = list(self.current_word_data.canonical)
+        self.hidden_indices = []
+
     def get_hint(self):
         # Sound is already played by the button click
-        word = self.current_word_data['kelime']
-        hidden_indices = [i for i in range(len(word)) if i not in self.revealed_indices]
+        hidden = self.hidden_indices
+
+        # Scramble mode: the first hint shows all letters shuffled, later ones reveal letters
+        if (config.get("game_settings", "hint_mode", default="letter") == "scramble"
+                and not self.scramble_shown and hidden and self.potential_score > 0):
+            level_index = self.word_index.level(f"{self.current_word_data.length}_harf")
+            self.scramble_label.config(text=" ".join(level_index.scramble(self.current_word_data)))
+            self.scramble_shown = True
+            self.hints_used += 1
+            self.potential_score = max(0, self.potential_score - 25)
+            self.update_ui()
+            return
         
-        if hidden_indices and self.potential_score > 0:
-            idx = random.choice(hidden_indices)
-            self.revealed_indices.append(idx)
+        if hidden and self.potential_score > 0:
+            # Swap-remove a random hidden position
+            pick = random.randrange(len(hidden))
+            hidden[pick], hidden[-1] = hidden[-1], hidden[pick]
+            self.reveal_letter(hidden.pop())
+            self.hints_used += 1
             
             # KURAL: Her harf istemi -25 puan (Taban)
             self.potential_score = max(0, self.potential_score - 25)
                 
             # KURAL: Tüm harfler açıldığında puan 0 olur.
-            if not [i for i in range(len(word)) if i not in self.revealed_indices]:
+            if not hidden:
                 self.potential_score = 0
                 
             self.update_ui()
             
             # Check if all letters revealed (0 points left)
-            if not [i for i in range(len(word)) if i not in self.revealed_indices]:
-                if self.timer_id:
-                    self.root.after_cancel(self.timer_id)
+            if not hidden:
+                self.round_timer.stop()
+                self.record_round(REVEALED)
                 self.hint_btn.set_state("disabled")
                 self.submit_btn.set_state("disabled")
                 
@@ -2579,22 +2937,20 @@ class WordGameApp:
     def update_ui(self):
         if not hasattr(self, 'placeholder_label'):
             return
-        word = self.current_word_data['kelime']
-        display = ""
-        for i, char in enumerate(word):
-            if i in self.revealed_indices:
-                display += char + " "
-            else:
-                display += "_ "
-        self.placeholder_label.config(text=display.strip())
+        self.placeholder_label.config(text=" ".join(self.display_slots))
         self.pot_score_label.config(text=str(self.potential_score))
         self.total_score_label.config(text=str(self.total_score))
 
     def next_question(self):
         self.log_debug("next_question: Starting...")
+        self.apply_pending_dictionary()
         # Sound omitted here as it's typically triggered by a button click
         if self.level_idx >= len(self.levels):
             self.log_debug("next_question: Game finished, showing summary.")
+            self.word_sampler.save()
+            self.word_stats.save()
+            if self.telemetry:
+                self.telemetry.flush()
             self.show_summary_screen()
             return
 
@@ -2606,17 +2962,21 @@ class WordGameApp:
             messagebox.showerror("Hata", "Sözlük verisi yüklenemedi!")
             return
 
-        available_words = [w for w in self.dictionary.get(cat_key, []) if w.get('kelime') not in self.used_words]
-        self.log_debug(f"next_question: Found {len(available_words)} available words")
+        if self.session_words is not None:
+            # Challenge games play their precomputed list in order
+            word_data = self.session_words[self.level_idx] if self.level_idx < len(self.session_words) else None
+        elif config.get("game_settings", "adaptive_difficulty", default=True):
+            word_data = self.selector.draw(cat_key)
+        else:
+            word_data = self.word_sampler.draw(cat_key, self.dictionary.get(cat_key, []))
         
-        if not available_words:
+        if word_data is None:
             # Fallback if a category is somehow empty
             self.level_idx += 1
             self.next_question()
             return
 
-        self.current_word_data = random.choice(available_words)
-        self.used_words.add(self.current_word_data['kelime'])
+        self.current_word_data = word_data
         
         # Yeni Puanlama Sistemi:
         # 4 harfli: 100, 5 harfli: 125, 6 harfli: 150... 10 harfli: 250
@@ -2628,10 +2988,20 @@ class WordGameApp:
         elif duration == 45:
             multiplier = 1.5
             
-        word_len = len(self.current_word_data['kelime'])
+        word_len = self.current_word_data.length
         self.potential_score = word_len * 25
         
-        self.revealed_indices = []
+        self.hidden_indices = list(range(word_len))
+        self.display_slots = ["_"] * word_len
+        self.hints_used = 0
+        self.scramble_shown = False
+        self.scramble_label.config(text="")
+        self.answer_matcher = FuzzyMatcher(self.current_word_data.folded)
+
+        # Build this level's index (and the next one's) off the UI thread
+        self.word_index.warm(cat_key)
+        if self.level_idx + 1 < len(self.levels):
+            self.word_index.warm(f"{self.levels[self.level_idx + 1]}_harf")
         self.hint_btn.set_state("normal")
         self.submit_btn.set_state("normal")
         
@@ -2649,9 +3019,9 @@ class WordGameApp:
         duration = config.get("game_settings", "timer_duration", default=60)
         self.start_timer(duration)
         
-        self.def_label.config(text=self.current_word_data['tanim'])
+        self.def_label.config(text=self.current_word_data.definition)
         self.ans_entry.delete(0, tk.END)
-        self.ans_entry.config(bg=INPUT_BG)
+        self.ans_entry.config(bg=INPUT_BG, fg=TEXT_COLOR)
         self.update_ui()
         
         # Prepare index for next question
@@ -2688,6 +3058,33 @@ class WordGameApp:
                 self.get_hint()
                 return "break"
 
+    def typo_count(self, folded_answer):
+        """Edit distance to the current word, or None if it is beyond max_typos."""
+        max_typos = config.get("game_settings", "max_typos", default=1)
+        dist = self.answer_matcher.distance(folded_answer, max_typos)
+        return dist if dist <= max_typos else None
+
+    def on_answer_typed(self, event=None):
+        """Live feedback: amber when a typo or two away, red once no word of this level starts with the input."""
+        if self.current_word_data is None or not self.submit_btn.is_enabled:
+            return
+        typed = fold_turkish(self.ans_entry.get().strip())
+        color = TEXT_COLOR
+
+        if typed and config.get("game_settings", "close_feedback", default=True):
+            typos = self.typo_count(typed)
+            if typos:
+                self.ans_entry.config(fg="#f59e0b")
+                return
+
+        level_key = f"{self.current_word_data.length}_harf"
+        # Never build the index on the UI thread; skip the check until it is warm
+        if (typed and config.get("game_settings", "live_prefix_check", default=True)
+                and self.word_index.is_ready(level_key)
+                and not self.word_index.level(level_key).has_prefix(typed)):
+            color = "#ef4444"
+        self.ans_entry.config(fg=color)
+
     def tr_upper(self, text):
         # Turkish-aware uppercase conversion
         text = text.replace('i', 'İ').replace('ı', 'I')
@@ -2712,55 +3109,38 @@ class WordGameApp:
                 
         return data_dir
 
-    def load_scores(self):
+    def load_scores(self, since=0):
+        """Local scores (best first), optionally only those after ``since``."""
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "highscores.json")
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+            return self.scores.scores(since)
         except Exception as e:
             self.log_debug(f"Error loading scores: {e}")
-            # Try fallback to internal resource if external file doesn't exist yet
-            try:
-                path = resource_path("highscores.json")
-                if os.path.exists(path):
-                    with open(path, "r", encoding="utf-8") as f:
-                        return json.load(f)
-            except:
-                pass
-        return []
+            return []
 
     def save_score(self, score_data):
-        # 1. Save locally (always)
-        scores = self.load_scores()
-        
-        # Duplicate Prevention Check
-        # Check if a score with same name, score and very close timestamp exists
-        is_duplicate = False
-        current_ts = score_data['timestamp']
-        for s in scores:
-            if (s.get('name') == score_data['name'] and 
-                s.get('score') == score_data['score'] and 
-                abs(s.get('timestamp', 0) - current_ts) < 5.0): # 5 second buffer for duplicates
-                is_duplicate = True
-                break
-        
-        if is_duplicate:
-            self.log_debug("Ignoring duplicate score submission.")
-            return
-
-        scores.append(score_data)
-        scores.sort(key=lambda x: (-x['score'], x['timestamp']))
-        
+        # 1. Save locally (always); the cache rejects double submits within 5 seconds
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "highscores.json")
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(scores, f, ensure_ascii=False, indent=2)
-            self.cleanup_scores()
+            # Scores that rank in no leaderboard period are dropped right away
+            if not self.scores.add(score_data):
+                self.log_debug("Ignoring duplicate score submission.")
+                return
         except Exception as e:
             self.log_debug(f"Error saving score locally: {e}")
+
+        # Running totals live in the profile; only this game's delta goes to the server
+        stats = self.get_player_stats(score_data['name'])
+        stats.record_game(score_data['score'])
+        push = self.current_user and self.current_user['username'] == score_data['name']
+        # Take the delta before saving so a sent delta is never persisted (and re-sent) as unsynced
+        delta = stats.take_delta() if push else None
+        self.save_player_stats(score_data['name'])
+        if push:
+            user_id = self.current_user['id']
+            def push_stats():
+                if not self.network.send_player_stats(user_id, score_data['name'], delta):
+                    stats.restore_delta(delta)  # Retried with the next game
+                    self.root.after(0, lambda: self.save_player_stats(score_data['name']))
+            threading.Thread(target=push_stats, daemon=True).start()
             
         # 2. Push to server (if logged in)
         if self.current_user:
@@ -2791,113 +3171,67 @@ class WordGameApp:
 
 
     def load_session(self):
-        """Load session data from local JSON"""
+        """Load the saved login session"""
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "session.json")
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+            return self.store.load_session()
         except Exception:
-            pass
-        return None
+            return None
 
     def save_session(self, data):
-        """Save session data to local JSON"""
+        """Persist the login session"""
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "session.json")
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.store.save_session(data)
         except Exception as e:
             self.log_debug(f"Error saving session: {e}")
 
     def clear_session(self):
-        """Delete session file"""
+        """Forget the saved login session"""
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "session.json")
-            if os.path.exists(path):
-                os.remove(path)
+            self.store.clear_session()
         except Exception as e:
             self.log_debug(f"Error clearing session: {e}")
 
     def cleanup_scores(self):
         """Removes scores that don't fall into the top ranks of any category."""
-        scores = self.load_scores()
-        if not scores: return
-
-        now = datetime.now()
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
-        
-        # Start of week (Monday)
-        start_of_week = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
-        
-        # Start of month
-        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
-
-        # 1. Identify which scores to keep for each category
-        def get_top(data, start_ts, limit):
-            filtered = [s for s in data if s.get('timestamp', 0) >= start_ts]
-            filtered.sort(key=lambda x: x['score'], reverse=True)
-            return filtered[:limit]
-
-        keep_daily = get_top(scores, start_of_day, 20)
-        keep_weekly = get_top(scores, start_of_week, 15)
-        keep_monthly = get_top(scores, start_of_month, 15)
-        
-        # All time
-        all_time_sorted = sorted(scores, key=lambda x: x['score'], reverse=True)
-        keep_all_time = all_time_sorted[:15]
-
-        # 2. Use a characteristic tuple as a key to identify unique entries
-        def get_key(s): return (s.get('timestamp'), s.get('name'), s.get('score'))
-        
-        keep_keys = set()
-        for s in keep_daily + keep_weekly + keep_monthly + keep_all_time:
-            keep_keys.add(get_key(s))
-
-        # 3. Filter the original list
-        new_scores = [s for s in scores if get_key(s) in keep_keys]
-        
-        # Sort by score desc, then timestamp
-        new_scores.sort(key=lambda x: (-x['score'], x['timestamp']))
-
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "highscores.json")
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(new_scores, f, ensure_ascii=False, indent=2)
+            removed = self.scores.retain()
+            if removed:
+                self.log_debug(f"cleanup_scores: Removed {removed} scores")
         except Exception as e:
             self.log_debug(f"Error during score cleanup: {e}")
 
+    def get_player_stats(self, username):
+        """Running stats for a player (seeded once from the kept scores for older profiles)."""
+        stats = self.player_stats.get(username)
+        if stats is None:
+            saved = self.get_profile_data(username).get("stats")
+            if isinstance(saved, dict):
+                stats = PlayerStats(saved)
+            else:
+                games_played, total_score, best_score = self.scores.player_totals(username)
+                stats = PlayerStats({"games_played": games_played, "total_score": total_score,
+                                     "best_score": best_score})
+            self.player_stats[username] = stats
+        return stats
+
+    def save_player_stats(self, username):
+        stats = self.player_stats.get(username)
+        if stats is None:
+            return
+        self.save_profile_data(username, {"stats": stats.to_dict()}, push_to_cloud=False)
+
     def get_profile_data(self, username):
-        """Load extended profile data from local JSON"""
+        """Load extended profile data from the local store"""
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "profiles.json")
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    profiles = json.load(f)
-                    return profiles.get(username, {})
+            return self.profiles.get(username)
         except Exception:
-            pass
-        return {}
+            return {}
 
     def save_profile_data(self, username, data, push_to_cloud=True):
-        """Save extended profile data to local JSON"""
+        """Merge ``data`` into the player's profile in the local store (other keys, e.g. stats, are kept)"""
         try:
-            base_dir = self.get_user_data_dir()
-            path = os.path.join(base_dir, "profiles.json")
-            profiles = {}
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    profiles = json.load(f)
-            
-            profiles[username] = data
-            
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(profiles, f, ensure_ascii=False, indent=2)
+            self.profiles.update(username, data)
+            self.screens.invalidate("profile")
                 
             # CLOUD SYNC
             if push_to_cloud and self.current_user:
@@ -2909,93 +3243,30 @@ class WordGameApp:
             return False
 
     def play_game_sound(self, sound_type="correct"):
-        """Plays game sounds using the fastest available method (non-blocking)."""
-        def _play():
-            try:
-                # Check Global Sound Config
-                if not config.get("sounds", "enabled", default=True):
-                    return
-
-                # Get volume from config
-                volume_key = f"volume_{sound_type}"
-                volume = config.get("sounds", volume_key, default=1.0)
-
-                # 1. Try Pygame (already non-blocking)
-                if self.sound_enabled and sound_type in self.sounds:
-                    try:
-                        sound_obj = self.sounds[sound_type]
-                        sound_obj.set_volume(volume)
-                        sound_obj.play()
-                        return
-                    except:
-                        pass
-
-                # 2. Fallback to MCI (Windows)
-                if os.name == 'nt':
-                    try:
-                        # Use the pre-opened alias if available, or open and play
-                        alias = f"game_{sound_type}"
-                        mci = ctypes.windll.winmm.mciSendStringW
-                        
-                        # Set volume
-                        mci_vol = int(volume * 1000)
-                        mci(f"setaudio {alias} volume to {mci_vol}", None, 0, 0)
-                        
-                        # Play from beginning. If it fails, maybe it wasn't opened?
-                        res = mci(f"play {alias} from 0", None, 0, 0)
-                        
-                        if res != 0:
-                            filename = {
-                                "correct": "button-pressed-38129.mp3",
-                                "wrong": "click-buttons-ui-menu-sounds-effects-button-7-203601.mp3",
-                                "next": "mech-keyboard-02-102918.mp3"
-                            }.get(sound_type, "mech-keyboard-02-102918.mp3")
-                            path = resource_path(filename)
-                            short_path = self.get_short_path_name(path)
-                            
-                            # Use a temporary alias for this fallback
-                            temp_alias = f"tmp_{sound_type}_{int(time.time()*100)}"
-                            mci(f'open "{short_path}" alias {temp_alias}', None, 0, 0)
-                            mci(f"setaudio {temp_alias} volume to {mci_vol}", None, 0, 0)
-                            mci(f"play {temp_alias} wait", None, 0, 0)
-                            mci(f"close {temp_alias}", None, 0, 0)
-                    except:
-                        pass
-            except:
-                pass
-
-        threading.Thread(target=_play, daemon=True).start()
-
+        """Queues a game sound on the audio worker (non-blocking, no thread per sound)."""
+        self.audio.play(sound_type)
 
     def start_timer(self, seconds):
-        if self.timer_id:
-            self.root.after_cancel(self.timer_id)
-        self.time_left = seconds
-        self.update_timer()
+        self.round_timer.start(seconds)
 
-    def update_timer(self):
-        mins, secs = divmod(self.time_left, 60)
+    def update_timer(self, seconds_left):
+        mins, secs = divmod(seconds_left, 60)
         timer_text = f"{mins:02d}:{secs:02d}"
         if hasattr(self, 'timer_label') and self.timer_label.winfo_exists():
             self.timer_label.config(text=timer_text)
-            
-        if self.time_left > 0:
-            self.time_left -= 1
-            self.timer_id = self.root.after(1000, self.update_timer)
-        else:
-            self.handle_timeout()
 
     def handle_timeout(self):
         self.log_debug("handle_timeout: Time is up!")
         self.play_game_sound("wrong")
         self.potential_score = 0
-        word = self.current_word_data['kelime']
-        self.revealed_indices = list(range(len(word)))
+        self.record_round(TIMEOUT)
+        word = self.current_word_data.canonical
+        self.reveal_all_letters()
         self.update_ui()
         
         self.ans_entry.delete(0, tk.END)
         self.ans_entry.insert(0, word)
-        self.ans_entry.config(bg="#ef4444")
+        self.ans_entry.config(bg="#ef4444", fg=TEXT_COLOR)
         
         self.submit_btn.set_state("disabled")
         self.hint_btn.set_state("disabled")
@@ -3010,17 +3281,36 @@ class WordGameApp:
             
         self.next_btn.set_state("normal", new_bg, BG_COLOR)
         
+        # Reading the answer is not play time
+        self.game_clock.pause()
         messagebox.showwarning("Süre Doldu", f"Süreniz bitti! Doğru cevap: {word}")
+        self.game_clock.resume()
 
     def check_answer(self):
         user_ans = self.tr_upper(self.ans_entry.get().strip())
-        correct_ans = self.tr_upper(self.current_word_data['kelime'])
         
-        if user_ans == correct_ans:
+        # Exact form first; folded form accepts I/İ and circumflex variants
+        correct = self.current_word_data.matches(user_ans) is not None
+        folded_ans = fold_turkish(user_ans)
+        level_key = f"{self.current_word_data.length}_harf"
+        if (not correct and config.get("game_settings", "accept_alternate_answers", default=False)
+                and self.word_index.is_ready(level_key)):
+            # Another dictionary word that fits the same length and revealed letters.
+            # The index is warmed when the round starts; never build it on the UI thread.
+            correct = self.word_index.level(level_key).fits_pattern(folded_ans, self.display_slots)
+
+        typos = None if correct else self.typo_count(folded_ans)
+        if typos and config.get("game_settings", "lenient_matching", default=False):
+            # Lenient mode: close enough counts, show the correct spelling
+            correct = True
+            self.ans_entry.delete(0, tk.END)
+            self.ans_entry.insert(0, self.current_word_data.canonical)
+
+        if correct:
             if not self.next_btn.is_enabled: # Only score once
-                if self.timer_id:
-                    self.root.after_cancel(self.timer_id)
+                self.round_timer.stop()
                 self.play_game_sound()
+                self.record_round(SOLVED)
                 
                 # Süre Çarpanını Uygula
                 duration = config.get("game_settings", "timer_duration", default=60)
@@ -3032,8 +3322,7 @@ class WordGameApp:
                 self.total_score += earned_points
             
                 # Reveal all letters when correct
-                word = self.current_word_data['kelime']
-                self.revealed_indices = list(range(len(word)))
+                self.reveal_all_letters()
                 
                 self.update_ui()
             
@@ -3050,6 +3339,9 @@ class WordGameApp:
                 new_bg = ACCENT_COLOR
                 
             self.next_btn.set_state("normal", new_bg, BG_COLOR) # Enable manual next
+        elif typos and config.get("game_settings", "close_feedback", default=True):
+            self.play_game_sound("wrong")
+            self.ans_entry.config(bg="#f59e0b") # Amber for "very close"
         else:
             self.play_game_sound("wrong")
             self.ans_entry.config(bg="#ef4444") # Red for wrong
@@ -3061,8 +3353,8 @@ class WordGameApp:
 
     def show_summary_screen(self):
         self.current_screen = "summary"
-        if self.timer_id:
-            self.root.after_cancel(self.timer_id)
+        self.round_timer.stop()
+        self.game_clock.pause()
         self.clear_container()  # Restored clearing of previous widgets
         
         frame = tk.Frame(self.container, bg=BG_COLOR)
@@ -3072,8 +3364,8 @@ class WordGameApp:
         # Calculate duration
         duration_str = "00:00"
         timestamp = time.time()
-        if self.game_start_time:
-            duration = int(timestamp - self.game_start_time)
+        if self.game_clock.started:
+            duration = int(self.game_clock.elapsed)
             mins, secs = divmod(duration, 60)
             duration_str = f"{mins:02d}:{secs:02d}"
             
@@ -3142,18 +3434,8 @@ class WordGameApp:
 
     def get_user_stats(self, username):
         """Calculate stats for the profile screen"""
-        scores = self.load_scores()
-        user_scores = [s for s in scores if s.get('name') == username]
-        
-        total_score = sum(s.get('score', 0) for s in user_scores)
-        games_played = len(user_scores)
-        best_score = max((s.get('score', 0) for s in user_scores), default=0)
-        
-        # Calculate approximate "Words Hunted" based on score
-        words_hunted = int(total_score / 100) 
-        
-        # Success Rate (Fake for now)
-        success_rate = 95 if games_played > 0 else 0
+        stats = self.get_player_stats(username)
+        total_score = stats.data["total_score"]
         
         # Calculate Rank
         rank = "Yeni Çaylak"
@@ -3167,16 +3449,22 @@ class WordGameApp:
 
         return {
             "total_score": total_score,
-            "games_played": games_played,
-            "best_score": best_score,
-            "words_hunted": words_hunted,
-            "success_rate": success_rate,
+            "games_played": stats.data["games_played"],
+            "best_score": stats.data["best_score"],
+            "words_hunted": stats.data["words_solved"],
+            "success_rate": stats.success_rate,
+            "hints_used": stats.data["hints_used"],
+            "timeouts": stats.data["timeouts"],
+            "average_solve_s": stats.average_solve_s,
+            "best_streak": stats.data["best_streak"],
             "rank": rank
         }
 
     def show_profile_screen(self):
         self.current_screen = "profile"
-        self.clear_container()
+        # Rebuilt only after the profile or stats change (save_profile_data invalidates it)
+        if self.screens.show("profile", state=self.current_user['username']):
+            return
         frame = tk.Frame(self.container, bg=BG_COLOR)
         frame.place(relx=0.5, rely=0.5, anchor="center", relwidth=1.0, relheight=1.0)
         
@@ -3256,6 +3544,12 @@ class WordGameApp:
         create_stat_box(side_panel, "Toplam Puan", f"{stats['total_score']:,}").grid(row=0, column=0, pady=10)
         create_stat_box(side_panel, "En İyi Skor", f"{stats['best_score']:,}").grid(row=0, column=1, pady=10)
 
+        # Round stats (kept up to date as rounds end)
+        details = (f"{stats['games_played']} oyun  •  {stats['words_hunted']} kelime  •  %{stats['success_rate']} başarı\n"
+                   f"Ort. çözüm {stats['average_solve_s']:.1f} sn  •  En uzun seri {stats['best_streak']}")
+        tk.Label(side_panel, text=details, font=(self.font_main, self.s(14)), fg=SUB_TEXT_COLOR, bg=BG_COLOR,
+                 justify="center").grid(row=2, column=0, columnspan=2, pady=(10, 0))
+
         # Row 1: Buttons (Correspondingly below stats for symmetry)
         # GERİ DÖN under Toplam Puan (0,0 -> 1,0)
         self.create_rounded_button(side_panel, "GERİ DÖN", self.show_entry_screen, 
@@ -3452,6 +3746,7 @@ class WordGameApp:
                         "old_password": op, 
                         "new_password": np
                     }
+                    import urllib.request
                     req = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'), 
                                                headers={'Content-Type': 'application/json'})
                     with urllib.request.urlopen(req) as response:
@@ -3472,7 +3767,9 @@ class WordGameApp:
     def show_leaderboard(self, source="summary"):
         self.current_screen = "leaderboard"
         self.transitioning = False 
-        self.clear_container()
+        # The back button depends on where we came from; otherwise reuse the screen and reload its data
+        if self.screens.show("leaderboard", state=source):
+            return
         
         lb_frame = tk.Frame(self.container, bg=BG_COLOR)
         lb_frame.place(relx=0.5, rely=0.5, anchor="center", relwidth=1.0, relheight=1.0)
@@ -3544,9 +3841,10 @@ class WordGameApp:
         list_container = tk.Frame(lb_frame, bg=BG_COLOR)
         list_container.pack(expand=True, fill="both", padx=100, pady=(0, 100))
         
-        self.score_scroll = ScrollableFrame(list_container, bg=BG_COLOR)
-        self.score_scroll.pack(expand=True, fill="both")
-        self.leaderboard_content = self.score_scroll.scrollable_frame
+        # Only the visible strips exist as widgets; they are refilled while scrolling
+        self.score_list = VirtualList(list_container, self.make_score_strip, self.fill_score_strip,
+                                      row_height=self.s(80), gap=self.s(10), bg=BG_COLOR)
+        self.score_list.pack(expand=True, fill="both")
         
         # Back Button
         back_cmd = self.show_summary_screen if source == "summary" else self.show_entry_screen
@@ -3555,6 +3853,7 @@ class WordGameApp:
         self.create_rounded_button(back_container, "GERİ DÖN", back_cmd, width=200, height=50, bg="#ef4444", fg="white").pack()
         
         self.load_leaderboard_data("GÜNLÜK")
+        self.screens.on_show(lambda: self.load_leaderboard_data(self.current_filter))
 
     def load_leaderboard_data(self, filter_key):
         self.current_filter = filter_key
@@ -3568,27 +3867,27 @@ class WordGameApp:
                  btn.set_state(btn.state, new_bg, new_fg)
 
         # Clear List
-        for widget in self.leaderboard_content.winfo_children():
-            widget.destroy()
+        self.score_list.set_items([])
             
         def render_scores(scores):
             # Normalize and render
             if not scores:
-                tk.Label(self.leaderboard_content, text="Henüz kayıtlı skor yok.", 
-                         font=(self.font_main, self.s(20)), fg=SUB_TEXT_COLOR, bg=BG_COLOR).pack(pady=self.s(50))
+                self.score_list.set_items([], "Henüz kayıtlı skor yok.",
+                                          font=(self.font_main, self.s(20)), fill=SUB_TEXT_COLOR)
                 return
 
-            # Optimization: Load all profiles once
+            # Optimization: Look up the shown players' profiles in one batch
             all_profiles = {}
             try:
-                base_dir = self.get_user_data_dir()
-                path = os.path.join(base_dir, "profiles.json")
-                if os.path.exists(path):
-                    with open(path, "r", encoding="utf-8") as f:
-                        all_profiles = json.load(f)
+                all_profiles = self.profiles.batch(s.get('name') or s.get('username') for s in scores)
             except: pass
 
-            for idx, item in enumerate(scores):
+            # Only allow deleting if scope is local OR user is admin
+            is_admin = (self.current_user and self.current_user['username'].upper() == 'OKAN707')
+            allow_delete = (self.leaderboard_scope == 'local') or is_admin
+
+            rows = []
+            for item in scores:
                 # Map server fields to local fields if needed
                 # Server: username, time_str. Local: name, time.
                 data = item.copy()
@@ -3603,23 +3902,15 @@ class WordGameApp:
                      # Only overwrite if local profile has a valid class level
                      if p.get('class_level') and p.get('class_level') != "-":
                         data['class_level'] = p['class_level']
-                
-                try:
-                    # Only allow deleting if scope is local OR user is admin
-                    is_admin = (self.current_user and self.current_user['username'].upper() == 'OKAN707')
-                    allow_delete = (self.leaderboard_scope == 'local') or is_admin
-                    
-                    self.create_score_strip(self.leaderboard_content, idx + 1, data, allow_delete)
-                except Exception as e:
-                    print(f"Error rendering score: {e}")
+                rows.append((data, allow_delete))
             
-            self.score_scroll.update_scroll()
+            self.score_list.set_items(rows)
 
         # Fetch Data
         if self.leaderboard_scope == 'local':
-            scores = self.load_scores()
-            # Clean
-            valid_scores = [s for s in scores if isinstance(s, dict) and 'score' in s]
+            # Same top lists the retention keeps on disk
+            period = {"GÜNLÜK": "daily", "HAFTALIK": "weekly", "AYLIK": "monthly"}.get(filter_key, "alltime")
+            valid_scores = self.scores.top(period)
             # Helper function to convert time string (MM:SS) to seconds for sorting
             def time_to_seconds(time_str):
                 try:
@@ -3630,23 +3921,17 @@ class WordGameApp:
             
             # Sort by score (descending), then by time (ascending) for tied scores
             valid_scores.sort(key=lambda x: (-x['score'], time_to_seconds(x.get('time', '99:99'))))
-            
-            # Filter
-            now = datetime.now()
-            start_ts = 0
-            if filter_key == "GÜNLÜK":
-                start_ts = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
-            elif filter_key == "HAFTALIK":
-                start_ts = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
-            elif filter_key == "AYLIK":
-                start_ts = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
-            
-            filtered = [s for s in valid_scores if s.get('timestamp', 0) >= start_ts]
+            filtered = valid_scores
             
             # Backfill/Update data from local profiles
             # This ensures that if the user changes their avatar/name, it updates in the leaderboard view (for themselves/local users)
+            profiles = {}
+            try:
+                profiles = self.profiles.batch(s.get('name') for s in filtered[:20])
+            except Exception as e:
+                self.log_debug(f"Error loading profiles: {e}")
             for s in filtered:
-                p_data = self.get_profile_data(s.get('name'))
+                p_data = profiles.get(s.get('name'))
                 if p_data:
                     # Always sync Avatar to current selection
                     if 'avatar_id' in p_data:
@@ -3678,8 +3963,9 @@ class WordGameApp:
                     
                     # Backfill/Update data from local profiles
                     # Important for Global Scoreboard to correct local user's avatar immediately
+                    profiles = self.profiles.batch(s.get('name') for s in scores)
                     for s in scores:
-                        p_data = self.get_profile_data(s.get('name'))
+                        p_data = profiles.get(s.get('name'))
                         if p_data:
                             # Always sync Avatar to current selection
                             if 'avatar_id' in p_data:
@@ -3695,51 +3981,32 @@ class WordGameApp:
             
             threading.Thread(target=fetch, daemon=True).start()
 
-    def create_score_strip(self, parent, rank, data, allow_delete=True):
-        # Colors based on Rank
+    def make_score_strip(self, parent):
+        """Builds one empty leaderboard row; fill_score_strip puts a score into it."""
         strip_bg = INPUT_BG
-        rank_fg = SUB_TEXT_COLOR
-        
-        if rank == 1:
-            rank_fg = "#3b82f6" # Blue
-        elif rank == 2:
-            rank_fg = "#ca8a04" # Dark Yellow/Gold (Readable on dark bg)
-        elif rank == 3:
-            rank_fg = "#22c55e" # Green
-        elif rank == 4:
-            rank_fg = "#a855f7" # Purple
-        elif rank == 5:
-            rank_fg = "#ef4444" # Red
             
         # Strip Container
         strip = tk.Frame(parent, bg=strip_bg, height=self.s(80))
         strip.pack_propagate(False)
-        strip.pack(fill="x", pady=self.s(5))
+        strip.data = None
+        strip.allow_delete = False
         
         # Rank (Number only, no hash)
-        tk.Label(strip, text=str(rank), font=(self.font_main, self.s(24), "bold"), 
-                 fg=rank_fg, bg=strip_bg, width=4).pack(side="left", padx=(self.s(20), self.s(10)))
+        strip.rank_lbl = tk.Label(strip, text="", font=(self.font_main, self.s(24), "bold"), 
+                 fg=SUB_TEXT_COLOR, bg=strip_bg, width=4)
+        strip.rank_lbl.pack(side="left", padx=(self.s(20), self.s(10)))
                  
         # Avatar/Icon Placeholder (Optional circle)
         # canvas = tk.Canvas(strip, width=self.s(50), height=self.s(50), bg=strip_bg, highlightthickness=0)
         # canvas.pack(side="left", padx=self.s(10))
         # self.draw_rounded_rect(canvas, 0, 0, self.s(50), self.s(50), self.s(25), rank_fg)
-        
-        # Name (Display Full Name if available, check length)
-        display_name = data.get('fullname', '-')
-        if not display_name or display_name == "-":
-            display_name = self.tr_upper(data['name']) # Fallback to username
-            
-        # Truncate if too long (approx 25 chars)
-        if len(display_name) > 25:
-             display_name = display_name[:22] + "..."
              
-        name_lbl = tk.Label(strip, text=display_name, font=(self.font_main, self.s(20), "bold"), 
+        strip.name_lbl = tk.Label(strip, text="", font=(self.font_main, self.s(20), "bold"), 
                  fg=TEXT_COLOR, bg=strip_bg, cursor="hand2")
-        name_lbl.pack(side="left", padx=self.s(20))
+        strip.name_lbl.pack(side="left", padx=self.s(20))
         
         # Click to show profile
-        name_lbl.bind("<Button-1>", lambda e: self.show_player_profile(data))
+        strip.name_lbl.bind("<Button-1>", lambda e: self.show_player_profile(strip.data))
 
         # Score Column (Far right, fixed width)
         # Using a fixed container ensures precise column alignment regardless of text length
@@ -3747,8 +4014,9 @@ class WordGameApp:
         score_col.pack_propagate(False)
         score_col.pack(side="right", padx=(self.s(10), self.s(40))) # 40px from window edge
         
-        tk.Label(score_col, text=f"{data['score']} PUAN", font=(self.font_main, self.s(24), "bold"), 
-                 fg=ACCENT_COLOR, bg=strip_bg).place(relx=1.0, rely=0.5, anchor="e")
+        strip.score_lbl = tk.Label(score_col, text="", font=(self.font_main, self.s(24), "bold"), 
+                 fg=ACCENT_COLOR, bg=strip_bg)
+        strip.score_lbl.place(relx=1.0, rely=0.5, anchor="e")
 
         # Date column removed - date now shown only in profile dialog
 
@@ -3757,9 +4025,9 @@ class WordGameApp:
         time_col.pack_propagate(False)
         time_col.pack(side="right", padx=(self.s(80), 0))
         
-        time_val = data.get('time', "00:00")
-        tk.Label(time_col, text=time_val, font=(self.font_main, self.s(16), "bold"), 
-                 fg=SUB_TEXT_COLOR, bg=strip_bg).place(relx=1.0, rely=0.5, anchor="e")
+        strip.time_lbl = tk.Label(time_col, text="", font=(self.font_main, self.s(16), "bold"), 
+                 fg=SUB_TEXT_COLOR, bg=strip_bg)
+        strip.time_lbl.place(relx=1.0, rely=0.5, anchor="e")
 
         # Class Level Column (Replaces School)
         # On small screens, we reduce width
@@ -3768,24 +4036,21 @@ class WordGameApp:
             class_width = 250
         if self.root.winfo_screenwidth() < 800:
             class_width = 150
+        strip.class_chars = 35 if class_width >= 400 else 18
             
         class_col = tk.Frame(strip, bg=strip_bg, width=self.s(class_width), height=self.s(80))
         class_col.pack_propagate(False)
         class_col.pack(side="right", padx=(self.s(80), 0))
-        
-        class_val = data.get('class_level', "-")
-        # Truncate if too long (unlikely for class level but good for safety)
-        max_chars = 35 if class_width >= 400 else 18
-        if len(str(class_val)) > max_chars: 
-            class_val = str(class_val)[:max_chars-3] + "..."
             
-        tk.Label(class_col, text=class_val, font=(self.font_main, self.s(16), "bold"), 
-                 fg=SUB_TEXT_COLOR, bg=strip_bg).place(relx=1.0, rely=0.5, anchor="e")
+        strip.class_lbl = tk.Label(class_col, text="", font=(self.font_main, self.s(16), "bold"), 
+                 fg=SUB_TEXT_COLOR, bg=strip_bg)
+        strip.class_lbl.place(relx=1.0, rely=0.5, anchor="e")
 
 
-        # Bind Right Click (Delete) for all parts of the strip
+        # Bind Right Click (Delete) for all parts of the strip, once per widget
         def on_right_click(event):
-            self.delete_score(data)
+            if strip.allow_delete and strip.data is not None:
+                self.delete_score(strip.data)
             
         # Recursive binding for all widgets within the strip
         def bind_recursive(widget):
@@ -3793,8 +4058,49 @@ class WordGameApp:
             for child in widget.winfo_children():
                 bind_recursive(child)
 
-        if allow_delete:
-            bind_recursive(strip)
+        bind_recursive(strip)
+        return strip
+
+    def fill_score_strip(self, strip, index, row):
+        """Shows one score (``row`` is ``(data, allow_delete)``) in a recycled strip."""
+        data, allow_delete = row
+        rank = index + 1
+        strip.data = data
+        strip.allow_delete = allow_delete
+
+        # Colors based on Rank
+        rank_fg = SUB_TEXT_COLOR
+        if rank == 1:
+            rank_fg = "#3b82f6" # Blue
+        elif rank == 2:
+            rank_fg = "#ca8a04" # Dark Yellow/Gold (Readable on dark bg)
+        elif rank == 3:
+            rank_fg = "#22c55e" # Green
+        elif rank == 4:
+            rank_fg = "#a855f7" # Purple
+        elif rank == 5:
+            rank_fg = "#ef4444" # Red
+        strip.rank_lbl.config(text=str(rank), fg=rank_fg)
+
+        # Name (Display Full Name if available, check length)
+        display_name = data.get('fullname', '-')
+        if not display_name or display_name == "-":
+            display_name = self.tr_upper(data['name']) # Fallback to username
+            
+        # Truncate if too long (approx 25 chars)
+        if len(display_name) > 25:
+             display_name = display_name[:22] + "..."
+        strip.name_lbl.config(text=display_name)
+
+        strip.score_lbl.config(text=f"{data['score']} PUAN")
+        strip.time_lbl.config(text=data.get('time', "00:00"))
+
+        class_val = data.get('class_level', "-")
+        # Truncate if too long (unlikely for class level but good for safety)
+        max_chars = strip.class_chars
+        if len(str(class_val)) > max_chars: 
+            class_val = str(class_val)[:max_chars-3] + "..."
+        strip.class_lbl.config(text=class_val)
 
     def show_admin_users_screen(self):
         self.current_screen = "admin_users"
@@ -4179,27 +4485,8 @@ class WordGameApp:
                     
                 else:
                     # Local Delete
-                    base_dir = self.get_user_data_dir()
-                    path = os.path.join(base_dir, "highscores.json")
-                    if os.path.exists(path):
-                        with open(path, "r", encoding="utf-8") as f:
-                            scores = json.load(f)
-                        
-                        original_len = len(scores)
-                        new_scores = []
-                        target_ts = score_data.get('timestamp')
-                        target_name = score_data.get('name')
-                        
-                        for s in scores:
-                            if s.get('timestamp') == target_ts and s.get('name') == target_name:
-                                continue
-                            new_scores.append(s)
-                        
-                        if len(new_scores) < original_len:
-                            with open(path, "w", encoding="utf-8") as f:
-                                json.dump(new_scores, f, ensure_ascii=False, indent=2)
-                            
-                            self.load_leaderboard_data(self.current_filter)
+                    if self.scores.delete(score_data.get('name'), score_data.get('timestamp')):
+                        self.load_leaderboard_data(self.current_filter)
             except Exception as e:
                 self.log_debug(f"Error deleting score: {e}")
         
@@ -4216,21 +4503,21 @@ class WordGameApp:
 
     def _reset_game_state(self):
         """Centralized method to reset game state for a new player or restart.
-        Ensures score and levels are cleared, but used words remain persistent in session."""
-        # self.used_words.clear() # Keeping it persistent across games in the same session
+        Ensures score and levels are cleared, but used words remain persistent (word_sampler decks)."""
         self.level_idx = 0
         self.total_score = 0
         self.potential_score = 0
-        self.revealed_indices = []
-        self.time_left = config.get("game_settings", "timer_duration", default=60)
+        self.hidden_indices = []   # Unrevealed letter positions of the current word
+        self.display_slots = []    # Placeholder text, one slot per letter
+        self.hints_used = 0
         self.current_word_data = None
+        self.session_words = None  # Fixed word list for daily/code challenges, None for normal games
+        self.session_code = None
         self.score_saved = False
-        if self.timer_id:
-            try:
-                self.root.after_cancel(self.timer_id)
-            except:
-                pass
-            self.timer_id = None
+        if self.selector:
+            self.selector.reset()  # New player, start again from the middle band
+        self.round_timer.stop()
+        self.game_clock.stop()
 
     def reset_game(self):
         # Full reset for "Play Again" or Initial Start
@@ -4239,21 +4526,20 @@ class WordGameApp:
 
     def on_closing(self):
         # Stop timer if active
-        if self.timer_id:
-            try:
-                self.root.after_cancel(self.timer_id)
-            except:
-                pass
-        
-        # Shutdown pygame if used
+        self.round_timer.stop()
+        
+        # Remember which words were already shown and how they went
+        self.word_sampler.save()
+        self.word_stats.save()
+        if self.telemetry:
+            self.telemetry.save()  # Sent on next launch
+        for username in self.player_stats:
+            self.save_player_stats(username)  # Rounds of an unfinished game
+        self.scores.flush()
+        
+        # Stop the audio worker (closes the mixer / MCI aliases)
         try:
-            if os.name == 'nt':
-                # Close all MCI aliases
-                ctypes.windll.winmm.mciSendStringW("close all", None, 0, 0)
-
-            if PYGAME_AVAILABLE:
-                pygame.mixer.quit()
-                pygame.quit()
+            self.audio.shutdown()
         except:
             pass
             
@@ -4276,5 +4562,6 @@ if __name__ == "__main__":
             pass
 
     root = tk.Tk()
+    startup.mark("tk root")
     app = WordGameApp(root)
     root.mainloop()
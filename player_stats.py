@@ -0,0 +1,88 @@
+"""Running per-player statistics.
+
+Counters are updated in O(1) as each round and game ends, so the profile
+and summary screens read them directly instead of scanning score history.
+The totals are stored under ``"stats"`` in the player's local profile
+together with the changes not yet synced; those are sent to the server,
+which keeps the same counters in its ``player_stats`` table.
+"""
+from telemetry import SOLVED, TIMEOUT, REVEALED
+
+# Summed counters (the server adds deltas of these)
+COUNTERS = ("games_played", "total_score", "rounds", "words_solved", "hints_used",
+            "timeouts", "reveals", "solve_ms_total")
+# Running maxima (the server keeps the larger value)
+MAXIMA = ("best_score", "best_streak")
+FIELDS = COUNTERS + MAXIMA + ("current_streak",)
+
+
+class PlayerStats:
+    """One player's totals plus the part not yet sent to the server."""
+
+    def __init__(self, data=None):
+        self.data = {f: 0 for f in FIELDS}
+        if data:
+            for f in FIELDS:
+                try:
+                    self.data[f] = int(data.get(f, 0))
+                except (TypeError, ValueError):
+                    pass
+        self._delta = {f: 0 for f in COUNTERS}
+        if data and isinstance(data.get("unsynced"), dict):
+            self.restore_delta(data["unsynced"])
+
+    def _add(self, field, amount):
+        self.data[field] += amount
+        self._delta[field] += amount
+
+    def record_round(self, outcome, hints, time_ms):
+        self._add("rounds", 1)
+        self._add("hints_used", hints)
+        if outcome == SOLVED:
+            self._add("words_solved", 1)
+            self._add("solve_ms_total", int(time_ms))
+            self.data["current_streak"] += 1
+            self.data["best_streak"] = max(self.data["best_streak"], self.data["current_streak"])
+        else:
+            self.data["current_streak"] = 0
+            if outcome == TIMEOUT:
+                self._add("timeouts", 1)
+            elif outcome == REVEALED:
+                self._add("reveals", 1)
+
+    def record_game(self, score):
+        self._add("games_played", 1)
+        self._add("total_score", score)
+        self.data["best_score"] = max(self.data["best_score"], score)
+
+    @property
+    def success_rate(self):
+        """Percentage of rounds solved."""
+        rounds = self.data["rounds"]
+        return round(100 * self.data["words_solved"] / rounds) if rounds else 0
+
+    @property
+    def average_solve_s(self):
+        solved = self.data["words_solved"]
+        return self.data["solve_ms_total"] / solved / 1000 if solved else 0.0
+
+    def to_dict(self):
+        data = dict(self.data)
+        data["unsynced"] = dict(self._delta)
+        return data
+
+    def take_delta(self):
+        """Counters changed since the last call, plus the current maxima, for the server."""
+        delta = dict(self._delta)
+        for f in MAXIMA:
+            delta[f] = self.data[f]
+        self._delta = {f: 0 for f in COUNTERS}
+        return delta
+
+    def restore_delta(self, delta):
+        """Puts back a delta whose send failed, so it goes out with the next one."""
+        for f in COUNTERS:
+            try:
+                self._delta[f] += int(delta.get(f, 0))
+            except (TypeError, ValueError):
+                pass
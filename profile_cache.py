@@ -0,0 +1,61 @@
+"""In-memory index of the local player profiles.
+
+All profiles are read from the ``LocalStore`` once, on first use, and kept
+in a dict keyed by username. Lookups, including ``batch`` for a whole
+leaderboard page, never touch the database. ``update`` merges the given
+fields into the profile and writes the result through to the store, so the
+next read sees the new data and fields the caller did not pass (such as the
+``stats`` aggregate) survive. Callers get copies and may modify them freely.
+"""
+import copy
+import threading
+
+
+class ProfileCache:
+    """Username -> profile dict, shared by every screen."""
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self._profiles = None
+
+    def _loaded(self):
+        # Caller holds the lock
+        if self._profiles is None:
+            self._profiles = self.store.profiles()
+        return self._profiles
+
+    def get(self, username):
+        with self._lock:
+            return copy.deepcopy(self._loaded().get(username, {}))
+
+    def batch(self, usernames):
+        """``{username: profile}`` for those of ``usernames`` that have a profile."""
+        with self._lock:
+            profiles = self._loaded()
+            return {u: copy.deepcopy(profiles[u]) for u in set(usernames) if u in profiles}
+
+    def all(self):
+        with self._lock:
+            return copy.deepcopy(self._loaded())
+
+    def update(self, username, fields):
+        """Merges ``fields`` into ``username``'s profile (creating it if needed)."""
+        with self._lock:
+            data = {**self._loaded().get(username, {}), **copy.deepcopy(fields)}
+            self.store.save_profile(username, data)
+            self._loaded()[username] = data
+
+    def invalidate(self, username=None):
+        """Drops one cached profile (or all) so it is re-read from the store."""
+        with self._lock:
+            if self._profiles is None:
+                return
+            if username is None:
+                self._profiles = None
+                return
+            row = self.store.get_profile(username)
+            if row:
+                self._profiles[username] = row
+            else:
+                self._profiles.pop(username, None)
@@ -0,0 +1,161 @@
+"""In-memory view of the local scores with write-behind persistence.
+
+All scores are loaded from the ``LocalStore`` once and kept in a list sorted
+best first (score descending, then oldest first), plus a per-player index.
+Reads for the leaderboard, the summary and profile screens and the duplicate
+check are served from memory. Changes are applied to memory immediately and
+queued for a writer thread, which commits everything queued so far in one
+transaction, so a burst (save + cleanup) costs one commit and never blocks
+the UI thread. ``flush`` waits for the queue to drain and is called on exit.
+
+Which scores are kept at all is decided by ``score_retention.Retention`` as
+each score is added; its per-period top lists back the local leaderboard.
+"""
+import threading
+from bisect import bisect_left, bisect_right
+
+from score_retention import Retention, rank_key
+
+DUPLICATE_WINDOW = 5.0  # seconds; same player + score within this is a double submit
+
+
+class ScoreCache:
+    """Sorted, process-wide score list in front of a ``LocalStore``."""
+
+    def __init__(self, store, limits=None):
+        self.store = store
+        self.retention = Retention(limits)
+        self._lock = threading.Lock()
+        self._scores = store.scores()
+        self._keys = [rank_key(s) for s in self._scores]
+        self._by_name = {}
+        for s in self._scores:
+            self._by_name.setdefault(s.get("name"), []).append(s)
+
+        self._pending = []
+        self._wake = threading.Condition(self._lock)
+        self._writing = False
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    # --- Reads (copies, so callers can decorate rows freely) ---
+
+    def scores(self, since=0, limit=None, name=None):
+        """Scores with timestamp >= since, best first."""
+        with self._lock:
+            source = self._by_name.get(name, []) if name is not None else self._scores
+            out = [dict(s) for s in source if s.get("timestamp", 0) >= since]
+        if name is not None:
+            out.sort(key=rank_key)
+        return out[:limit] if limit is not None else out
+
+    def player_totals(self, name):
+        """(games played, total score, best score) for one player."""
+        with self._lock:
+            rows = self._by_name.get(name, [])
+            return len(rows), sum(s.get("score", 0) for s in rows), max((s.get("score", 0) for s in rows), default=0)
+
+    def top(self, period):
+        """The kept scores of a leaderboard period ("daily", ..., "alltime"), best first."""
+        with self._lock:
+            if not self.retention.is_current():
+                self._retain()
+            return [dict(s) for s in self.retention.top(period)]
+
+    def __len__(self):
+        return len(self._scores)
+
+    # --- Writes (memory now, disk on the writer thread) ---
+
+    def add(self, score):
+        """Adds a score. Returns False if it duplicates one saved moments ago."""
+        score = dict(score)
+        with self._lock:
+            for s in self._by_name.get(score.get("name"), []):
+                if s.get("score") == score.get("score") and \
+                        abs(s.get("timestamp", 0) - score.get("timestamp", 0)) < DUPLICATE_WINDOW:
+                    return False
+            key = rank_key(score)
+            i = bisect_right(self._keys, key)
+            self._keys.insert(i, key)
+            self._scores.insert(i, score)
+            self._by_name.setdefault(score.get("name"), []).append(score)
+
+            if not self.retention.is_current():
+                self._queue(("add", score))
+                self._retain()
+                return True
+            kept, dropped = self.retention.offer(score)
+            if not kept:
+                self._remove(score)  # Ranks in no period; nothing to write
+                return True
+            self._queue(("add", score))
+            for s in dropped:
+                self._remove(s)
+                self._queue(("delete", s.get("name"), s.get("timestamp")))
+        return True
+
+    def delete(self, name, timestamp):
+        with self._lock:
+            rows = self._by_name.get(name, [])
+            doomed = [s for s in rows if s.get("timestamp") == timestamp]
+            if not doomed:
+                return False
+            for s in doomed:
+                self._remove(s)
+            self._queue(("delete", name, timestamp))
+            self.retention.rebuild(self._scores)  # Let the next best move up
+        return True
+
+    def retain(self):
+        """Recomputes every period's top list and deletes the scores in none. Returns the count removed."""
+        with self._lock:
+            return self._retain()
+
+    def _retain(self):
+        kept = self.retention.rebuild(self._scores)
+        doomed = [s for s in self._scores if id(s) not in kept]
+        for s in doomed:
+            self._remove(s)
+            self._queue(("delete", s.get("name"), s.get("timestamp")))
+        return len(doomed)
+
+    def _remove(self, score):
+        key = rank_key(score)
+        i = bisect_left(self._keys, key)
+        while self._scores[i] is not score:
+            i += 1
+        del self._keys[i]
+        del self._scores[i]
+        rows = self._by_name[score.get("name")]
+        del rows[next(i for i, s in enumerate(rows) if s is score)]
+        if not rows:
+            del self._by_name[score.get("name")]
+
+    # --- Writer thread ---
+
+    def _queue(self, op):
+        # Caller holds the lock
+        self._pending.append(op)
+        self._wake.notify_all()
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._wake.wait()
+                batch, self._pending = self._pending, []
+                self._writing = True
+            try:
+                self.store.write_scores(batch)
+            except Exception as e:
+                print(f"[STORE] Score write failed: {e}")
+            finally:
+                with self._lock:
+                    self._writing = False
+                    self._wake.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Blocks until every queued change has been committed (or timeout)."""
+        with self._lock:
+            return self._wake.wait_for(lambda: not self._pending and not self._writing, timeout)
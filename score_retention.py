@@ -0,0 +1,118 @@
+"""Top-K retention for the local leaderboard periods.
+
+Only the best ``max_daily_scores`` of today, ``max_weekly_scores`` of this
+week, ``max_monthly_scores`` of this month and ``max_alltime_scores`` overall
+are kept on disk. ``top_k`` finds all four sets in one pass over the scores
+with a bounded heap per period, O(n log k) instead of four full sorts.
+``Retention`` keeps the current top lists and updates them as each score
+is added, so a save touches at most k entries per period; the lists are the
+same ones the local leaderboard shows. When a period rolls over (new day,
+week or month) the lists are rebuilt with one ``top_k`` pass.
+"""
+import heapq
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+PERIODS = ("daily", "weekly", "monthly", "alltime")
+DEFAULT_LIMITS = {"daily": 20, "weekly": 15, "monthly": 15, "alltime": 15}
+
+
+def rank_key(score):
+    """Sort key: higher score first, then the earlier one."""
+    return (-score.get("score", 0), score.get("timestamp", 0))
+
+
+def period_starts(now=None):
+    """Timestamp at which each period began (local time; weeks start Monday)."""
+    now = now or datetime.now()
+    day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return {
+        "daily": day.timestamp(),
+        "weekly": (day - timedelta(days=day.weekday())).timestamp(),
+        "monthly": day.replace(day=1).timestamp(),
+        "alltime": 0,
+    }
+
+
+def top_k(scores, windows):
+    """Best ``limit`` scores per ``{period: (since, limit)}`` in a single pass.
+
+    Returns ``{period: [score, ...]}`` with each list best first.
+    """
+    heaps = {period: [] for period in windows}
+    plan = [(heaps[p], since, limit) for p, (since, limit) in windows.items() if limit > 0]
+    for n, s in enumerate(scores):
+        ts = s.get("timestamp", 0)
+        # Min-heap on the rank key's inverse: the worst kept score sits on top
+        item = (s.get("score", 0), -ts, -n, s)
+        for heap, since, limit in plan:
+            if ts < since:
+                continue
+            if len(heap) < limit:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+    return {p: [item[3] for item in sorted(heap, reverse=True)] for p, heap in heaps.items()}
+
+
+class Retention:
+    """Current top-K list for each period, maintained on insert."""
+
+    def __init__(self, limits=None):
+        self.limits = dict(DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        self.starts = None
+        self.tops = {p: [] for p in PERIODS}
+        self._keys = {p: [] for p in PERIODS}
+
+    def rebuild(self, scores, now=None):
+        """Recomputes every list from ``scores``. Returns the ids of the kept scores."""
+        self.starts = period_starts(now)
+        windows = {p: (self.starts[p], self.limits[p]) for p in PERIODS}
+        self.tops = top_k(scores, windows)
+        self._keys = {p: [rank_key(s) for s in top] for p, top in self.tops.items()}
+        return self.kept()
+
+    def is_current(self, now=None):
+        return self.starts == period_starts(now)
+
+    def kept(self):
+        return {id(s) for top in self.tops.values() for s in top}
+
+    def offer(self, score):
+        """Adds ``score`` to every period it ranks in.
+
+        Returns ``(kept, dropped)``: whether the new score is retained anywhere,
+        and the previously kept scores that now fall out of every period.
+        """
+        key = rank_key(score)
+        ts = score.get("timestamp", 0)
+        pushed_out = []
+        kept = False
+        for p in PERIODS:
+            limit = self.limits[p]
+            keys, top = self._keys[p], self.tops[p]
+            if ts < self.starts[p] or limit <= 0:
+                continue
+            if len(top) >= limit and key >= keys[-1]:
+                continue
+            i = bisect_right(keys, key)  # after equal keys, as top_k orders them
+            keys.insert(i, key)
+            top.insert(i, score)
+            kept = True
+            if len(top) > limit:
+                keys.pop()
+                pushed_out.append(top.pop())
+        if not pushed_out:
+            return kept, []
+        still = self.kept()
+        dropped = []
+        for s in pushed_out:
+            if id(s) not in still and all(d is not s for d in dropped):
+                dropped.append(s)
+        return kept, dropped
+
+    def top(self, period):
+        return self.tops.get(period, [])
+
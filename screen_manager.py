@@ -0,0 +1,138 @@
+"""Keeps built screens alive between visits instead of rebuilding them.
+
+Every cached screen lives in its own full-size page frame inside the main
+container. Switching screens hides the old page and shows the new one; a
+page is built once and then only refreshed (``on_show`` callbacks) when it
+is shown again. Screens that are not cached share a scratch page that is
+cleared on every switch, which is what ``clear_container`` used to do for
+all screens.
+
+Cached pages are weighed by their widget count. When the hidden pages add up
+to more than ``budget`` widgets, the least recently shown ones are destroyed
+and get rebuilt on their next visit.
+"""
+import tkinter as tk
+
+SCRATCH = None  # name of the shared page for uncached screens
+
+
+def count_widgets(widget):
+    total = 0
+    stack = [widget]
+    while stack:
+        w = stack.pop()
+        children = w.winfo_children()
+        total += len(children)
+        stack.extend(children)
+    return total
+
+
+class ScreenManager:
+    """Page switching for the main container; ``on_switch(page)`` is told the active page."""
+
+    def __init__(self, container, on_switch, budget=2000, bg=None):
+        self.container = container
+        self.on_switch = on_switch
+        self.budget = budget
+        self.bg = bg or container.cget("bg")
+        self.pages = {}      # name -> page frame (insertion order = least recently shown first)
+        self.states = {}     # name -> state the page was built for
+        self.refreshers = {} # name -> [callbacks run when a cached page is shown again]
+        self.weights = {}    # name -> widget count, measured when the page is hidden
+        self.current = SCRATCH
+        self.scratch = self._new_page()
+        self._activate(SCRATCH, self.scratch)
+
+    def _new_page(self):
+        return tk.Frame(self.container, bg=self.bg)
+
+    def _activate(self, name, page):
+        page.place(relx=0, rely=0, relwidth=1, relheight=1)
+        page.lift()
+        self.current = name
+        self.on_switch(page)
+
+    def _leave_current(self):
+        if self.current is SCRATCH:
+            for widget in self.scratch.winfo_children():
+                widget.destroy()
+            self.scratch.place_forget()
+            return
+        page = self.pages.get(self.current)
+        if page is not None:
+            page.place_forget()
+            self.weights[self.current] = count_widgets(page)
+
+    def show_scratch(self):
+        """Switches to the scratch page (emptied) for a screen that is rebuilt every time."""
+        if self.current is not SCRATCH:
+            self._leave_current()
+            self._activate(SCRATCH, self.scratch)
+            self._evict()
+        for widget in self.scratch.winfo_children():
+            widget.destroy()
+
+    def show(self, name, state=None):
+        """Shows screen ``name``. Returns True if a cached page was shown (and refreshed);
+        False if the caller must build the screen into the new, empty page.
+
+        ``state`` is whatever the screen's layout depends on (e.g. the logged-in user);
+        a cached page built for a different state is rebuilt.
+        """
+        if self.budget <= 0:
+            self.show_scratch()
+            return False
+        if name == self.current and self.states.get(name) == state:
+            self._refresh(name)
+            return True
+
+        self._leave_current()
+        page = self.pages.pop(name, None)
+        if page is not None and self.states.get(name) != state:
+            self._drop(name, page)
+            page = None
+
+        cached = page is not None
+        if not cached:
+            page = self._new_page()
+            self.states[name] = state
+            self.refreshers[name] = []
+        self.pages[name] = page  # Re-insert: most recently shown goes last
+        self._activate(name, page)
+        self._evict()
+        if cached:
+            self._refresh(name)
+        return cached
+
+    def on_show(self, callback):
+        """Registers ``callback`` to run whenever the screen being built is shown again."""
+        if self.current is not SCRATCH:
+            self.refreshers.setdefault(self.current, []).append(callback)
+
+    def _refresh(self, name):
+        for callback in self.refreshers.get(name, []):
+            callback()
+
+    def invalidate(self, name):
+        """Forgets a cached screen; it is rebuilt next time (the visible one is kept until left)."""
+        if name == self.current:
+            self.states[name] = object()  # Never equal to a real state
+            return
+        page = self.pages.pop(name, None)
+        if page is not None:
+            self._drop(name, page)
+
+    def _drop(self, name, page):
+        page.destroy()
+        self.states.pop(name, None)
+        self.refreshers.pop(name, None)
+        self.weights.pop(name, None)
+
+    def _evict(self):
+        hidden = [n for n in self.pages if n != self.current]
+        total = sum(self.weights.get(n, 0) for n in hidden)
+        for name in hidden:  # Least recently shown first
+            if total <= self.budget:
+                break
+            total -= self.weights.get(name, 0)
+            self._drop(name, self.pages.pop(name))
@@ -27,6 +27,11 @@ class ScrollableFrame(tk.Frame):
         self.scrollbar.pack(side="right", fill="y")
         
         # Global binding for mousewheel (Windows, Mac, Linux)
+        self._bind_mousewheel()
+        # Screens are kept alive between visits, so take the wheel back when the pointer enters
+        self.bind("<Enter>", lambda e: self._bind_mousewheel(), add="+")
+
+    def _bind_mousewheel(self):
         self.bind_all("<MouseWheel>", self._on_mousewheel)
         self.bind_all("<Button-4>", self._on_mousewheel)
         self.bind_all("<Button-5>", self._on_mousewheel)
@@ -62,3 +67,100 @@ class ScrollableFrame(tk.Frame):
         # Optional: ensure children propagate scroll to canvas
         # But usually bind_all is the culprit for leaks. 
         # By binding to canvas and making it large, we get better performance.
+
+
+class VirtualList(ScrollableFrame):
+    """Fixed-height row list on the ScrollableFrame canvas that only builds the visible rows.
+
+    ``make_row(parent)`` creates one empty row widget; ``fill_row(row, index, item)``
+    puts an item's data into it. Row widgets are recycled while scrolling, so a list
+    of 10,000 items never holds more than a screenful (plus ``overscan``) of rows.
+    """
+
+    def __init__(self, container, make_row, fill_row, row_height, gap=0, overscan=2, *args, **kwargs):
+        super().__init__(container, *args, **kwargs)
+        # Rows sit directly on the canvas instead of inside the inner frame
+        self.canvas.delete(self.window_id)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.bind("<Configure>", self._on_resize)
+
+        self.make_row = make_row
+        self.fill_row = fill_row
+        self.row_height = row_height
+        self.pitch = row_height + gap
+        self.gap = gap
+        self.overscan = overscan
+        self.items = []
+        self._visible = {}  # item index -> (row, canvas window id)
+        self._spare = []    # (row, canvas window id) parked off-screen
+        self._width = 1
+        self._refresh_pending = False
+        self._empty_id = self.canvas.create_text(0, 0, text="", fill="#94a3b8", anchor="n")
+
+    def set_items(self, items, empty_text="", **empty_style):
+        """Replaces the list contents and scrolls back to the top.
+
+        ``empty_text`` (styled with canvas text options such as font/fill) shows when there are no items.
+        """
+        self.items = list(items)
+        # Every row gets refilled
+        for index in list(self._visible):
+            self._spare.append(self._visible.pop(index))
+        for row, window in self._spare:
+            self.canvas.coords(window, 0, -2 * self.pitch)
+        self.canvas.itemconfigure(self._empty_id, text="" if self.items else empty_text, **empty_style)
+        self._update_region()
+        self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def _update_region(self):
+        height = max(1, len(self.items) * self.pitch)
+        self.canvas.configure(scrollregion=(0, 0, self._width, height))
+        self.canvas.coords(self._empty_id, self._width / 2, self.pitch / 2)
+
+    def _on_resize(self, event):
+        self._width = event.width
+        for row, window in list(self._visible.values()) + self._spare:
+            self.canvas.itemconfigure(window, width=event.width)
+        self._update_region()
+        self.refresh()
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # Coalesce the scroll events of one wheel tick / drag into a single refresh
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self.refresh)
+
+    def refresh(self):
+        """Builds, recycles and repositions rows for the current scroll position."""
+        self._refresh_pending = False
+        if not self.canvas.winfo_exists():
+            return
+        top = self.canvas.canvasy(0)
+        bottom = top + max(self.canvas.winfo_height(), self.pitch)
+        first = max(0, int(top // self.pitch) - self.overscan)
+        last = min(len(self.items), int(bottom // self.pitch) + 1 + self.overscan)
+
+        # Park rows that scrolled out of range
+        for index in [i for i in self._visible if i < first or i >= last]:
+            row, window = self._visible.pop(index)
+            self.canvas.coords(window, 0, -2 * self.pitch)
+            self._spare.append((row, window))
+
+        for index in range(first, last):
+            if index in self._visible:
+                continue
+            if self._spare:
+                row, window = self._spare.pop()
+            else:
+                row = self.make_row(self.canvas)
+                window = self.canvas.create_window(0, 0, window=row, anchor="nw",
+                                                   width=self._width, height=self.row_height)
+            self.fill_row(row, index, self.items[index])
+            self.canvas.coords(window, 0, index * self.pitch + self.gap // 2)
+            self._visible[index] = (row, window)
+
+    def update_scroll(self):
+        self._update_region()
+        self.refresh()
@@ -3,8 +3,16 @@ import sqlite3
 import hashlib
 import os
 import datetime
+import json
+import threading
 import time
 
+from dictionary_store import CompiledDictionary, StreamingDictionary
+from session_generator import daily_code, generate_session, session_payload
+from player_stats import COUNTERS as PLAYER_COUNTERS, MAXIMA as PLAYER_MAXIMA
+from telemetry import OUTCOMES, SOLVED, TIMEOUT, REVEALED
+from word_index import WordIndex
+
 app = Flask(__name__)
 DB_FILE = "kelime_oyunu.db"
 
@@ -30,6 +38,45 @@ def init_db():
                         FOREIGN KEY(user_id) REFERENCES users(id)
                     )''')
         
+        # Daily challenges: computed once per day, then served from here
+        c.execute('''CREATE TABLE IF NOT EXISTS daily_challenges (
+                        day TEXT PRIMARY KEY,
+                        payload TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )''')
+        
+        # Per-word solve aggregates, updated from client telemetry batches
+        c.execute('''CREATE TABLE IF NOT EXISTS word_stats (
+                        word TEXT PRIMARY KEY,
+                        level INTEGER,
+                        rounds INTEGER NOT NULL DEFAULT 0,
+                        solves INTEGER NOT NULL DEFAULT 0,
+                        timeouts INTEGER NOT NULL DEFAULT 0,
+                        reveals INTEGER NOT NULL DEFAULT 0,
+                        hints_total INTEGER NOT NULL DEFAULT 0,
+                        solve_ms_total INTEGER NOT NULL DEFAULT 0,
+                        time_fraction_total REAL NOT NULL DEFAULT 0,
+                        updated_at REAL
+                    )''')
+        c.execute("CREATE INDEX IF NOT EXISTS idx_word_stats_level ON word_stats(level)")
+        
+        # Per-player running totals, updated with deltas sent after each game
+        c.execute('''CREATE TABLE IF NOT EXISTS player_stats (
+                        username TEXT PRIMARY KEY,
+                        user_id INTEGER,
+                        games_played INTEGER NOT NULL DEFAULT 0,
+                        total_score INTEGER NOT NULL DEFAULT 0,
+                        best_score INTEGER NOT NULL DEFAULT 0,
+                        rounds INTEGER NOT NULL DEFAULT 0,
+                        words_solved INTEGER NOT NULL DEFAULT 0,
+                        hints_used INTEGER NOT NULL DEFAULT 0,
+                        timeouts INTEGER NOT NULL DEFAULT 0,
+                        reveals INTEGER NOT NULL DEFAULT 0,
+                        solve_ms_total INTEGER NOT NULL DEFAULT 0,
+                        best_streak INTEGER NOT NULL DEFAULT 0,
+                        updated_at REAL
+                    )''')
+        
         # Schema Migration: Add school column if not exists
 
             
@@ -221,6 +268,223 @@ def get_scores():
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_word_index = None
+_daily_cache = {}  # day -> serialized JSON payload
+_daily_lock = threading.Lock()
+
+def get_word_index():
+    global _word_index
+    if _word_index is None:
+        bin_path = os.path.join(BASE_DIR, "sozluk.bin")
+        if os.path.exists(bin_path):
+            dictionary = CompiledDictionary(bin_path)
+        else:
+            dictionary = StreamingDictionary(os.path.join(BASE_DIR, "sozluk.json"))
+        _word_index = WordIndex(dictionary)
+    return _word_index
+
+def get_levels():
+    try:
+        with open(os.path.join(BASE_DIR, "config.json"), "r", encoding="utf-8") as f:
+            return json.load(f).get("game_settings", {}).get("levels") or [4, 5, 6, 7, 8, 9, 10]
+    except Exception:
+        return [4, 5, 6, 7, 8, 9, 10]
+
+def get_daily_payload(day):
+    """Returns the day's challenge as a JSON string, generating and storing it on first request."""
+    cached = _daily_cache.get(day)
+    if cached:
+        return cached
+    with _daily_lock:
+        cached = _daily_cache.get(day)
+        if cached:
+            return cached
+        with sqlite3.connect(DB_FILE) as conn:
+            c = conn.cursor()
+            c.execute("SELECT payload FROM daily_challenges WHERE day = ?", (day,))
+            row = c.fetchone()
+            if row:
+                payload = row[0]
+            else:
+                entries = generate_session(get_word_index(), get_levels(), day)
+                data = session_payload(day, entries)
+                data["success"] = True
+                data["day"] = day
+                payload = json.dumps(data, ensure_ascii=False)
+                c.execute("INSERT OR IGNORE INTO daily_challenges (day, payload) VALUES (?, ?)", (day, payload))
+                conn.commit()
+        _daily_cache.clear()  # Only today's challenge is worth keeping in memory
+        _daily_cache[day] = payload
+        return payload
+
+@app.route('/daily', methods=['GET'])
+def get_daily():
+    now = datetime.datetime.now()
+    day = daily_code(now.date())
+    try:
+        payload = get_daily_payload(day)
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+
+    # Identical for every client until midnight, so let caches in front of us serve it
+    midnight = (now + datetime.timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    response = app.response_class(payload, mimetype="application/json")
+    response.headers["Cache-Control"] = f"public, max-age={int((midnight - now).total_seconds())}"
+    response.headers["ETag"] = f'"{day}"'
+    return response
+
+MAX_TELEMETRY_BATCH = 500
+
+def aggregate_events(events):
+    """Folds a batch of round events into one row of deltas per word."""
+    rows = {}
+    for ev in events:
+        if not isinstance(ev, list) or len(ev) < 6:
+            continue
+        word, level, outcome, hints, time_ms, limit_s = ev[:6]
+        if not isinstance(word, str) or not (0 < len(word) <= 32) or outcome not in OUTCOMES:
+            continue
+        try:
+            level, hints, time_ms, limit_s = int(level), int(hints), int(time_ms), int(limit_s)
+        except (TypeError, ValueError):
+            continue
+        if limit_s <= 0 or not (0 <= hints <= 64) or not (0 <= time_ms <= limit_s * 1000 + 1000):
+            continue
+        word = tr_upper(word)
+        r = rows.get(word)
+        if r is None:
+            r = rows[word] = [word, level, 0, 0, 0, 0, 0, 0, 0.0]
+        r[2] += 1
+        r[3] += outcome == SOLVED
+        r[4] += outcome == TIMEOUT
+        r[5] += outcome == REVEALED
+        r[6] += hints
+        if outcome == SOLVED:
+            r[7] += time_ms
+        r[8] += min(1.0, time_ms / (limit_s * 1000))
+    return list(rows.values())
+
+@app.route('/telemetry', methods=['POST'])
+def ingest_telemetry():
+    data = request.json or {}
+    events = data.get('events')
+    if not isinstance(events, list) or not events:
+        return jsonify({"success": False, "message": "Eksik veri"}), 400
+    if len(events) > MAX_TELEMETRY_BATCH:
+        return jsonify({"success": False, "message": "Çok fazla kayıt"}), 413
+
+    rows = aggregate_events(events)
+    now = time.time()
+    try:
+        with sqlite3.connect(DB_FILE) as conn:
+            # One upsert per word in the batch, all in a single statement/transaction
+            conn.executemany('''INSERT INTO word_stats (word, level, rounds, solves, timeouts, reveals,
+                                                       hints_total, solve_ms_total, time_fraction_total, updated_at)
+                                  VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                  ON CONFLICT(word) DO UPDATE SET
+                                      level = excluded.level,
+                                      rounds = rounds + excluded.rounds,
+                                      solves = solves + excluded.solves,
+                                      timeouts = timeouts + excluded.timeouts,
+                                      reveals = reveals + excluded.reveals,
+                                      hints_total = hints_total + excluded.hints_total,
+                                      solve_ms_total = solve_ms_total + excluded.solve_ms_total,
+                                      time_fraction_total = time_fraction_total + excluded.time_fraction_total,
+                                      updated_at = excluded.updated_at''',
+                             [r + [now] for r in rows])
+            conn.commit()
+        return jsonify({"success": True, "accepted": sum(r[2] for r in rows), "words": len(rows)})
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+
+@app.route('/telemetry/words', methods=['GET'])
+def get_word_stats():
+    """Per-word aggregates for curation. ?format=stats returns the word_stats.json
+    layout that build_sozluk.py --stats reads."""
+    order = request.args.get('order', 'hardest')  # hardest, easiest, most_played
+    # type=int falls back to the default for values that are not numbers
+    min_rounds = max(1, request.args.get('min_rounds', 1, type=int))
+    limit = min(max(1, request.args.get('limit', 100, type=int)), 1000)
+    level = request.args.get('level', type=int)
+    order_by = {
+        "hardest": "CAST(solves AS REAL) / rounds ASC, rounds DESC",
+        "easiest": "CAST(solves AS REAL) / rounds DESC, rounds DESC",
+        "most_played": "rounds DESC",
+    }.get(order, "rounds DESC")
+
+    query = "SELECT * FROM word_stats WHERE rounds >= ?"
+    params = [min_rounds]
+    if level:
+        query += " AND level = ?"
+        params.append(level)
+    if request.args.get('format') != 'stats':
+        query += f" ORDER BY {order_by} LIMIT ?"
+        params.append(limit)
+    try:
+        with sqlite3.connect(DB_FILE) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query, params).fetchall()
+        if request.args.get('format') == 'stats':
+            return jsonify({r["word"]: [r["rounds"], r["solves"], round(r["time_fraction_total"], 4)] for r in rows})
+        words = []
+        for r in rows:
+            words.append({
+                "word": r["word"],
+                "level": r["level"],
+                "rounds": r["rounds"],
+                "solve_rate": round(r["solves"] / r["rounds"], 3),
+                "timeout_rate": round(r["timeouts"] / r["rounds"], 3),
+                "reveal_rate": round(r["reveals"] / r["rounds"], 3),
+                "avg_hints": round(r["hints_total"] / r["rounds"], 2),
+                "avg_solve_ms": round(r["solve_ms_total"] / r["solves"]) if r["solves"] else None,
+            })
+        return jsonify({"success": True, "words": words})
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+
+@app.route('/players/stats', methods=['POST'])
+def update_player_stats():
+    """Adds one game's counter deltas to the player's totals (O(1) upsert)."""
+    data = request.json or {}
+    username = data.get('username')
+    delta = data.get('stats')
+    if not username or not isinstance(delta, dict):
+        return jsonify({"success": False, "message": "Eksik veri"}), 400
+    try:
+        values = [max(0, int(delta.get(f, 0))) for f in PLAYER_COUNTERS + PLAYER_MAXIMA]
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "message": "Geçersiz veri"}), 400
+
+    columns = PLAYER_COUNTERS + PLAYER_MAXIMA
+    updates = [f"{f} = {f} + excluded.{f}" for f in PLAYER_COUNTERS] + \
+              [f"{f} = MAX({f}, excluded.{f})" for f in PLAYER_MAXIMA]
+    try:
+        with sqlite3.connect(DB_FILE) as conn:
+            conn.execute(f'''INSERT INTO player_stats (username, user_id, {", ".join(columns)}, updated_at)
+                             VALUES (?, ?, {", ".join("?" * len(columns))}, ?)
+                             ON CONFLICT(username) DO UPDATE SET
+                                 user_id = COALESCE(excluded.user_id, user_id),
+                                 {", ".join(updates)},
+                                 updated_at = excluded.updated_at''',
+                         [username, data.get('user_id')] + values + [time.time()])
+            conn.commit()
+        return jsonify({"success": True})
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+
+@app.route('/players/<username>/stats', methods=['GET'])
+def get_player_stats(username):
+    with sqlite3.connect(DB_FILE) as conn:
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM player_stats WHERE username = ?", (username,)).fetchone()
+    if not row:
+        return jsonify({"success": False, "message": "Kayıt bulunamadı"}), 404
+    stats = dict(row)
+    stats["success_rate"] = round(100 * stats["words_solved"] / stats["rounds"]) if stats["rounds"] else 0
+    stats["average_solve_s"] = round(stats["solve_ms_total"] / stats["words_solved"] / 1000, 1) if stats["words_solved"] else 0
+    return jsonify({"success": True, "stats": stats})
+
 @app.route('/admin/users', methods=['GET'])
 def get_all_users():
     try:
@@ -0,0 +1,59 @@
+"""Deterministic game sessions for daily challenges and shared codes.
+
+A session is one word per level, picked with a ``random.Random`` seeded from
+a code (the date for the daily challenge, or any text players share). Words
+are picked by position in each level's ``LevelIndex``, which orders entries
+by their folded form, so every client with the same dictionary gets the same
+words regardless of how its dictionary file happens to be ordered.
+"""
+import hashlib
+import random
+import re
+from datetime import date
+
+from dictionary_store import WordEntry, tr_upper
+
+
+def daily_code(day=None):
+    """Challenge code for a calendar day, e.g. '2026-10-19'."""
+    return (day or date.today()).isoformat()
+
+
+def normalise_code(code):
+    """Uppercases and strips everything except letters, digits and dashes."""
+    return re.sub(r"[^0-9A-ZÇĞİÖŞÜ-]", "", tr_upper(code.strip()))
+
+
+def seed_from_code(code):
+    digest = hashlib.sha256(normalise_code(code).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def generate_session(word_index, levels, code):
+    """Returns one entry per level (None for empty levels) for ``code``."""
+    rng = random.Random(seed_from_code(code))
+    words = []
+    for level in levels:
+        index = word_index.level(f"{level}_harf")
+        words.append(index[rng.randrange(len(index))] if len(index) else None)
+    return words
+
+
+def session_payload(code, entries):
+    """JSON-ready form of a session, as served by the /daily endpoint."""
+    return {
+        "code": normalise_code(code),
+        "seed": seed_from_code(code),
+        "words": [
+            {"kelime": e.canonical, "tanim": e.definition} if e is not None else None
+            for e in entries
+        ],
+    }
+
+
+def entries_from_payload(payload):
+    """Rebuilds the session word list from a payload returned by the server."""
+    return [
+        WordEntry(w["kelime"], w.get("tanim", "")) if isinstance(w, dict) and w.get("kelime") else None
+        for w in payload.get("words", [])
+    ]
@@ -0,0 +1,77 @@
+"""Startup phase timing for ``--profile-startup``.
+
+``main.py`` marks the end of each startup phase: imports, config, Tk, window
+setup, local data, entry screen and first frame, and then every step of the
+background warm-up that runs once the entry screen is visible. Marks only
+record a timestamp. With ``--profile-startup`` on the command line, each mark
+is also printed (and flushed) as it happens:
+
+    [STARTUP] imports               41.2 ms   (total    41.2 ms)
+    [STARTUP] config                 3.1 ms   (total    44.3 ms)
+    ...
+    [STARTUP] warm-up done           0.4 ms   (total   612.9 ms)
+
+``benchmark.py startup`` reads these lines from outside the process, so it
+also sees the time before ``t0`` (interpreter start, PyInstaller unpacking).
+The windowed build has no stdout, so the harness sets ``KELIME_STARTUP_LOG``
+and the lines are appended to that file instead. With
+``--exit-after-startup`` the game closes itself after the warm-up.
+"""
+import os
+import sys
+import time
+
+FLAG = "--profile-startup"
+EXIT_FLAG = "--exit-after-startup"
+LOG_ENV = "KELIME_STARTUP_LOG"
+PREFIX = "[STARTUP]"
+FIRST_FRAME = "first frame"
+READY = "warm-up done"
+
+
+class StartupProfile:
+    """Phase durations measured from ``t0`` (a ``time.perf_counter()`` value)."""
+
+    def __init__(self, t0=None, enabled=None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.log_path = os.environ.get(LOG_ENV)
+        self.enabled = (FLAG in sys.argv or bool(self.log_path)) if enabled is None else enabled
+        self.exit_when_ready = EXIT_FLAG in sys.argv
+        self.phases = []  # (name, duration s, since t0 s)
+        self._last = self.t0
+
+    def mark(self, phase):
+        """Ends ``phase`` now; its duration is the time since the previous mark."""
+        now = time.perf_counter()
+        duration, since = now - self._last, now - self.t0
+        self.phases.append((phase, duration, since))
+        self._last = now
+        if not self.enabled:
+            return
+        line = f"{PREFIX} {phase:<20}{duration * 1000:>8.1f} ms   (total {since * 1000:>8.1f} ms)"
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError:
+                pass
+        else:
+            print(line, flush=True)
+
+    def total(self, phase):
+        """Seconds from ``t0`` to the end of ``phase``, or None if it was not reached."""
+        for name, _, since in self.phases:
+            if name == phase:
+                return since
+        return None
+
+
+def parse_line(line):
+    """``(phase, total_ms)`` from a printed mark, or None for any other output."""
+    if not line.startswith(PREFIX) or "(total" not in line:
+        return None
+    body, _, total = line[len(PREFIX):].rpartition("(total")
+    try:
+        return body.rsplit(None, 2)[0].strip(), float(total.strip(" )\n").split()[0])
+    except (IndexError, ValueError):
+        return None
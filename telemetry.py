@@ -0,0 +1,110 @@
+"""Per-round solve telemetry, batched on the client.
+
+Each finished round becomes one compact event list:
+
+    [word, level, outcome, hints, time_ms, limit_s, timestamp]
+
+where outcome is one of OUTCOMES. Events are queued in memory, mirrored to a
+small JSON file after every event and every send so nothing is lost if the
+game closes (or crashes) before a send, and posted to the server's
+/telemetry endpoint in batches from a worker thread. While offline only the
+newest MAX_QUEUE events are kept.
+"""
+import json
+import os
+import threading
+import time
+
+SOLVED = "s"
+TIMEOUT = "t"
+REVEALED = "r"  # every letter opened with hints
+OUTCOMES = (SOLVED, TIMEOUT, REVEALED)
+
+MAX_QUEUE = 1000  # oldest events are dropped beyond this while offline
+
+
+def make_event(word, level, outcome, hints, time_ms, limit_s):
+    return [word, int(level), outcome, int(hints), int(time_ms), int(limit_s), int(time.time())]
+
+
+class TelemetryBatcher:
+    """Queues round events and sends them with ``send(events) -> bool``."""
+
+    def __init__(self, send, queue_path=None, batch_size=20):
+        self.send = send
+        self.queue_path = queue_path
+        self.batch_size = batch_size
+        self._events = []
+        self._head = 0  # sequence number of _events[0], so a send can tell what was trimmed meanwhile
+        self._lock = threading.Lock()
+        self._sending = False
+        if queue_path and os.path.exists(queue_path):
+            try:
+                with open(queue_path, "r", encoding="utf-8") as f:
+                    events = json.load(f)
+                if isinstance(events, list):
+                    self._events = events[-MAX_QUEUE:]
+            except Exception as e:
+                print(f"[TELEMETRY] Could not read queued events: {e}")
+
+    def add(self, event):
+        with self._lock:
+            self._events.append(event)
+            self._drop(len(self._events) - MAX_QUEUE)
+            full = len(self._events) >= self.batch_size
+        if full:
+            self.flush()  # Saves once the send is done
+        else:
+            self.save()
+
+    def _drop(self, count):
+        # Caller holds the lock
+        if count > 0:
+            del self._events[:count]
+            self._head += count
+
+    def flush(self):
+        """Sends queued events on a background thread (no-op if a send is running)."""
+        with self._lock:
+            if self._sending or not self._events:
+                return
+            self._sending = True
+        threading.Thread(target=self._send_all, daemon=True).start()
+
+    def _send_all(self):
+        try:
+            while True:
+                with self._lock:
+                    batch = self._events[:self.batch_size * 5]
+                    sent_end = self._head + len(batch)
+                if not batch:
+                    break
+                if not self.send(batch):
+                    break  # Server unreachable; keep the events for next time
+                with self._lock:
+                    # add() may have trimmed some of the batch already while it was in flight
+                    self._drop(sent_end - self._head)
+        except Exception as e:
+            print(f"[TELEMETRY] Send failed: {e}")
+        finally:
+            with self._lock:
+                self._sending = False
+            self.save()
+
+    def save(self):
+        """Writes unsent events to ``queue_path``."""
+        if not self.queue_path:
+            return
+        with self._lock:
+            events = list(self._events)
+        try:
+            if not events:
+                if os.path.exists(self.queue_path):
+                    os.remove(self.queue_path)
+                return
+            tmp_path = self.queue_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(events, f, ensure_ascii=False)
+            os.replace(tmp_path, self.queue_path)
+        except Exception as e:
+            print(f"[TELEMETRY] Could not save queued events: {e}")
@@ -0,0 +1,151 @@
+"""Stopwatch and Countdown against a fake monotonic clock and scheduler."""
+import unittest
+
+from game_timer import Countdown, Stopwatch
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeScheduler:
+    """Stands in for ``root.after``/``root.after_cancel``; ``advance`` runs due callbacks."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.jobs = {}  # job id -> (due time, fn)
+        self._next_id = 0
+
+    def schedule(self, ms, fn):
+        self._next_id += 1
+        self.jobs[self._next_id] = (self.clock.now + ms / 1000, fn)
+        return self._next_id
+
+    def cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def advance(self, seconds, lateness=0.0):
+        """Moves the clock forward, running each callback ``lateness`` s after it was due."""
+        end = self.clock.now + seconds
+        while True:
+            due = [(t, job) for job, (t, _) in self.jobs.items() if t + lateness <= end]
+            if not due:
+                break
+            t, job = min(due)
+            _, fn = self.jobs.pop(job)
+            self.clock.now = max(self.clock.now, t + lateness)
+            fn()
+        self.clock.now = end
+
+
+class StopwatchTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.watch = Stopwatch(self.clock)
+
+    def test_elapsed_excludes_pauses(self):
+        self.watch.start()
+        self.clock.now += 3
+        self.watch.pause()
+        self.clock.now += 10
+        self.assertFalse(self.watch.running)
+        self.assertAlmostEqual(self.watch.elapsed, 3)
+        self.watch.resume()
+        self.clock.now += 2
+        self.assertAlmostEqual(self.watch.elapsed, 5)
+
+    def test_stop_freezes_and_cannot_resume(self):
+        self.watch.start()
+        self.clock.now += 4
+        self.watch.stop()
+        self.watch.resume()
+        self.clock.now += 4
+        self.assertFalse(self.watch.running)
+        self.assertAlmostEqual(self.watch.elapsed, 4)
+
+    def test_start_resets(self):
+        self.watch.start()
+        self.clock.now += 4
+        self.watch.start()
+        self.clock.now += 1
+        self.assertAlmostEqual(self.watch.elapsed, 1)
+
+    def test_resume_before_start_does_nothing(self):
+        self.watch.resume()
+        self.assertFalse(self.watch.running)
+        self.assertEqual(self.watch.elapsed, 0)
+
+
+class CountdownTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = FakeScheduler(self.clock)
+        self.ticks = []
+        self.expired = 0
+        self.countdown = Countdown(self.scheduler.schedule, self.scheduler.cancel,
+                                   self.ticks.append, self._expire, clock=self.clock)
+
+    def _expire(self):
+        self.expired += 1
+
+    def test_ticks_every_second_then_expires(self):
+        self.countdown.start(3)
+        self.scheduler.advance(5)
+        self.assertEqual(self.ticks, [3, 2, 1, 0])
+        self.assertEqual(self.expired, 1)
+        self.assertEqual(self.countdown.remaining, 0)
+        self.assertEqual(self.countdown.elapsed, 3)
+        self.assertFalse(self.scheduler.jobs)
+
+    def test_late_callbacks_do_not_stretch_the_round(self):
+        self.countdown.start(10)
+        self.scheduler.advance(9.9, lateness=0.4)
+        self.assertEqual(self.expired, 0)
+        # Every tick ran 0.4 s late; a per-tick decrement would end near 14 s, this ends at 10.4 s
+        self.scheduler.advance(0.6, lateness=0.4)
+        self.assertEqual(self.expired, 1)
+        self.assertEqual(self.ticks, [10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0])
+
+    def test_pause_stops_time_and_resume_continues(self):
+        self.countdown.start(5)
+        self.scheduler.advance(2)
+        self.countdown.pause()
+        self.assertFalse(self.countdown.running)
+        self.assertFalse(self.scheduler.jobs)
+        self.scheduler.advance(30)
+        self.assertEqual(self.expired, 0)
+        self.assertAlmostEqual(self.countdown.remaining, 3)
+
+        self.countdown.resume()
+        self.assertTrue(self.countdown.running)
+        self.scheduler.advance(2.5)
+        self.assertEqual(self.expired, 0)
+        self.scheduler.advance(0.6)
+        self.assertEqual(self.expired, 1)
+        self.assertEqual(self.ticks, [5, 4, 3, 3, 2, 1, 0])
+
+    def test_stop_cancels_expiry(self):
+        self.countdown.start(3)
+        self.scheduler.advance(1.5)
+        self.countdown.stop()
+        self.scheduler.advance(10)
+        self.assertEqual(self.expired, 0)
+        self.assertAlmostEqual(self.countdown.elapsed, 1.5)
+        self.countdown.resume()  # A stopped round stays stopped
+        self.assertFalse(self.countdown.running)
+
+    def test_restart_replaces_the_pending_tick(self):
+        self.countdown.start(3)
+        self.scheduler.advance(1)
+        self.countdown.start(2)
+        self.assertEqual(len(self.scheduler.jobs), 1)
+        self.scheduler.advance(3)
+        self.assertEqual(self.expired, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
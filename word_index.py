@@ -0,0 +1,106 @@
+"""Per-level lookup index for hints and answer validation.
+
+For every level the index keeps:
+  * the level's folded words in sorted order, which serves as the prefix
+    index (a prefix query is one bisect, O(log n) per keystroke), and
+  * an anagram map from the word's sorted letters to its entries, used for
+    the scrambled-letters hint and for accepting alternate answers.
+
+Levels are built the first time they are requested (or warmed up on a
+background thread) from the ``WordEntry`` lists the dictionary loaders return.
+"""
+import random
+import threading
+from bisect import bisect_left
+
+from dictionary_store import fold_turkish
+
+
+def letter_key(folded):
+    """Anagram key: the folded word's letters in sorted order."""
+    return "".join(sorted(folded))
+
+
+class LevelIndex:
+    """Prefix and anagram lookups for one level's words."""
+
+    def __init__(self, entries):
+        # Sorted by folded form so the order is the same whatever file order the level came in
+        self._entries = sorted(entries, key=lambda e: (e.folded, e.canonical))
+        self._words = [e.folded for e in self._entries]
+        self._anagrams = {}
+        for e in entries:
+            self._anagrams.setdefault(letter_key(e.folded), []).append(e)
+
+    def __len__(self):
+        return len(self._words)
+
+    def __getitem__(self, i):
+        """Entry at position ``i`` in folded-word order."""
+        return self._entries[i]
+
+    def has_prefix(self, prefix):
+        """True if any word in the level starts with ``prefix`` (already folded)."""
+        words = self._words
+        i = bisect_left(words, prefix)
+        return i < len(words) and words[i].startswith(prefix)
+
+    def is_word(self, folded):
+        words = self._words
+        i = bisect_left(words, folded)
+        return i < len(words) and words[i] == folded
+
+    def anagrams(self, entry):
+        """Other entries spelled with exactly the same letters."""
+        return [e for e in self._anagrams.get(letter_key(entry.folded), ()) if e is not entry]
+
+    def scramble(self, entry, rng=random):
+        """Returns the word's letters shuffled so they spell neither it nor any anagram in the level."""
+        letters = list(entry.canonical)
+        taken = {e.canonical for e in self._anagrams.get(letter_key(entry.folded), ())}
+        taken.add(entry.canonical)
+        # Words like "AAAA" cannot be scrambled; a few tries is plenty otherwise
+        for _ in range(10):
+            rng.shuffle(letters)
+            if "".join(letters) not in taken:
+                break
+        return "".join(letters)
+
+    def fits_pattern(self, folded, slots):
+        """True if ``folded`` is a level word agreeing with every revealed slot ("_" = hidden).
+
+        At least one slot must be revealed: with none, any word of the length would fit.
+        """
+        if len(folded) != len(slots) or all(slot == "_" for slot in slots) or not self.is_word(folded):
+            return False
+        for ch, slot in zip(folded, slots):
+            if slot != "_" and fold_turkish(slot) != ch:
+                return False
+        return True
+
+
+class WordIndex:
+    """Lazily built ``LevelIndex`` per level of a loaded dictionary."""
+
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        self._levels = {}
+        self._lock = threading.Lock()
+
+    def level(self, key):
+        index = self._levels.get(key)
+        if index is not None:
+            return index
+        with self._lock:
+            index = self._levels.get(key)
+            if index is None:
+                index = self._levels[key] = LevelIndex(self.dictionary.get(key, []))
+        return index
+
+    def is_ready(self, key):
+        return key in self._levels
+
+    def warm(self, key):
+        """Builds a level's index on a background thread."""
+        if key not in self._levels:
+            threading.Thread(target=self.level, args=(key,), daemon=True).start()
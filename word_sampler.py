@@ -0,0 +1,166 @@
+"""No-repeat word sampling per level.
+
+Each level gets a deck driven by an incremental Fisher–Yates shuffle: a draw
+swaps a random remaining index into the cursor slot, so every word comes up
+once before any word repeats and each draw is O(1). When the deck runs out it
+is reshuffled. The adaptive selector picks words itself (by difficulty) and
+uses ``is_used``/``take`` to stay on the same deck, so both modes share one
+no-repeat history.
+
+A deck is persisted as its size plus a bitmap of the indices drawn so far;
+restoring moves those to the front of the deck. Decks saved as (size, seed,
+cursor) by earlier versions are restored by replaying the cursor's swaps.
+"""
+import base64
+import json
+import os
+import random
+from array import array
+
+
+class WordDeck:
+    """Shuffled deck of indices ``0..size-1`` with a draw cursor."""
+
+    def __init__(self, size, seed=None, cursor=0, used=None):
+        self.size = size
+        self.cursor = 0
+        self._rng = random.Random(seed)
+        self._order = array("I", range(size))  # Slots [0, cursor) hold the drawn indices
+        self._slot = array("I", range(size))  # index -> its slot in _order
+        if used is not None:
+            for idx in used:
+                if 0 <= idx < size and not self.is_used(idx):
+                    self.take(idx)
+        else:
+            # Replay earlier draws so the remaining order matches the saved deck
+            for _ in range(min(cursor, size)):
+                self._step()
+
+    def _swap(self, i, j):
+        order, slot = self._order, self._slot
+        order[i], order[j] = order[j], order[i]
+        slot[order[i]], slot[order[j]] = i, j
+
+    def _step(self):
+        i = self.cursor
+        self._swap(i, self._rng.randrange(i, self.size))
+        self.cursor = i + 1
+        return self._order[i]
+
+    def reshuffle(self):
+        """Puts every index back (all words become unused again)."""
+        self._order = array("I", range(self.size))
+        self._slot = array("I", range(self.size))
+        self.cursor = 0
+
+    def draw(self):
+        """Returns the next unused index, reshuffling when the deck is exhausted."""
+        if self.size == 0:
+            return None
+        if self.cursor >= self.size:
+            self.reshuffle()
+        return self._step()
+
+    def is_used(self, idx):
+        return self._slot[idx] < self.cursor
+
+    def take(self, idx):
+        """Draws a specific unused ``idx`` (chosen by the caller) in O(1)."""
+        self._swap(self.cursor, self._slot[idx])
+        self.cursor += 1
+        return idx
+
+    @property
+    def remaining(self):
+        return self.size - self.cursor
+
+    def to_state(self):
+        bits = bytearray((self.size + 7) // 8)
+        for idx in self._order[:self.cursor]:
+            bits[idx >> 3] |= 1 << (idx & 7)
+        return {"size": self.size, "used": base64.b64encode(bytes(bits)).decode("ascii")}
+
+    @classmethod
+    def from_state(cls, state):
+        size = state["size"]
+        if "used" not in state:
+            return cls(size, state.get("seed"), state.get("cursor", 0))
+        bits = base64.b64decode(state["used"])
+        used = [i for i in range(min(size, len(bits) * 8)) if bits[i >> 3] >> (i & 7) & 1]
+        return cls(size, used=used)
+
+
+class WordSampler:
+    """Per-level decks, optionally persisted so repeats are avoided across games."""
+
+    def __init__(self, state_path=None):
+        self.state_path = state_path
+        self._decks = {}
+        self._saved_state = {}
+        self._dirty = False
+        if state_path:
+            self._saved_state = self._read_state(state_path)
+
+    @staticmethod
+    def _read_state(path):
+        try:
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+                if isinstance(state, dict):
+                    return state
+        except Exception as e:
+            print(f"[SAMPLER] Could not read deck state: {e}")
+        return {}
+
+    def deck(self, level_key, size):
+        """The level's deck over a word list of ``size``; callers are expected to draw from it."""
+        self._dirty = True
+        deck = self._decks.get(level_key)
+        if deck is not None and deck.size == size:
+            return deck
+
+        saved = self._saved_state.pop(level_key, None)
+        deck = None
+        if saved and saved.get("size") == size:
+            try:
+                deck = WordDeck.from_state(saved)
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"[SAMPLER] Ignoring saved deck for {level_key}: {e}")
+        if deck is None:
+            # New level or the word list changed size: start a fresh deck
+            deck = WordDeck(size)
+        self._decks[level_key] = deck
+        return deck
+
+    def draw(self, level_key, words):
+        """Returns the next unused entry from ``words`` (the level's list), or None if empty."""
+        if not words:
+            return None
+        return words[self.deck(level_key, len(words)).draw()]
+
+    def reset(self, level_key=None):
+        """Forgets drawn words for one level, or for all levels."""
+        if level_key is None:
+            self._decks.clear()
+            self._saved_state.clear()
+        else:
+            self._decks.pop(level_key, None)
+            self._saved_state.pop(level_key, None)
+        self._dirty = True
+
+    def save(self):
+        """Writes deck positions to ``state_path`` (if persistence is enabled)."""
+        if not self.state_path or not self._dirty:
+            return
+        state = dict(self._saved_state)
+        for key, deck in self._decks.items():
+            state[key] = deck.to_state()
+        try:
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+            self._dirty = False
+        except Exception as e:
+            print(f"[SAMPLER] Could not save deck state: {e}")